@@ -10,7 +10,6 @@ from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers import entity_registry as er
 import homeassistant.helpers.config_validation as cv
 from homeassistant.components.binary_sensor import (
-    DOMAIN as BINARY_SENSOR_DOMAIN,
     BinarySensorDeviceClass,
     BinarySensorEntity,
     BinarySensorEntityDescription,
@@ -118,21 +117,6 @@ async def async_setup_entry(
     # Setup for each binary sensor from domintell resource
     register_items(controller.motion)
 
-    # Check for entities that no longer exist and remove them
-    entity_reg = er.async_get(hass)
-    reg_entities = er.async_entries_for_config_entry(entity_reg, config_entry.entry_id)
-
-    for entity in reg_entities:
-        if entity.domain != BINARY_SENSOR_DOMAIN:
-            continue
-
-        part = entity.unique_id.split("_")
-        if len(part) >= 3:
-            endpoint_id = part[2]
-
-            if endpoint_id not in controller.motion.keys():
-                entity_reg.async_remove(entity.entity_id)
-
 
 class DomintellBinarySensor(BinarySensorEntity):
     """Representation of a Domintell binary sensor."""
@@ -183,7 +167,7 @@ class DomintellBinarySensor(BinarySensorEntity):
             return
 
         if event_type == EventType.RESOURCE_UPDATED:
-            self.async_write_ha_state()
+            self._bridge.state_writer.async_schedule(self)
 
     async def async_added_to_hass(self) -> None:
         """Call when entity is added."""
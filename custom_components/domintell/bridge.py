@@ -8,6 +8,7 @@ import logging
 
 from homeassistant.core import callback, Event
 from homeassistant import core
+from homeassistant.helpers.entity import Entity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, CONF_USERNAME, CONF_PASSWORD
 from homeassistant.exceptions import (
@@ -15,12 +16,62 @@ from homeassistant.exceptions import (
     ConfigEntryNotReady,
 )
 
-from .const import DOMAIN, PLATFORMS
+from .const import (
+    DOMAIN,
+    PLATFORMS,
+    STATE_WRITE_TICK,
+    CONF_SENSOR_MIN_INTERVAL,
+    CONF_SENSOR_DEADBAND,
+    CONF_SENSOR_DEADBAND_PERCENT,
+    CONF_ELECTRICITY_WINDOW,
+    CONF_HISTORY_DEPTH,
+    CONF_HUB_PORT,
+)
 from .device import async_setup_devices
 from .dom_event import async_setup_domintell_events
+from .registry import async_cleanup_entities
 from .domintell_api import DomintellGateway, InvalidCredentials, UserDatabaseEmpty
 
 
+class StateWriteScheduler:
+    """Coalesce the state writes of entities.
+
+    Entities are marked dirty on update and each one is written once per tick,
+    whatever the number of updates it received meanwhile.
+    """
+
+    def __init__(self, hass: core.HomeAssistant, tick: float = STATE_WRITE_TICK):
+        self.hass = hass
+        self._tick = tick
+        self._dirty: dict[Entity, None] = {}
+        self._flush_handle: asyncio.TimerHandle | None = None
+
+    @callback
+    def async_schedule(self, entity: Entity) -> None:
+        """Mark an entity to be written at the next tick."""
+        self._dirty[entity] = None
+        if self._flush_handle is None:
+            self._flush_handle = self.hass.loop.call_later(self._tick, self._flush)
+
+    @callback
+    def _flush(self) -> None:
+        self._flush_handle = None
+        dirty = self._dirty
+        self._dirty = {}
+        for entity in dirty:
+            # Entities removed in the meantime ignore the write
+            if entity.hass is not None:
+                entity.async_write_ha_state()
+
+    @callback
+    def async_cancel(self) -> None:
+        """Drop the pending writes."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        self._dirty.clear()
+
+
 class DomintellBridge:
     """Manages a single domintell bridge."""
 
@@ -32,10 +83,25 @@ class DomintellBridge:
         # Jobs to be executed when API is reset.
         self.reset_jobs: list[core.CALLBACK_TYPE] = []
         self.logger = logging.getLogger(__name__)
+        # Coalesce entities state writes during bursts of updates
+        self.state_writer = StateWriteScheduler(hass)
         # Store actual api connection to bridge as api
         username: str = self.config_entry.data[CONF_USERNAME]
         password: str = self.config_entry.data[CONF_PASSWORD]
         self.api = DomintellGateway(self.host, username, password)
+        # Throttle high-rate measurement sensors as configured in options
+        options = self.config_entry.options
+        self.api.sensors.set_filter(
+            min_interval=options.get(CONF_SENSOR_MIN_INTERVAL, 0),
+            deadband=options.get(CONF_SENSOR_DEADBAND, 0),
+            deadband_percent=options.get(CONF_SENSOR_DEADBAND_PERCENT, 0),
+        )
+        # Rolling aggregates of the electricity meters (0 = disabled)
+        self.api.sensors.electricity.set_aggregation(
+            options.get(CONF_ELECTRICITY_WINDOW, 0)
+        )
+        # Per-IO state history depth by target type (empty = disabled)
+        self.api.events.set_history_depth(options.get(CONF_HISTORY_DEPTH, {}))
         self._bridge_id = ""
         # Store (this) bridge object in hass data
         hass.data.setdefault(DOMAIN, {})[self.config_entry.entry_id] = self
@@ -79,11 +145,22 @@ class DomintellBridge:
             if not setup_ok:
                 await self.api.close()
 
+        # Share the gateway session with local clients (0 = disabled)
+        hub_port = self.config_entry.options.get(CONF_HUB_PORT, 0)
+        if hub_port:
+            try:
+                await self.api.start_hub(hub_port)
+            except OSError as ex:
+                self.logger.error(
+                    f"Unable to start the local hub on port {hub_port}: {ex}"
+                )
+
         await async_setup_devices(self)
         await async_setup_domintell_events(self)
         await self.hass.config_entries.async_forward_entry_setups(
             self.config_entry, PLATFORMS
         )
+        async_cleanup_entities(self)
 
         # Add listener for config entry updates.
         self.reset_jobs.append(self.config_entry.add_update_listener(_update_listener))
@@ -111,6 +188,7 @@ class DomintellBridge:
             return True
 
         await self.api.close()
+        self.state_writer.async_cancel()
 
         while self.reset_jobs:
             self.reset_jobs.pop()()
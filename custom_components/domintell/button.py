@@ -7,7 +7,6 @@ from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers import entity_registry as er
 import homeassistant.helpers.config_validation as cv
 from homeassistant.components.button import (
-    DOMAIN as BUTTON_DOMAIN,
     ButtonEntity,
     ButtonDeviceClass,
 )
@@ -49,21 +48,6 @@ async def async_setup_entry(
         controller.subscribe(async_add_entity, event_filter=EventType.RESOURCE_ADDED)
     )
 
-    # Check for entities that no longer exist and remove them
-    entity_reg = er.async_get(hass)
-    reg_entities = er.async_entries_for_config_entry(entity_reg, config_entry.entry_id)
-
-    for entity in reg_entities:
-        if entity.domain != BUTTON_DOMAIN:
-            continue
-
-        part = entity.unique_id.split("_")
-        if len(part) >= 3:
-            endpoint_id = part[2]
-
-            if endpoint_id not in controller.keys():
-                entity_reg.async_remove(entity.entity_id)
-
 
 class DomintellMomentarySwitch(ButtonEntity):
     """Representation of a Domintell Button."""
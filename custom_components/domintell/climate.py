@@ -12,7 +12,6 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.components.climate import (
-    DOMAIN as CLIMATE_DOMAIN,
     ClimateEntity,
     ClimateEntityFeature,
     HVACAction,
@@ -84,21 +83,6 @@ async def async_setup_entry(
         controller.subscribe(async_add_entity, event_filter=EventType.RESOURCE_ADDED)
     )
 
-    # Check for entities that no longer exist and remove them
-    entity_reg = er.async_get(hass)
-    reg_entities = er.async_entries_for_config_entry(entity_reg, config_entry.entry_id)
-
-    for entity in reg_entities:
-        if entity.domain != CLIMATE_DOMAIN:
-            continue
-
-        part = entity.unique_id.split("_")
-        if len(part) >= 3:
-            endpoint_id = part[2]
-
-            if endpoint_id not in controller.keys():
-                entity_reg.async_remove(entity.entity_id)
-
 
 class DomintellThermostat(ClimateEntity):
     """Representation of a Domintell Thermostat."""
@@ -348,7 +332,7 @@ class DomintellThermostat(ClimateEntity):
             return
 
         if event_type == EventType.RESOURCE_UPDATED:
-            self.async_write_ha_state()
+            self._bridge.state_writer.async_schedule(self)
 
     async def async_added_to_hass(self) -> None:
         """Call when entity is added."""
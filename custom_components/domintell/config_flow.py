@@ -1,6 +1,7 @@
 """Config flow to configure Domintell."""
 
 from __future__ import annotations
+import asyncio
 import voluptuous as vol
 import re
 from typing import Any
@@ -16,6 +17,7 @@ from homeassistant.config_entries import (
     ConfigFlowResult,
     OptionsFlow,
 )
+from homeassistant.core import callback
 from homeassistant.data_entry_flow import AbortFlow
 from homeassistant.const import (
     CONF_IP_ADDRESS,
@@ -26,17 +28,26 @@ from homeassistant.const import (
 from homeassistant.helpers import (
     config_validation as cv,
     device_registry as dr,
+    selector,
 )
 
 
 from .const import (
     CONF_IGNORE_AVAILABILITY,
+    CONF_SENSOR_MIN_INTERVAL,
+    CONF_SENSOR_DEADBAND,
+    CONF_SENSOR_DEADBAND_PERCENT,
+    CONF_ELECTRICITY_WINDOW,
+    CONF_HISTORY_DEPTH,
+    CONF_HUB_PORT,
     DOMAIN,
     BRIDGES_LIST,
     DEFAULT_BRIDGE,
     CONF_MODULE_TYPE,
     CONF_MODULE_SN,
 )
+from .domintell_api.controllers.events import ResourceTypes
+from .domintell_api.probe import DEFAULT_PROBE_TIMEOUT, ProbeCache
 from .domintell_api import (
     DomintellGateway,
     MaxConnectedClient,
@@ -45,6 +56,10 @@ from .domintell_api import (
     InvalidAppinfo,
 )
 
+# Probes shared by the flows, so that concurrent discoveries and a reauth
+# following a setup do not connect again to the same gateway
+_PROBE_CACHE = ProbeCache()
+
 
 def default_schema(user_input):
     return vol.Schema(
@@ -66,6 +81,25 @@ def usr_pass_schema(user_input):
     )
 
 
+def validate_history_depth(value: Any) -> dict[str, int]:
+    """Validate the IO history depth per target type."""
+    if not isinstance(value, Mapping):
+        raise vol.Invalid("invalid_history_depth")
+
+    depths = {}
+    for target_type, depth in value.items():
+        try:
+            target_type = ResourceTypes(target_type).value
+            depth = int(depth)
+        except (ValueError, TypeError) as ex:
+            raise vol.Invalid("invalid_history_depth") from ex
+        if depth < 0:
+            raise vol.Invalid("invalid_history_depth")
+        depths[target_type] = depth
+
+    return depths
+
+
 def select_module_schema(user_input):
     # pylint: disable=unused-argument
     return vol.Schema(
@@ -89,6 +123,12 @@ class DomintellConfigFlow(ConfigFlow, domain=DOMAIN):
         """Initialize the Domintell flow."""
         pass
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: ConfigEntry) -> OptionsFlow:
+        """Get the options flow for this handler."""
+        return DomintellOptionsFlowHandler()
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
@@ -196,7 +236,15 @@ class DomintellConfigFlow(ConfigFlow, domain=DOMAIN):
         ):
             return self.async_abort(reason="not_domintell_bridge")
 
-        self.ip = discovery_info.addresses[0]  # ip address V4
+        # ip addresses V4
+        addresses = [
+            str(ip_address)
+            for ip_address in discovery_info.ip_addresses
+            if ip_address.version == 4
+        ]
+        if not addresses:
+            return self.async_abort(reason="no_ipv4")
+        self.ip = addresses[0]
         self.host = discovery_info.hostname.rstrip(".")  # 'dgqg04-462.local'
         name = discovery_info.name  # 'dgqg04-462._domintellmodule._tcp.local.'
 
@@ -206,15 +254,18 @@ class DomintellConfigFlow(ConfigFlow, domain=DOMAIN):
 
         # The installation can be equipped with a Master and a DNETx
         # In this case we must reject the master in the discoveries
-        if discovery_info.name.startswith("dgqg"):
-            # Connection attempt, if the master module is linked to a DNET,
-            # it will explicitly refuse the connection
-            try:
-                await self._async_test_connection(self.ip)
-            except ConnectionRefusedError as ex:
+        if discovery_info.name.startswith("dgqg") or len(addresses) > 1:
+            # Connection attempt on all the addresses at once, if the master
+            # module is linked to a DNET, it will explicitly refuse the connection
+            results = await _PROBE_CACHE.probe_all(addresses, login=False)
+            reachable = [result.host for result in results if result.ok]
+
+            if reachable:
+                self.ip = reachable[0]
+            elif discovery_info.name.startswith("dgqg") and any(
+                isinstance(result.error, ConnectionRefusedError) for result in results
+            ):
                 return self.async_abort(reason="not_domintell_bridge")
-            except Exception as ex:
-                pass
 
         # Assign a unique ID to the flow and abort the flow
         # if another flow with the same unique ID is in progress
@@ -362,8 +413,8 @@ class DomintellConfigFlow(ConfigFlow, domain=DOMAIN):
 
         Make connection with device to test the connection
         """
-        gateway = DomintellGateway(host)
-        await gateway.test_connection()
+        result = await _PROBE_CACHE.probe(host, login=False)
+        result.raise_for_error()
 
     @staticmethod
     async def _async_try_connect(
@@ -373,10 +424,35 @@ class DomintellConfigFlow(ConfigFlow, domain=DOMAIN):
 
         Make connection with device to test the connection and recover information
         """
+        # Log in once, the probe session collects the answer to DISCOVER
+        result = await _PROBE_CACHE.probe(host, username, password)
+
+        try:
+            result.raise_for_error()
+        except (InvalidCredentials, UserDatabaseEmpty) as ex:
+            raise InvalidCredentials("invalid_credentials") from ex
+        except ConnectionRefusedError as ex:
+            raise ConnectionRefusedError("connection_refused") from ex
+        except MaxConnectedClient as ex:
+            raise MaxConnectedClient("max_connection") from ex
+        except TimeoutError as ex:
+            raise TimeoutError("network_error") from ex
+
+        # The answer to DISCOVER identifies the module we are connected to
+        # (only from LP Version 43.7)
+        if result.server_info is not None:
+            return {
+                "id": result.server_info["id"],
+                "serial_number": result.server_info["serial_number"],
+                "serial_number_text": result.server_info["serial_number_text"],
+            }
+
+        # Older Lightprotocol, determine the module from the modules list
         gateway = DomintellGateway(host, username, password)
 
         try:
-            await gateway.initialize(exit_on_error=True)
+            async with asyncio.timeout(DEFAULT_PROBE_TIMEOUT):
+                await gateway.initialize(exit_on_error=True)
 
             # Determine which module we are connected to
             my_gateway = gateway.get_module_gateway
@@ -389,15 +465,6 @@ class DomintellConfigFlow(ConfigFlow, domain=DOMAIN):
                 }
             else:
                 # Case where no Master and no DNET found in the modules list
-                # Try to recover information from discover command in LP (only from LP Version 43.7)
-                server_info = gateway._client.server_info
-                if server_info is not None:
-                    return {
-                        "id": server_info["id"],
-                        "serial_number": server_info["serial_number"],
-                        "serial_number_text": server_info["serial_number_text"],
-                    }
-
                 raise InvalidAppinfo("no_bridges")
 
         except (InvalidCredentials, UserDatabaseEmpty) as ex:
@@ -408,8 +475,6 @@ class DomintellConfigFlow(ConfigFlow, domain=DOMAIN):
             raise MaxConnectedClient("max_connection") from ex
         except TimeoutError as ex:
             raise TimeoutError("network_error") from ex
-        except Exception as ex:
-            raise type(ex)(str(ex)) from ex
         finally:
             await gateway.close()
 
@@ -417,17 +482,24 @@ class DomintellConfigFlow(ConfigFlow, domain=DOMAIN):
 class DomintellOptionsFlowHandler(OptionsFlow):
     """Handle options."""
 
-    def __init__(self, config_entry: ConfigEntry) -> None:
-        """Initialize options flow."""
-        self.config_entry = config_entry
-
     async def async_step_init(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
         """Manage Domintell options."""
 
+        errors = {}
+        options = self.config_entry.options
+
         if user_input is not None:
-            return self.async_create_entry(title="", data=user_input)
+            try:
+                user_input[CONF_HISTORY_DEPTH] = validate_history_depth(
+                    user_input.get(CONF_HISTORY_DEPTH, {})
+                )
+            except vol.Invalid:
+                errors[CONF_HISTORY_DEPTH] = "invalid_history_depth"
+            else:
+                return self.async_create_entry(title="", data=user_input)
+            options = user_input
 
         # create a list of Domintell device ID's that the user can select
         # to ignore availability status
@@ -454,6 +526,31 @@ class DomintellOptionsFlowHandler(OptionsFlow):
                         CONF_IGNORE_AVAILABILITY,
                         default=cur_ids,
                     ): cv.multi_select(dev_ids),
+                    vol.Optional(
+                        CONF_SENSOR_MIN_INTERVAL,
+                        default=options.get(CONF_SENSOR_MIN_INTERVAL, 0),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0)),
+                    vol.Optional(
+                        CONF_SENSOR_DEADBAND,
+                        default=options.get(CONF_SENSOR_DEADBAND, 0),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0)),
+                    vol.Optional(
+                        CONF_SENSOR_DEADBAND_PERCENT,
+                        default=options.get(CONF_SENSOR_DEADBAND_PERCENT, 0),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0, max=100)),
+                    vol.Optional(
+                        CONF_ELECTRICITY_WINDOW,
+                        default=options.get(CONF_ELECTRICITY_WINDOW, 0),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=86400)),
+                    vol.Optional(
+                        CONF_HISTORY_DEPTH,
+                        default=options.get(CONF_HISTORY_DEPTH, {}),
+                    ): selector.ObjectSelector(),
+                    vol.Optional(
+                        CONF_HUB_PORT,
+                        default=options.get(CONF_HUB_PORT, 0),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=65535)),
                 }
             ),
+            errors=errors,
         )
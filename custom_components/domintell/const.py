@@ -22,6 +22,21 @@ PLATFORMS = [
 ]
 
 CONF_IGNORE_AVAILABILITY = "ignore_availability"
+CONF_SENSOR_MIN_INTERVAL = "sensor_min_interval"
+CONF_SENSOR_DEADBAND = "sensor_deadband"
+CONF_SENSOR_DEADBAND_PERCENT = "sensor_deadband_percent"
+CONF_ELECTRICITY_WINDOW = "electricity_aggregation_window"
+CONF_HISTORY_DEPTH = "history_depth"
+CONF_HUB_PORT = "hub_port"
+
+# Delay (s) during which the state writes of an entity are coalesced
+STATE_WRITE_TICK = 0.05
+
+SERVICE_EXPORT_HISTORY = "export_history"
+SERVICE_CLEAR_HISTORY = "clear_history"
+SERVICE_SET_TRACE_FILTER = "set_trace_filter"
+ATTR_IO_ID = "io_id"
+ATTR_MODULE = "module"
 CONF_MODULE_TYPE = "module_type"
 CONF_MODULE_SN = "module_serial_number"
 
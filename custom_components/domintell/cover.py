@@ -7,7 +7,6 @@ from typing import Any
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers import entity_registry as er
 from homeassistant.components.cover import (
-    DOMAIN as COVER_DOMAIN,
     CoverDeviceClass,
     CoverEntity,
     CoverEntityFeature,
@@ -51,21 +50,6 @@ async def async_setup_entry(
         controller.subscribe(async_add_entity, event_filter=EventType.RESOURCE_ADDED)
     )
 
-    # Check for entities that no longer exist and remove them
-    entity_reg = er.async_get(hass)
-    reg_entities = er.async_entries_for_config_entry(entity_reg, config_entry.entry_id)
-
-    for entity in reg_entities:
-        if entity.domain != COVER_DOMAIN:
-            continue
-
-        part = entity.unique_id.split("_")
-        if len(part) >= 3:
-            endpoint_id = part[2]
-
-            if endpoint_id not in controller.keys():
-                entity_reg.async_remove(entity.entity_id)
-
 
 class DomintellCover(CoverEntity):
     """Representation of a Domintell Cover."""
@@ -170,7 +154,7 @@ class DomintellCover(CoverEntity):
                 if self._status_ref_io is not None
                 else self._resource.state
             )
-            self.async_write_ha_state()
+            self._bridge.state_writer.async_schedule(self)
 
     async def async_added_to_hass(self) -> None:
         """Call when entity is added."""
@@ -37,11 +37,27 @@ async def async_setup_devices(bridge: DomintellBridge):
     dev_reg = dr.async_get(hass)
     dev_controller = api.modules
 
+    bridge_id = f"{entry.unique_id}_{bridge.bridge_id}"  # ie: "dgqg04-253_520000FD"
+
+    # Current devices of the config entry, by Domintell device id
+    registered: dict[str, dr.DeviceEntry] = {}
+    for device in dr.async_entries_for_config_entry(dev_reg, entry.entry_id):
+        for domain, identifier in device.identifiers:
+            if domain == DOMAIN:
+                registered[identifier] = device
+
+    @callback
+    def get_device(device_id: str) -> dr.DeviceEntry | None:
+        """Return the registered device, if still in the registry."""
+        device = registered.get(device_id)
+        if device is not None and dev_reg.async_get(device.id) is device:
+            return device
+        return dev_reg.async_get_device(identifiers={(DOMAIN, device_id)})
+
     @callback
     def add_device(resource) -> dr.DeviceEntry:
         """Register a Domintell device in device registry."""
         # Register a Domintell device resource as device in HA device registry.
-        bridge_id = f"{entry.unique_id}_{bridge.bridge_id}"  # ie: "dgqg04-253_520000FD"
         device_id = f"{entry.unique_id}_{resource.id}"  # ie: "dgqg04-253_0A0012BF"
 
         params = {
@@ -56,15 +72,41 @@ async def async_setup_devices(bridge: DomintellBridge):
         }
 
         # Add via_device if necessary
+        via_device_id = None
         if device_id != bridge_id:
             params[ATTR_VIA_DEVICE] = (DOMAIN, bridge_id)
-
-        return dev_reg.async_get_or_create(config_entry_id=entry.entry_id, **params)
+            # Bridge not registered yet: always let the registry link them
+            via_device = get_device(bridge_id)
+            via_device_id = via_device.id if via_device else False
+
+        # Skip the registry write if the device is up to date
+        device = get_device(device_id)
+        if (
+            device is not None
+            and entry.entry_id in device.config_entries
+            and device.via_device_id == via_device_id
+            and all(
+                getattr(device, attr) == params[attr]
+                for attr in (
+                    ATTR_SERIAL_NUMBER,
+                    ATTR_SW_VERSION,
+                    ATTR_NAME,
+                    ATTR_MODEL,
+                    ATTR_MANUFACTURER,
+                )
+            )
+        ):
+            return device
+
+        device = dev_reg.async_get_or_create(config_entry_id=entry.entry_id, **params)
+        registered[device_id] = device
+        return device
 
     @callback
     def remove_device(device_id: str) -> None:
         """Remove device from registry."""
 
+        registered.pop(device_id, None)
         if device := dev_reg.async_get_device(identifiers={(DOMAIN, device_id)}):
             # note: removal of any underlying entities is handled by core
             dev_reg.async_remove_device(device.id)
@@ -80,13 +122,14 @@ async def async_setup_devices(bridge: DomintellBridge):
             add_device(resource)
 
     # Create/update all current devices found in controllers
-    known_devices = [add_device(device) for device in dev_controller]
+    known_devices = {add_device(device).id for device in dev_controller}
 
     # Check for nodes that no longer exist and remove them
-    for device in dr.async_entries_for_config_entry(dev_reg, entry.entry_id):
-        if device not in known_devices:
+    for device_id, device in list(registered.items()):
+        if device.id not in known_devices:
             # Workaround for case the bridge is not in the list of discovered devices
             if device.name.split("-")[0] not in BRIDGES_LIST:
+                registered.pop(device_id)
                 dev_reg.async_remove_device(device.id)
 
     # add listener for updates on Domintell controllers
@@ -28,6 +28,57 @@ async def async_setup_domintell_events(bridge):
     device_reg = dr.async_get(hass)
     conf_uid = conf_entry.unique_id
 
+    # io id -> (HA device id, module serial number text) of the event sources
+    targets: dict[str, tuple[str, str]] = {}
+    # module id -> io ids in targets
+    module_ios: dict[str, list[str]] = {}
+
+    @callback
+    def remove_targets(module_id: str) -> None:
+        for io_id in module_ios.pop(module_id, ()):
+            targets.pop(io_id, None)
+
+    @callback
+    def add_targets(module) -> None:
+        """Map the IOs of a module to its device."""
+        remove_targets(module.id)
+        device_uid = f"{conf_uid}_{module.id}"  # ie: "dnet02-22_0A0012BF"
+        device = device_reg.async_get_device(identifiers={(DOMAIN, device_uid)})
+        if device is None:
+            return
+
+        target = (device.id, module.serial_number_text)
+        io_ids = module.keys()
+        for io_id in io_ids:
+            targets[io_id] = target
+        module_ios[module.id] = io_ids
+
+    @callback
+    def get_target(io_id: str) -> tuple[str, str] | None:
+        """Return the device id and module serial number text of an IO."""
+        target = targets.get(io_id)
+        if target is None:
+            # IO added to an already known module
+            module = api.modules.get_module_of_io(io_id)  # ie: "0A0012BF"
+            if module is not None:
+                add_targets(module)
+                target = targets.get(io_id)
+        return target
+
+    @callback
+    def handle_module_event(event_type: EventType, module) -> None:
+        """Keep the targets in sync with the modules (and their devices)."""
+        if event_type == EventType.RESOURCE_DELETED:
+            remove_targets(module.id)
+        else:
+            add_targets(module)
+
+    for module in api.modules:
+        add_targets(module)
+
+    # Subscribed after the devices setup, so their registry entry is up to date
+    conf_entry.async_on_unload(api.modules.subscribe(handle_module_event))
+
     @callback
     def handle_button_event(event_type: EventType, resource) -> None:
         """Handle event from Domintell button resource controller."""
@@ -42,9 +93,9 @@ async def async_setup_domintell_events(bridge):
         if not isinstance(resource.state, PushState):
             return
 
-        module = api.modules.get_module_of_io(resource.id)  # ie: "0A0012BF""
-        device_uid = f"{conf_uid}_{module.id}"  # ie: "dnet02-22_0A0012BF"
-        device = device_reg.async_get_device(identifiers={(DOMAIN, device_uid)})
+        if (target := get_target(resource.id)) is None:
+            return
+        device_id, serial_number_text = target
 
         if resource.state == PushState.RELEASED:
             value = "press"
@@ -58,8 +109,8 @@ async def async_setup_domintell_events(bridge):
         if value != "unknown":
             # Fire event
             data = {
-                CONF_DEVICE_ID: device.id,
-                ATTR_DEVICE: module.serial_number_text,
+                CONF_DEVICE_ID: device_id,
+                ATTR_DEVICE: serial_number_text,
                 CONF_TYPE: value,
                 CONF_SUBTYPE: f"button {resource.io_offset}",
             }
@@ -87,9 +138,9 @@ async def async_setup_domintell_events(bridge):
         if not isinstance(resource.state, GestureState):
             return
 
-        module = api.modules.get_module_of_io(resource.id)
-        device_uid = f"{conf_uid}_{module.id}"
-        device = device_reg.async_get_device(identifiers={(DOMAIN, device_uid)})
+        if (target := get_target(resource.id)) is None:
+            return
+        device_id, serial_number_text = target
 
         match resource.state:
             # case GestureState.GESTURE_RIGHT:
@@ -109,8 +160,8 @@ async def async_setup_domintell_events(bridge):
         if value != "unknown":
             # Fire event
             data = {
-                CONF_DEVICE_ID: device.id,
-                ATTR_DEVICE: module.serial_number_text,
+                CONF_DEVICE_ID: device_id,
+                ATTR_DEVICE: serial_number_text,
                 CONF_TYPE: value,
                 CONF_SUBTYPE: f"gesture {resource.io_offset}",
             }
@@ -138,9 +189,9 @@ async def async_setup_domintell_events(bridge):
         if not isinstance(resource.state, MotionState):
             return
 
-        module = api.modules.get_module_of_io(resource.id)
-        device_uid = f"{conf_uid}_{module.id}"
-        device = device_reg.async_get_device(identifiers={(DOMAIN, device_uid)})
+        if (target := get_target(resource.id)) is None:
+            return
+        device_id, serial_number_text = target
 
         match resource.state:
             case MotionState.START_DETECTION:
@@ -154,8 +205,8 @@ async def async_setup_domintell_events(bridge):
         if value != "unknown":
             # Fire event
             data = {
-                CONF_DEVICE_ID: device.id,
-                ATTR_DEVICE: module.serial_number_text,
+                CONF_DEVICE_ID: device_id,
+                ATTR_DEVICE: serial_number_text,
                 CONF_TYPE: value,
                 CONF_SUBTYPE: f"detector {resource.io_offset}",
             }
@@ -186,17 +237,17 @@ async def async_setup_domintell_events(bridge):
         if not isinstance(resource.key, int):
             return
 
-        module = api.modules.get_module_of_io(resource.id)
-        device_uid = f"{conf_uid}_{module.id}"
-        device = device_reg.async_get_device(identifiers={(DOMAIN, device_uid)})
+        if (target := get_target(resource.id)) is None:
+            return
+        device_id, serial_number_text = target
 
         value = IR_CODE_EVENTS_TYPES[resource.key]
 
         if resource.state != PushState.UNKNOWN:
             # Fire event
             data = {
-                CONF_DEVICE_ID: device.id,
-                ATTR_DEVICE: module.serial_number_text,
+                CONF_DEVICE_ID: device_id,
+                ATTR_DEVICE: serial_number_text,
                 CONF_TYPE: value,
                 CONF_SUBTYPE: f"code {resource.key}",
             }
@@ -0,0 +1,283 @@
+"""Rolling aggregation of measurement samples."""
+
+import time
+from array import array
+from collections.abc import Iterator
+
+# Number of time buckets per window, the resolution of the window is
+# window / buckets seconds whatever the rate of the meter.
+DEFAULT_WINDOW_BUCKETS = 60
+
+# Instantaneous measurements aggregated as min/max/mean
+ELECTRICITY_MEASUREMENTS = (
+    "instant_power_l1",
+    "instant_power_l2",
+    "instant_power_l3",
+    "intensity_l1",
+    "intensity_l2",
+    "intensity_l3",
+    "voltage_l1",
+    "voltage_l2",
+    "voltage_l3",
+    "total_power",
+)
+
+# Energy counters aggregated as a delta over the window
+ELECTRICITY_COUNTERS = (
+    "total_energy_l1",
+    "total_energy_l2",
+    "total_energy_l3",
+    "forward_energy",
+    "reverse_energy",
+    "total_energy",
+)
+
+
+class RollingWindow:
+    """Time bounded window of samples summarized in fixed time buckets.
+
+    The window is split in `buckets` slots of window / buckets seconds, each
+    keeping the min, max and last value and the integral of the values over
+    the slot, so the memory does not depend on the rate of the meter and the
+    whole window is always covered (at the resolution of a slot).
+
+    A sample holds its value until the next one: meters only report changes,
+    so the held value carries over the empty slots and the value at the start
+    of the oldest slot is kept as the baseline of the delta.
+    """
+
+    __slots__ = (
+        "_window",
+        "_width",
+        "_slots",
+        "_min",
+        "_max",
+        "_last",
+        "_area",
+        "_start",
+        "_count",
+        "_baseline",
+        "_value",
+        "_time",
+        "_first_time",
+    )
+
+    def __init__(self, window: float, buckets: int = DEFAULT_WINDOW_BUCKETS):
+        if window <= 0:
+            raise ValueError("The window duration must be positive")
+        if buckets < 1:
+            raise ValueError("The window must have at least 1 bucket")
+
+        self._window = float(window)
+        self._width = self._window / buckets
+        # A window not aligned on the slots overlaps one more slot
+        size = buckets + 1
+        self._slots = array("q", bytes(8 * size))
+        self._min = array("d", bytes(8 * size))
+        self._max = array("d", bytes(8 * size))
+        self._last = array("d", bytes(8 * size))
+        self._area = array("d", bytes(8 * size))
+        self.clear()
+
+    @property
+    def window(self) -> float:
+        return self._window
+
+    @property
+    def buckets(self) -> int:
+        return len(self._slots) - 1
+
+    def __len__(self) -> int:
+        return self._count
+
+    def clear(self) -> None:
+        self._start = 0
+        self._count = 0
+        self._baseline = 0.0
+        self._value = 0.0
+        self._time = 0.0
+        self._first_time = 0.0
+
+    def _open(self, slot: int, value: float) -> None:
+        """Add a slot starting with the held value."""
+        size = len(self._slots)
+        if self._count == size:
+            # The value at the start of the next slot becomes the baseline
+            self._baseline = self._last[self._start]
+            self._start = (self._start + 1) % size
+            self._count -= 1
+
+        index = (self._start + self._count) % size
+        self._slots[index] = slot
+        self._min[index] = value
+        self._max[index] = value
+        self._last[index] = value
+        self._area[index] = 0.0
+        self._count += 1
+
+    def _advance(self, now: float) -> None:
+        """Integrate the held value up to now, opening the slots on the way."""
+        if not self._count or now <= self._time:
+            return
+
+        size = len(self._slots)
+        width = self._width
+        value = self._value
+        slot = int(now // width)
+        index = (self._start + self._count - 1) % size
+        current = self._slots[index]
+
+        if slot - current >= size:
+            # Held for longer than the window, only its last slots matter
+            self._area[index] += value * ((current + 1) * width - self._time)
+            self._baseline = value
+            self._start = 0
+            self._count = 0
+            current = slot - size
+            self._time = (current + 1) * width
+
+        while current < slot:
+            if self._count:
+                end = (current + 1) * width
+                self._area[(self._start + self._count - 1) % size] += value * (
+                    end - self._time
+                )
+                self._time = end
+            current += 1
+            self._open(current, value)
+
+        self._area[(self._start + self._count - 1) % size] += value * (
+            now - self._time
+        )
+        self._time = now
+
+    def append(self, value: float, timestamp: float | None = None) -> None:
+        """Add a sample to the slot of its timestamp."""
+        if timestamp is None:
+            timestamp = time.monotonic()
+
+        if not self._count:
+            self._open(int(timestamp // self._width), value)
+            self._baseline = value
+            self._first_time = timestamp
+        else:
+            self._advance(timestamp)
+
+        index = (self._start + self._count - 1) % len(self._slots)
+        if value < self._min[index]:
+            self._min[index] = value
+        if value > self._max[index]:
+            self._max[index] = value
+        self._last[index] = value
+        self._value = value
+        if timestamp > self._time:
+            self._time = timestamp
+
+    def expire(self, now: float | None = None) -> None:
+        """Move the window up to now, dropping the slots out of the window."""
+        if now is None:
+            now = time.monotonic()
+        self._advance(now)
+
+    def _indexes(self) -> Iterator[int]:
+        size = len(self._slots)
+        return ((self._start + offset) % size for offset in range(self._count))
+
+    def span(self, now: float | None = None) -> float:
+        """Return the duration covered by the samples, up to the window."""
+        if not self._count:
+            return 0.0
+        if now is None:
+            now = time.monotonic()
+        begin = max(self._first_time, self._slots[self._start] * self._width)
+        return min(max(now - begin, 0.0), self._window)
+
+    def minimum(self) -> float | None:
+        if not self._count:
+            return None
+        return min(self._min[index] for index in self._indexes())
+
+    def maximum(self) -> float | None:
+        if not self._count:
+            return None
+        return max(self._max[index] for index in self._indexes())
+
+    def mean(self, now: float | None = None) -> float | None:
+        """Return the mean of the values, weighted by the time they were held."""
+        if not self._count:
+            return None
+        if now is None:
+            now = time.monotonic()
+
+        self._advance(now)
+        begin = max(self._first_time, self._slots[self._start] * self._width)
+        duration = self._time - begin
+        if duration <= 0:
+            # Only a sample received right now
+            return self._value
+        return sum(self._area[index] for index in self._indexes()) / duration
+
+    def delta(self) -> float | None:
+        """Return the difference between the newest value and the baseline."""
+        if not self._count:
+            return None
+        return self._value - self._baseline
+
+
+class ElectricityAggregator:
+    """Rolling windows over the measurements and counters of an ElectricityState."""
+
+    __slots__ = ("_windows",)
+
+    def __init__(self, window: float, buckets: int = DEFAULT_WINDOW_BUCKETS):
+        self._windows = {
+            name: RollingWindow(window, buckets)
+            for name in ELECTRICITY_MEASUREMENTS + ELECTRICITY_COUNTERS
+        }
+
+    @property
+    def window(self) -> float:
+        return self._windows[ELECTRICITY_MEASUREMENTS[0]].window
+
+    def add(self, state, timestamp: float | None = None) -> None:
+        """Add the values of an ElectricityState."""
+        if timestamp is None:
+            timestamp = time.monotonic()
+
+        for name, rolling_window in self._windows.items():
+            rolling_window.append(getattr(state, name), timestamp)
+
+    def _get_window(self, name: str, now: float | None = None) -> RollingWindow:
+        rolling_window = self._windows[name]
+        rolling_window.expire(now)
+        return rolling_window
+
+    def minimum(self, name: str) -> float | None:
+        return self._get_window(name).minimum()
+
+    def maximum(self, name: str) -> float | None:
+        return self._get_window(name).maximum()
+
+    def mean(self, name: str) -> float | None:
+        now = time.monotonic()
+        return self._get_window(name, now).mean(now)
+
+    def delta(self, name: str) -> float | None:
+        return self._get_window(name).delta()
+
+    def span(self) -> float:
+        """Return the duration covered by the samples, up to the window."""
+        return self._windows[ELECTRICITY_MEASUREMENTS[0]].span()
+
+    def as_dict(self) -> dict:
+        """Return all the aggregates of the window."""
+        result = {"window": self.window, "span": self.span()}
+        for name in ELECTRICITY_MEASUREMENTS:
+            result[name] = {
+                "min": self.minimum(name),
+                "max": self.maximum(name),
+                "mean": self.mean(name),
+            }
+        for name in ELECTRICITY_COUNTERS:
+            result[name] = {"delta": self.delta(name)}
+        return result
@@ -1,3 +1,5 @@
+from dataclasses import dataclass
+
 UNSUPPORTED_MODULE_TYPE_LIST = (
     "QG1"  # DGQG01 Gen 1 Master
     "LCD",  # DLCD01
@@ -1267,6 +1269,8 @@ GATEWAY_MODULE_TYPE_LIST = MASTER_MODULE_TYPE_LIST + DNET_MODULE_TYPE_LIST
 SHUTTERS_MODULE_TYPE_LIST = ("V24", "TRV", "TPV")
 LED_INDICATOR_IO_TYPE_LIST = (10, 15, 20, 60)
 SENSORS_IO_TYPE_LIST = (8, 21, 24, 34, 36, 37, 38, 39, 41, 51, 56, 57)
+# IOs reporting events (gesture, ir code, trigger) rather than states
+EVENT_IO_TYPE_LIST = (9, 49, 53)
 SENSORS_TARGET_TYPE_LIST = (
     "sensor",
     "motion",
@@ -1388,35 +1392,125 @@ def get_cmd_new_gen(cmd: str) -> str:
 
 def is_module_newgen(module_type: str) -> bool:
     """Return True if module is new gen"""
-    return module_type not in LEGACY_MODULE_TYPE_LIST
+    return module_type not in MODULE_TYPES.legacy_module_types
 
 
 def is_module_legacy(module_type: str) -> bool:
     """Return True if module is legacy"""
-    return module_type in LEGACY_MODULE_TYPE_LIST
+    return module_type in MODULE_TYPES.legacy_module_types
 
 
 def is_module_master(module_type: str) -> bool:
     """Return True if module is master"""
-    return module_type in MASTER_MODULE_TYPE_LIST
+    return module_type in MODULE_TYPES.master_module_types
 
 
 def is_module_dnet(module_type: str) -> bool:
     """Return True if module is DNET0x"""
-    return module_type in DNET_MODULE_TYPE_LIST
+    return module_type in MODULE_TYPES.dnet_module_types
 
 
 def get_module_type_num_by_model(model_name: str):
     """Return module type number of model"""
-    for module_type, module_data in MODULE_TYPE_DICTIONNARY.items():
-        if module_data["model"] == model_name:
-            return module_data["mod_type_num"]
-    return None
+    record = MODULE_TYPES.get_by_model(model_name)
+    return None if record is None else record.type_num
 
 
 def get_module_type_by_model(model_name: str):
     """Return module type of model"""
-    for module_type, module_data in MODULE_TYPE_DICTIONNARY.items():
-        if module_data["model"] == model_name:
-            return module_type
-    return None
+    record = MODULE_TYPES.get_by_model(model_name)
+    return None if record is None else record.module_type
+
+
+@dataclass(frozen=True, slots=True)
+class ModuleTypeInfo:
+    """Description of a module type, precomputed from MODULE_TYPE_DICTIONNARY."""
+
+    module_type: str
+    model: str
+    type_num: str
+    description: str
+    io_types_list: tuple
+    # Io offset and io type by io number - 1, only for legacy modules
+    io_offsets: tuple | None = None
+    io_types: tuple | None = None
+    nbr_of_bool_io: int = 8
+    legacy: bool = False
+    supported: bool = False
+
+
+class ModuleTypeRegistry:
+    """Module types lookups, built once at import.
+
+    Hot paths (status lines, APPINFO lines, commands) test the module and io
+    types against the sets below and read the records instead of scanning the
+    lists and dictionaries above.
+    """
+
+    def __init__(self) -> None:
+        self.supported_module_types = frozenset(SUPPORTED_MODULE_TYPE_LIST)
+        self.supported_io_types = frozenset(SUPPORTED_IO_TYPE_LIST)
+        self.legacy_module_types = frozenset(LEGACY_MODULE_TYPE_LIST)
+        self.buttons_module_types = frozenset(BUTTONS_MODULE_TYPE_LIST)
+        self.shutters_module_types = frozenset(SHUTTERS_MODULE_TYPE_LIST)
+        self.temp_sensor_module_types = frozenset(LEGACY_MODULE_WITH_TEMP_SENSOR_LIST)
+        self.not_a_module_types = frozenset(NOT_A_MODULE_TYPE_LIST)
+        self.no_io_module_types = frozenset(MODULE_TYPE_OF_MODULES_WITH_NO_IO)
+        self.master_module_types = frozenset(MASTER_MODULE_TYPE_LIST)
+        self.dnet_module_types = frozenset(DNET_MODULE_TYPE_LIST)
+        self.gateway_module_types = frozenset(GATEWAY_MODULE_TYPE_LIST)
+        self.event_io_types = frozenset(EVENT_IO_TYPE_LIST)
+
+        self._records: dict[str, ModuleTypeInfo] = {
+            module_type: ModuleTypeInfo(
+                module_type=module_type,
+                model=data["model"],
+                type_num=data["mod_type_num"],
+                description=data["description"],
+                io_types_list=data["io_types_list"],
+                io_offsets=data.get("io_offsets"),
+                io_types=data.get("io_types"),
+                nbr_of_bool_io=data.get("nbr_of_bool_io", 8),
+                legacy=module_type in self.legacy_module_types,
+                supported=module_type in self.supported_module_types,
+            )
+            for module_type, data in MODULE_TYPE_DICTIONNARY.items()
+        }
+        # Legacy status lines do not hold the io type, the whole module is
+        # considered an event source
+        self.legacy_event_module_types = frozenset(
+            record.module_type
+            for record in self._records.values()
+            if record.legacy
+            and any(
+                IO_TYPES_INT.get(io_type) in self.event_io_types
+                for io_type in record.io_types_list
+            )
+        )
+        self._module_type_by_model: dict[str, str] = {}
+        for record in self._records.values():
+            # First declared wins, as the former linear lookups
+            self._module_type_by_model.setdefault(record.model, record.module_type)
+
+    def __contains__(self, module_type: str) -> bool:
+        return module_type in self._records
+
+    def __getitem__(self, module_type: str) -> ModuleTypeInfo:
+        return self._records[module_type]
+
+    def get(self, module_type: str) -> ModuleTypeInfo | None:
+        return self._records.get(module_type)
+
+    def get_by_model(self, model_name: str) -> ModuleTypeInfo | None:
+        module_type = self._module_type_by_model.get(model_name)
+        return None if module_type is None else self._records[module_type]
+
+    def type_num(self, module_type: str) -> str:
+        """Return the module type number (ie: "6A" for "MR2")."""
+        return self._records[module_type].type_num
+
+    def is_legacy(self, module_type: str) -> bool:
+        return module_type in self.legacy_module_types
+
+
+MODULE_TYPES = ModuleTypeRegistry()
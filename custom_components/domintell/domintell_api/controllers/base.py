@@ -1,5 +1,3 @@
-import asyncio
-
 from inspect import iscoroutinefunction
 from collections.abc import Callable
 from .events import EventCallBackType, EventType, ResourceTypes
@@ -21,6 +19,7 @@ class BaseController:
         self._subscribers: dict[str, EventSubscriptionType] = {ID_FILTER_ALL: []}
         self._gateway = gateway
         self._logger = self._gateway._logger
+        self._tracer = self._gateway.tracer
         self._initialized = False
 
     @property
@@ -105,7 +104,7 @@ class BaseController:
 
         # subscribe to item updates
         self._gateway.events.subscribe(
-            self._handle_event, resource_filter=self.item_type
+            self._handle_event, resource_filter=self.item_type, inline=True
         )
 
         self._initialized = True
@@ -166,6 +165,9 @@ class BaseController:
                     continue
                 # Dispatch the full resource object to the callback
                 if iscoroutinefunction(callback):
-                    asyncio.create_task(callback(event_type, current_item))
+                    # A slow subscriber must not stall the events processor
+                    self._gateway.events.create_task(
+                        callback(event_type, current_item)
+                    )
                 else:
                     callback(event_type, current_item)
@@ -33,7 +33,7 @@ class CoversController(BaseController):
             # Update the existing data with the changed keys/data
             previous_state = my_io.state
             data = event_data["data"]
-            self._logger.debug(f"Update IO state for COVER IO Id: {item_id}")
+            self._tracer.trace(item_id, "Update IO state for COVER IO Id: %s", item_id)
 
             if isinstance(my_io.state, CoverState):
                 if (len(data) >= 1) and (isinstance(data[0], int)):
@@ -51,7 +51,7 @@ class CoversController(BaseController):
                         current_state = new_state
 
                     my_io.state = current_state
-                    self._logger.debug(f"---> Cover New state: {my_io.state}")
+                    self._tracer.trace(item_id, "---> Cover New state: %s", my_io.state)
 
                 else:
                     self._logger.warning(
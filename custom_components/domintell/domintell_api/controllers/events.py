@@ -3,14 +3,16 @@ from collections.abc import Callable
 from enum import Enum
 import copy
 import asyncio
+from heapq import merge
 
 from inspect import iscoroutinefunction
 from typing import TypedDict
 import time
 from uuid import uuid4
 
-from ..const import IO_DEFAULT_TARGET_TYPES
+from ..const import IO_DEFAULT_TARGET_TYPES, MODULE_TYPES
 from ..lightprotocol import LpStatus
+from ..history import IOHistory
 from ..websocket import ConnectionState
 
 
@@ -67,13 +69,19 @@ class DomintellEvent(TypedDict):
     creationtime: str
     type: str
     data: list[dict]
+    received: float  # time.monotonic() of the frame reception
+    message: str  # Status line of the event ("" for connection events)
 
 
+# Maximum number of events waiting to be dispatched
+DEFAULT_EVENT_QUEUE_SIZE = 5000
+
 EventCallBackType = Callable[[EventType, dict | None], None]
 EventSubscriptionType = tuple[
     EventCallBackType,
     "tuple[EventType] | None",
     "tuple[ResourceTypes] | None",
+    bool,
 ]
 
 
@@ -87,8 +95,24 @@ class EventsController:
         self._subscribers: list[EventSubscriptionType] = []
         self._status = ConnectionState.DISCONNECTED
         self._bg_tasks: list[asyncio.Task] = []
-        self._event_queue = asyncio.Queue()
+        # Pending events, each one in a slot (one element list) so that an
+        # update of an IO still queued can be replaced in place (see __enqueue).
+        # Updates are queued apart so that the oldest one is dropped in O(1),
+        # the sequence number restores the order of reception.
+        self._event_queue: deque[tuple[int, list[DomintellEvent]]] = deque()
+        self._update_queue: deque[tuple[int, list[DomintellEvent]]] = deque()
+        self._queued_updates: dict[str, list[DomintellEvent]] = {}
+        self._sequence = 0
+        self._queue_size = DEFAULT_EVENT_QUEUE_SIZE
+        self._queue_overflow = False
+        self._queue_wakeup = asyncio.Event()
+        # Await the controllers of the library inline instead of creating a
+        # task per event, the other coroutine subscribers always run in a task
+        self._inline_dispatch = True
+        self._tasks: set[asyncio.Task] = set()
         self._event_history = deque(maxlen=25)
+        self._io_history: dict[str, IOHistory] = {}
+        self._io_history_depth: dict[str, int] = {}
 
     @property
     def connected(self) -> bool:
@@ -100,11 +124,72 @@ class EventsController:
         """Return connection status."""
         return self._status
 
+    @property
+    def queue_depth(self) -> int:
+        """Return the number of events waiting to be dispatched."""
+        return len(self._event_queue) + len(self._update_queue)
+
+    @property
+    def inline_dispatch(self) -> bool:
+        """Return True if the library controllers are awaited by the events processor."""
+        return self._inline_dispatch
+
+    @inline_dispatch.setter
+    def inline_dispatch(self, inline: bool) -> None:
+        self._inline_dispatch = inline
+
+    @property
+    def queue_size(self) -> int:
+        """Return the maximum number of events waiting to be dispatched."""
+        return self._queue_size
+
+    @queue_size.setter
+    def queue_size(self, size: int) -> None:
+        if size < 1:
+            raise ValueError("The event queue size must be at least 1")
+        self._queue_size = size
+
     @property
     def last_events(self) -> list[dict]:
         """Return a list with the previous X messages."""
         return self._event_history
 
+    @property
+    def history_depth(self) -> dict[str, int]:
+        """Return the depth of the IO state history per target type."""
+        return self._io_history_depth
+
+    def set_history_depth(self, depths: dict[ResourceTypes | str, int]) -> None:
+        """Set the depth of the IO state history per target type.
+
+        Parameters:
+            - `depths` - Number of states kept per IO, by target type. Target types not listed (or with a depth of 0) are not recorded.
+        """
+        self._io_history_depth = {
+            ResourceTypes(target_type).value: int(depth)
+            for target_type, depth in depths.items()
+            if int(depth) > 0
+        }
+        self._io_history.clear()
+
+    def get_history(self, ids: list[str] | None = None) -> dict[str, list]:
+        """Return the recorded states, as (timestamp, data) tuples, per IO id."""
+        if ids is None:
+            ids = self._io_history.keys()
+
+        return {
+            id: self._io_history[id].export() for id in ids if id in self._io_history
+        }
+
+    def clear_history(self, ids: list[str] | None = None) -> None:
+        """Clear the recorded IO states, of all the IOs if no id is given."""
+        if ids is None:
+            ids = self._io_history.keys()
+
+        for id in ids:
+            if (history := self._io_history.get(id)) is not None:
+                history.clear()
+
     def initialize(self) -> None:
         """Initialize events."""
         self._gateway._client.on_connection_state_change(self.__connection_state_change)
@@ -124,6 +209,7 @@ class EventsController:
         callback: EventCallBackType,
         event_filter: EventType | tuple[EventType] | None = None,
         resource_filter: ResourceTypes | tuple[ResourceTypes] | None = None,
+        inline: bool = False,
     ) -> Callable:
         """
         Subscribe to events emitted by the Domintell bridge for resources.
@@ -132,6 +218,8 @@ class EventsController:
             - `callback` - callback function to call when an event emits.
             - `event_filter` - Provide an EventType as filter (Optional).
             - `resource_filter` - Provide a ResourceType as filter (Optional).
+            - `inline` - Await the coroutine callback in the events processor,
+              reserved to the controllers of the library (Optional).
 
         Returns:
             function to unsubscribe.
@@ -140,7 +228,7 @@ class EventsController:
             event_filter = (event_filter,)
         if not isinstance(resource_filter, None | tuple):
             resource_filter = (resource_filter,)
-        subscription = (callback, event_filter, resource_filter)
+        subscription = (callback, event_filter, resource_filter, inline)
 
         def unsubscribe():
             self._subscribers.remove(subscription)
@@ -148,9 +236,11 @@ class EventsController:
         self._subscribers.append(subscription)
         return unsubscribe
 
-    def emit(self, event_type: EventType, data: dict | None = None) -> None:
-        """Emit event to all listeners."""
-        for callback, event_filter, resource_filter in self._subscribers:
+    def __get_listeners(
+        self, event_type: EventType, data: dict | None
+    ) -> list[tuple[EventCallBackType, bool]]:
+        listeners = []
+        for callback, event_filter, resource_filter, inline in self._subscribers:
             if event_filter is not None and event_type not in event_filter:
                 continue
             if (
@@ -159,11 +249,42 @@ class EventsController:
                 and ResourceTypes(data.get("type")) not in resource_filter
             ):
                 continue
+            listeners.append((callback, inline))
+        return listeners
+
+    def create_task(self, coro) -> asyncio.Task:
+        """Run a coroutine subscriber in a task, keeping a reference until done."""
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    def emit(self, event_type: EventType, data: dict | None = None) -> None:
+        """Emit event to all listeners."""
+        for callback, _ in self.__get_listeners(event_type, data):
             if iscoroutinefunction(callback):
-                asyncio.create_task(callback(event_type, data))
+                self.create_task(callback(event_type, data))
             else:
                 callback(event_type, data)
 
+    async def async_emit(self, event_type: EventType, data: dict | None = None) -> None:
+        """Emit event to all listeners.
+
+        Only the inline coroutine listeners are awaited, the other ones run in
+        a task so that a slow subscriber does not stall the dispatch.
+        """
+        for callback, inline in self.__get_listeners(event_type, data):
+            try:
+                if iscoroutinefunction(callback):
+                    if inline:
+                        await callback(event_type, data)
+                    else:
+                        self.create_task(callback(event_type, data))
+                else:
+                    callback(event_type, data)
+            except Exception:
+                self._logger.exception(f"Error in listener of event {event_type}")
+
     def __connection_state_change(self, state: ConnectionState) -> None:
         self._logger.info(f"Connection state as changed to: {state}")
 
@@ -184,10 +305,11 @@ class EventsController:
             "creationtime": time.time(),
             "type": type_of_event,
             "data": [],
+            "received": time.monotonic(),
+            "message": "",
         }
         event: DomintellEvent = DomintellEvent(websocket_event)
-        self._event_queue.put_nowait(event)
-        self._event_history.append(event)
+        self.__enqueue(event)
 
     def __status_handler(self, status_list: list[LpStatus]) -> None:
 
@@ -209,16 +331,33 @@ class EventsController:
                     # This IO is not part of any module
                     continue
 
-                nbr_of_bool_io = len(module_of_io.get_ios_by_type(status.io_type))
+                nbr_of_bool_io = module_of_io.count_ios_by_type(status.io_type)
+
+                endpoints = self._gateway._client.endpoints
+                key = (
+                    endpoints.get_key(status.handle)
+                    if status.handle is not None
+                    else None
+                )
 
                 for index, element in enumerate(status.data):
                     if (nbr_of_bool_io is not None) and ((index + 1) > nbr_of_bool_io):
                         break
                     try:
-                        sub_status = copy.deepcopy(status)
-                        parts = status._id.rsplit("-", 1)
+                        # Shallow copy is enough, data attributes are replaced below
+                        sub_status = copy.copy(status)
                         sub_status._io_offset += index
-                        sub_status._id = parts[0] + "-" + str(sub_status._io_offset)
+                        handle = (
+                            endpoints.get_handle(key[:3] + (sub_status._io_offset,))
+                            if key is not None
+                            else None
+                        )
+                        sub_status._handle = handle
+                        if handle is not None:
+                            sub_status._id = endpoints.get_id(handle)
+                        else:
+                            parts = status._id.rsplit("-", 1)
+                            sub_status._id = parts[0] + "-" + str(sub_status._io_offset)
                         sub_status._data = [element]
                         sub_status._raw_data = str(element)
 
@@ -232,6 +371,7 @@ class EventsController:
                 muliple_sub_status.append(status)
 
             # Here we have a list of unitary status
+            now = time.time()
             for item in muliple_sub_status:
                 status_dic = item.get_dict
 
@@ -240,27 +380,112 @@ class EventsController:
                     status_dic["io_type"], "unknown"
                 )
 
+                # Record the state in the IO history when enabled for this type
+                depth = self._io_history_depth.get(target_type)
+                if depth:
+                    history = self._io_history.get(item.id)
+                    if history is None:
+                        history = self._io_history[item.id] = IOHistory(depth)
+                    history.append(now, item.data)
+
                 status_dic["type"] = ResourceTypes(target_type)
                 data.append(status_dic)
 
             dom_event = {
                 "id": status.id,
-                "creationtime": time.time(),
+                "creationtime": now,
                 "type": EventType.RESOURCE_UPDATED,
                 "data": data,
+                "received": self._gateway._client.frame_time,
+                "message": status.message,
             }
 
             event: DomintellEvent = DomintellEvent(dom_event)
-            self._event_queue.put_nowait(event)
-            self._event_history.append(event)
+            # Repeated events (gesture, ir code, trigger) are never coalesced
+            self.__enqueue(
+                event, coalesce=status.io_type not in MODULE_TYPES.event_io_types
+            )
+
+    def __enqueue(self, event: DomintellEvent, coalesce: bool = False) -> None:
+        """Queue an event for the events processor.
+
+        A queued update is replaced by a new one of the same status covering
+        the same IOs (coalescing), unless coalesce is False. When the queue is
+        full, the oldest update is dropped: connection events are never
+        dropped as the gateway resynchronizes on them.
+        """
+        self._event_history.append(event)
+        metrics = self._gateway._client.metrics
+        is_update = event["type"] == EventType.RESOURCE_UPDATED
+
+        if is_update and coalesce:
+            slot = self._queued_updates.get(event["id"])
+            if slot is not None and {item["id"] for item in slot[0]["data"]} <= {
+                item["id"] for item in event["data"]
+            }:
+                # Keep the reception time of the first event for the latency
+                event["received"] = slot[0]["received"]
+                slot[0] = event
+                metrics.events_coalesced += 1
+                return
+
+        if self.queue_depth >= self._queue_size:
+            if not self._queue_overflow:
+                self._queue_overflow = True
+                self._logger.warning(
+                    f"Event queue is full ({self._queue_size} events), updates are dropped"
+                )
+            self.__drop_oldest_update()
+
+        slot = [event]
+        self._sequence += 1
+        if is_update:
+            self._update_queue.append((self._sequence, slot))
+            if coalesce:
+                self._queued_updates[event["id"]] = slot
+        else:
+            self._event_queue.append((self._sequence, slot))
+        metrics.event_queue_depth.observe(self.queue_depth)
+        self._queue_wakeup.set()
+
+    def __drop_oldest_update(self) -> None:
+        if not self._update_queue:
+            return
+
+        _, slot = self._update_queue.popleft()
+        event = slot[0]
+        if self._queued_updates.get(event["id"]) is slot:
+            del self._queued_updates[event["id"]]
+        # The same status received again must not be taken as unchanged
+        self._gateway._client.forget_status(event["message"])
+        self._gateway._client.metrics.events_dropped += 1
 
     async def __event_processor(self) -> None:
         """Process incoming Domintell events on the Queue and distribute those."""
         while True:
-            event: DomintellEvent = await self._event_queue.get()
-
-            if len(event["data"]) == 0:
-                self.emit(EventType(event["type"]))
-            else:
-                for item in event["data"]:
-                    self.emit(EventType(event["type"]), item)
+            await self._queue_wakeup.wait()
+            self._queue_wakeup.clear()
+
+            # Drain all the pending events at once
+            batch = merge(self._event_queue, self._update_queue)
+            self._event_queue = deque()
+            self._update_queue = deque()
+            self._queued_updates = {}
+            self._queue_overflow = False
+            metrics = self._gateway._client.metrics
+
+            for _, (event,) in batch:
+                metrics.dispatch_latency.observe(time.monotonic() - event["received"])
+                event_type = EventType(event["type"])
+                if self._inline_dispatch:
+                    # The whole batch runs in this task, controllers included
+                    if len(event["data"]) == 0:
+                        await self.async_emit(event_type)
+                    else:
+                        for item in event["data"]:
+                            await self.async_emit(event_type, item)
+                elif len(event["data"]) == 0:
+                    self.emit(event_type)
+                else:
+                    for item in event["data"]:
+                        self.emit(event_type, item)
@@ -59,7 +59,7 @@ class FansController(BaseController):
                         f"Status for FanIO has an incorrect format: data={data}"
                     )
 
-            self._logger.debug(f"---> Fan New state: {my_io.state}")
+            self._tracer.trace(item_id, "---> Fan New state: %s", my_io.state)
 
             if my_io.state == previous_state:
                 return
@@ -46,8 +46,8 @@ class GroupsController(BaseController):
             previous_state = my_io.state
 
             # Note: Groups have no status
-            self._logger.debug(f"Update IO state for GROUP IO Id: {item_id}")
-            self._logger.debug(f"---> Group New state: {my_io.state}")
+            self._tracer.trace(item_id, "Update IO state for GROUP IO Id: %s", item_id)
+            self._tracer.trace(item_id, "---> Group New state: %s", my_io.state)
 
             if my_io.state == previous_state:
                 return
@@ -92,7 +92,7 @@ class LightsController(BaseController):
                     f"The IO state type of Light IO is not the expected one, state type: {type(my_io.state)}"
                 )
 
-            self._logger.debug(f"---> Light New state: {my_io.state}")
+            self._tracer.trace(item_id, "---> Light New state: %s", my_io.state)
 
             if my_io.state == previous_state:
                 return
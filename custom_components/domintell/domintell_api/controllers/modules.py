@@ -4,13 +4,8 @@ from .events import EventType, ResourceTypes
 from ..modules import ModuleFactory
 from ..iotypes import IOFactory
 from ..const import (
-    NOT_A_MODULE_TYPE_LIST,
-    MODULE_TYPE_OF_MODULES_WITH_NO_IO,
-    MASTER_MODULE_TYPE_LIST,
-    DNET_MODULE_TYPE_LIST,
-    GATEWAY_MODULE_TYPE_LIST,
     IO_TYPES_STRING,
-    MODULE_TYPE_DICTIONNARY,
+    MODULE_TYPES,
     get_module_type_by_model,
 )
 
@@ -26,6 +21,7 @@ class ModulesController(BaseController):
     def __init__(self, gateway) -> None:
         """Initialize instance."""
         super().__init__(gateway)
+        self._io_index: dict[str, str] = {}  # io_id -> module_id
         self._initialized = False
 
     def get_module(self, id: str):
@@ -39,7 +35,7 @@ class ModulesController(BaseController):
 
         master_list: list = []
         for module in self._items.values():
-            if module.module_type in MASTER_MODULE_TYPE_LIST:
+            if module.module_type in MODULE_TYPES.master_module_types:
                 master_list.append(module)
 
         return master_list
@@ -49,34 +45,31 @@ class ModulesController(BaseController):
 
         dnet_list: list = []
         for module in self._items.values():
-            if module.module_type in DNET_MODULE_TYPE_LIST:
+            if module.module_type in MODULE_TYPES.dnet_module_types:
                 dnet_list.append(module)
 
         return dnet_list
 
     def get_modules_without_ios(self):
         """Returns the list of module that have no IOs."""
-        modules_list = [module for module in self.values() if len(module.values()) == 0]
+        modules_list = [module for module in self._items.values() if len(module) == 0]
         return modules_list
 
+    def get_module_id_of_io(self, io_id: str) -> str | None:
+        """Get the id of the module holding an IO, by io_id."""
+        return self._io_index.get(io_id, None)
+
     def get_io(self, id: str):
         """Get IO by id."""
 
         module_type = id[:3]
-        if module_type not in NOT_A_MODULE_TYPE_LIST:
+        if module_type not in MODULE_TYPES.not_a_module_types:
             # ie:  io_id -> "QG20000FD-1-8" convert to module_id (module SN) "520000FD"
-            module_type_num = MODULE_TYPE_DICTIONNARY.get(module_type)["mod_type_num"]
+            module_type_num = MODULE_TYPES.type_num(module_type)
             module_id = module_type_num + id[3:9]
         else:
             # For io attached to the gateway, you should not rely on the construction of the module_id
-            module_id = None
-            for module in self._items.values():
-                for io in module:
-                    if io.id == id:
-                        module_id = module.id
-                        break
-                if module_id is not None:
-                    break
+            module_id = self._io_index.get(id, None)
 
         module = self.get_module(module_id)
 
@@ -90,19 +83,13 @@ class ModulesController(BaseController):
 
         module_type = io_id[:3]
         module_id = None
-        if module_type not in NOT_A_MODULE_TYPE_LIST:
+        if module_type not in MODULE_TYPES.not_a_module_types:
             # ie:  io_id -> "QG20000FD-1-8" convert to module_id (module SN) "520000FD"
-            module_type_num = MODULE_TYPE_DICTIONNARY.get(module_type)["mod_type_num"]
+            module_type_num = MODULE_TYPES.type_num(module_type)
             module_id = module_type_num + io_id[3:9]
         else:
             # For io attached to the gateway, you should not rely on the construction of the module_id
-            for module in self._items.values():
-                for io in module:
-                    if io.id == io_id:
-                        module_id = module.id
-                        break
-                if module_id is not None:
-                    break
+            module_id = self._io_index.get(io_id, None)
 
         if module_id is not None:
             return self.get_module(module_id)
@@ -111,14 +98,14 @@ class ModulesController(BaseController):
     def _create_module_instances(self, ios):
         """Create instances of modules and their IOs"""
         instances = []
-        seen_modules = set()  # To keep track of modules already encountered
+        seen_modules = {}  # Serial number -> instance of modules already encountered
         deferred_ios = []  # VAR/SYS/SFE/MEM IOs deferred until gateway is available
 
         # Retrieve all instances of existing modules
         existing_modules = self.values()
         for module in existing_modules:
             instances.append(module)
-            seen_modules.add(module.serial_number)
+            seen_modules[module.serial_number] = module
 
         # --- Pass 1: Create all hardware modules and assign their IOs ---
         for element in ios:
@@ -126,14 +113,12 @@ class ModulesController(BaseController):
             module_sn = element["serial_number"]  # Serial number of the io module
 
             # Defer IOs that belong to the gateway (VAR/SYS/SFE/MEM)
-            if module_type in NOT_A_MODULE_TYPE_LIST:
+            if module_type in MODULE_TYPES.not_a_module_types:
                 deferred_ios.append(element)
                 continue
 
             # Create and add module instance
             if module_sn not in seen_modules:
-                seen_modules.add(module_sn)
-
                 # Create a module instance with the element data
                 module_data = {
                     "id": element["serial_number"],
@@ -142,16 +127,10 @@ class ModulesController(BaseController):
 
                 instance = ModuleFactory().create_module(module_type, **module_data)
                 instances.append(instance)
+                seen_modules[module_sn] = instance
 
             # Find the module instance that should contain the io
-            instance_of_module_io = next(
-                (
-                    instance
-                    for instance in instances
-                    if instance.serial_number == module_sn
-                ),
-                None,
-            )
+            instance_of_module_io = seen_modules.get(module_sn, None)
 
             # Create and add io instance in module instance
             if instance_of_module_io is not None:
@@ -162,7 +141,7 @@ class ModulesController(BaseController):
             (
                 m
                 for m in instances
-                if m.module_type in GATEWAY_MODULE_TYPE_LIST
+                if m.module_type in MODULE_TYPES.gateway_module_types
             ),
             None,
         )
@@ -180,7 +159,7 @@ class ModulesController(BaseController):
                             gw_type, id=gw_info["id"], sw_version=None
                         )
                         instances.append(gateway_module)
-                        seen_modules.add(gateway_module.serial_number)
+                        seen_modules[gateway_module.serial_number] = gateway_module
                         self._logger.debug(
                             "Created gateway module %s (%s) from gateway info",
                             gw_info["id"],
@@ -214,9 +193,7 @@ class ModulesController(BaseController):
             )
 
         # Remove modules that were already present
-        instances_to_keep = [
-            module for module in instances if module not in existing_modules
-        ]
+        instances_to_keep = instances[len(existing_modules) :]
 
         return instances_to_keep
 
@@ -225,7 +202,7 @@ class ModulesController(BaseController):
         module_type = element["module_type"]
 
         if (
-            (module_type in MODULE_TYPE_OF_MODULES_WITH_NO_IO)
+            (module_type in MODULE_TYPES.no_io_module_types)
             and element["io_type"] == 0
             and element["io_offset"] == 0
         ):
@@ -236,12 +213,13 @@ class ModulesController(BaseController):
 
         if (
             io_type_string in module.io_types
-            or module.module_type in GATEWAY_MODULE_TYPE_LIST
+            or module.module_type in MODULE_TYPES.gateway_module_types
         ):
             instance_of_io = IOFactory().create_io(
                 io_type_string, self._gateway, **element
             )
             module.add_io(element["id"], instance_of_io)
+            self._io_index[element["id"]] = module.id
 
     async def initialize(self, ios: dict):  # pylint: disable=W0221
         """Initialize modules list."""
@@ -257,7 +235,7 @@ class ModulesController(BaseController):
 
         # Subscribe to module events
         self._gateway.events.subscribe(
-            self._handle_event, resource_filter=self.item_type
+            self._handle_event, resource_filter=self.item_type, inline=True
         )
 
         self._initialized = True
@@ -265,23 +243,23 @@ class ModulesController(BaseController):
     async def update(self, ios_removed, ios_added):
         """Update modules list."""
 
-        def delete_ios(modules, ios_to_delete) -> None:
-            ids_to_delete = [io["id"] for io in ios_to_delete]
-            for module in modules.items:
-                for io in module.ios:
-                    for io_id in ids_to_delete:
-                        if io.id == io_id:
-                            module.remove_io(io_id)
-
         # Remove modules
         if ios_removed is not None:
-            delete_ios(self, ios_removed)
-            modules_empty = self.get_modules_without_ios()
-
-            # Remove gateway module from the list if present
-            for i, module in enumerate(modules_empty):
-                if module.id == self._gateway.gateway_id:
-                    del modules_empty[i]
+            modules_touched = {}
+            for io in ios_removed:
+                module_id = self._io_index.pop(io["id"], None)
+                module = self._items.get(module_id) if module_id is not None else None
+                if module is None:
+                    continue
+                module.remove_io(io["id"])
+                modules_touched[module.id] = module
+
+            # Only modules that lost IOs can have become empty
+            modules_empty = [
+                module
+                for module in modules_touched.values()
+                if len(module) == 0 and module.id != self._gateway.gateway_id
+            ]
 
             for module in modules_empty:
                 await self._handle_event(EventType.RESOURCE_DELETED, {"id": module.id})
@@ -299,4 +277,15 @@ class ModulesController(BaseController):
     ) -> None:
         """Handle incoming event for this resource."""
 
+        if event_data is not None:
+            if event_type == EventType.RESOURCE_ADDED:
+                module = event_data["instance"]
+                for io_id in module.keys():
+                    self._io_index[io_id] = module.id
+            elif event_type == EventType.RESOURCE_DELETED:
+                module = self._items.get(event_data["id"])
+                if module is not None:
+                    for io_id in module.keys():
+                        self._io_index.pop(io_id, None)
+
         await super()._handle_event(event_type, event_data)
@@ -34,8 +34,8 @@ class ScenesController(BaseController):
             previous_state = my_io.state
 
             # Note: Scenes have no status
-            self._logger.debug(f"Update IO state for SCENE IO Id: {item_id}")
-            self._logger.debug(f"---> Scene New state: {my_io.state}")
+            self._tracer.trace(item_id, "Update IO state for SCENE IO Id: %s", item_id)
+            self._tracer.trace(item_id, "---> Scene New state: %s", my_io.state)
 
             if my_io.state == previous_state:
                 return
@@ -1,4 +1,6 @@
+import asyncio
 import copy
+import time
 
 from .base import BaseController
 from .events import ResourceTypes, EventType
@@ -15,10 +17,165 @@ from ..iotypes import (
     ElectricityState,
 )
 from ..const import SENSORS_TARGET_TYPE_LIST
+from ..aggregation import ElectricityAggregator, DEFAULT_WINDOW_BUCKETS
 
 ID_FILTER_ALL = "*"
 
 
+class SensorFilter:
+    """Publication filter for measurement sensors.
+
+    An update is propagated to subscribers only when at least `min_interval`
+    seconds elapsed since the last published state of the IO and when one of
+    its numeric values moved by more than `deadband` (absolute) or by more
+    than `deadband_percent` (relative to the last published value), each
+    threshold only applying when set. Non numeric values (e.g. wind
+    direction) are always published when they change.
+    """
+
+    def __init__(
+        self,
+        min_interval: float = 0.0,
+        deadband: float = 0.0,
+        deadband_percent: float = 0.0,
+    ) -> None:
+        self.min_interval = max(float(min_interval), 0.0)
+        self.deadband = max(float(deadband), 0.0)
+        self.deadband_percent = max(float(deadband_percent), 0.0)
+
+    @property
+    def enabled(self) -> bool:
+        return (
+            self.min_interval > 0 or self.deadband > 0 or self.deadband_percent > 0
+        )
+
+    @staticmethod
+    def _values(state) -> tuple:
+        if isinstance(state, int | float):
+            return (state,)
+        return tuple(vars(state).values())
+
+    def exceeds_deadband(self, published, state) -> bool:
+        """Return True if `state` moved out of the deadband of `published`."""
+        if type(published) is not type(state):
+            return True
+
+        for old, new in zip(self._values(published), self._values(state)):
+            if old == new:
+                continue
+            if not isinstance(old, int | float) or not isinstance(new, int | float):
+                return True
+            delta = abs(new - old)
+            if self.deadband == 0 and self.deadband_percent == 0:
+                return True
+            if self.deadband > 0 and delta > self.deadband:
+                return True
+            if (
+                self.deadband_percent > 0
+                and delta * 100 > abs(old) * self.deadband_percent
+            ):
+                return True
+
+        return False
+
+
+class FilteredSensorController(BaseController):
+    """Base controller for measurement sensors whose updates can be throttled.
+
+    The IO state is always updated, only the propagation of the event to the
+    subscribers is filtered. An update held back by the minimum interval is
+    published when the interval expires, so the last value is never lost.
+    """
+
+    def __init__(self, gateway) -> None:
+        super().__init__(gateway)
+        self._filter = SensorFilter()
+        self._published: dict[str, tuple[float, object]] = {}
+        self._pending: dict[str, asyncio.TimerHandle] = {}
+        # Running publications of held back updates (referenced until done)
+        self._tasks: set[asyncio.Task] = set()
+
+    @property
+    def filter(self) -> SensorFilter:
+        return self._filter
+
+    def set_filter(self, sensor_filter: SensorFilter) -> None:
+        """Set the publication filter of this controller."""
+        self._filter = sensor_filter
+        self._published.clear()
+        for handle in self._pending.values():
+            handle.cancel()
+        self._pending.clear()
+
+    def _forget(self, item_id: str) -> None:
+        self._published.pop(item_id, None)
+        handle = self._pending.pop(item_id, None)
+        if handle is not None:
+            handle.cancel()
+
+    def _accept_update(self, item_id: str, state) -> bool:
+        """Return True if the new state of IO `item_id` must be published."""
+        if not self._filter.enabled:
+            return True
+
+        now = time.monotonic()
+        published = self._published.get(item_id)
+        if published is not None:
+            published_time, published_state = published
+            if not self._filter.exceeds_deadband(published_state, state):
+                return False
+
+            delay = published_time + self._filter.min_interval - now
+            if delay > 0:
+                if item_id not in self._pending:
+                    self._pending[item_id] = asyncio.get_running_loop().call_later(
+                        delay, self._publish_pending, item_id
+                    )
+                return False
+
+        self._forget(item_id)
+        self._published[item_id] = (now, state)
+        return True
+
+    def _publish_pending(self, item_id: str) -> None:
+        """Publish an update held back by the minimum interval."""
+        self._pending.pop(item_id, None)
+        my_io = self.get_io(item_id)
+        if my_io is None:
+            return
+
+        published = self._published.get(item_id)
+        if published is not None and not self._filter.exceeds_deadband(
+            published[1], my_io.state
+        ):
+            return
+
+        self._published[item_id] = (time.monotonic(), my_io.state)
+        task = asyncio.create_task(
+            super()._handle_event(EventType.RESOURCE_UPDATED, {"id": item_id})
+        )
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _handle_event(
+        self, event_type: EventType, event_data: dict | None
+    ) -> None:
+        """Filter updates before propagating them to the subscribers."""
+        if event_data is not None:
+            item_id = event_data["id"]
+
+            if event_type == EventType.RESOURCE_UPDATED:
+                my_io = self.get_io(item_id)
+                if my_io is not None and not self._accept_update(
+                    item_id, my_io.state
+                ):
+                    return
+            else:
+                self._forget(item_id)
+
+        await super()._handle_event(event_type, event_data)
+
+
 class ButtonController(BaseController):
     """Controller holding and managing Domintell resources of type `button`."""
 
@@ -48,7 +205,9 @@ class ButtonController(BaseController):
             previous_state = my_io.state
             data = event_data["data"]
 
-            self._logger.debug(f"Update IO state for BUTTON/GESTURE IO Id: {item_id}")
+            self._tracer.trace(
+                item_id, "Update IO state for BUTTON/GESTURE IO Id: %s", item_id
+            )
 
             if isinstance(my_io.state, PushState):
                 if (len(data) >= 1) and (isinstance(data[0], int)):
@@ -61,7 +220,9 @@ class ButtonController(BaseController):
 
                     if new_state != PushState.UNKNOWN:
                         my_io.state = new_state
-                    self._logger.debug(f"---> Button New state: {my_io.state}")
+                    self._tracer.trace(
+                        item_id, "---> Button New state: %s", my_io.state
+                    )
                 else:
                     self._logger.warning(
                         f"Status for Button IO has an incorrect format: data={data}"
@@ -81,7 +242,9 @@ class ButtonController(BaseController):
                     new_state = GestureState(event_data["data"][0])
                     if new_state != GestureState.UNKNOWN:
                         my_io.state = new_state
-                    self._logger.debug(f"---> Gesture New state: {my_io.state}")
+                    self._tracer.trace(
+                        item_id, "---> Gesture New state: %s", my_io.state
+                    )
                 else:
                     self._logger.warning(
                         f"Status for Gesture IO has an incorrect format: data={data}"
@@ -154,7 +317,7 @@ class MotionController(BaseController):
             # Update the existing data with the changed keys/data
             previous_state = my_io.state
             data = event_data["data"]
-            self._logger.debug(f"Update IO state for Motion IO Id: {item_id}")
+            self._tracer.trace(item_id, "Update IO state for Motion IO Id: %s", item_id)
 
             if isinstance(my_io.state, MotionState):
                 if (len(data) >= 1) and (isinstance(data[0], int)):
@@ -163,7 +326,7 @@ class MotionController(BaseController):
                     self._logger.warning(
                         f"Status for Motion IO has an incorrect format: data={data}"
                     )
-                self._logger.debug(f"---> Motion New state: {my_io.state}")
+                self._tracer.trace(item_id, "---> Motion New state: %s", my_io.state)
             else:
                 self._logger.warning(
                     f"The IO state type of Motion IO is not the expected one, state type: {type(my_io.state)}"
@@ -204,7 +367,9 @@ class ContactController(BaseController):
             # Update the existing data with the changed keys/data
             previous_state = my_io.state
             data = event_data["data"]
-            self._logger.debug(f"Update IO state for CONTACT IO Id: {item_id}")
+            self._tracer.trace(
+                item_id, "Update IO state for CONTACT IO Id: %s", item_id
+            )
 
             if isinstance(my_io.state, bool):
                 if (len(data) >= 1) and (isinstance(data[0], int)):
@@ -217,7 +382,7 @@ class ContactController(BaseController):
                         f"Status for Motion IO has an incorrect format: data={data}"
                     )
 
-                self._logger.debug(f"---> Contact New state: {my_io.state}")
+                self._tracer.trace(item_id, "---> Contact New state: %s", my_io.state)
             else:
                 self._logger.warning(
                     f"The IO state type of Contact IO is not the expected one, state type: {type(my_io.state)}"
@@ -258,7 +423,7 @@ class TamperController(BaseController):
             # Update the existing data with the changed keys/data
             previous_state = my_io.state
             data = event_data["data"]
-            self._logger.debug(f"Update IO state for Tamper IO Id: {item_id}")
+            self._tracer.trace(item_id, "Update IO state for Tamper IO Id: %s", item_id)
 
             if isinstance(my_io.state, bool):
                 if (len(data) >= 1) and (isinstance(data[0], int)):
@@ -271,7 +436,7 @@ class TamperController(BaseController):
                         f"Status for Tamper IO has an incorrect format: data={data}"
                     )
 
-                self._logger.debug(f"---> Tamper New state: {my_io.state}")
+                self._tracer.trace(item_id, "---> Tamper New state: %s", my_io.state)
 
             else:
                 self._logger.warning(
@@ -314,7 +479,9 @@ class TemperatureController(BaseController):
             # Update the existing data with the changed keys/data
             previous_state = copy.deepcopy(my_io.state)
             data = event_data["data"]
-            self._logger.debug(f"Update IO state for Temperature IO Id: {item_id}")
+            self._tracer.trace(
+                item_id, "Update IO state for Temperature IO Id: %s", item_id
+            )
 
             if isinstance(my_io.state, float):
                 if (len(data) >= 1) and (isinstance(data[0], float)):
@@ -369,7 +536,7 @@ class TemperatureController(BaseController):
                     f"The IO state type of Temperature IO is not the expected one, state type: {type(my_io.state)}"
                 )
 
-            self._logger.debug(f"---> Temp. Sensor New state: {my_io.state}")
+            self._tracer.trace(item_id, "---> Temp. Sensor New state: %s", my_io.state)
 
             if my_io.state == previous_state:
                 # Propagate the event only if it has had an update
@@ -378,7 +545,7 @@ class TemperatureController(BaseController):
         await super()._handle_event(event_type, event_data)
 
 
-class AnalogController(BaseController):
+class AnalogController(FilteredSensorController):
     """Controller holding and managing Domintell resources of type `analog`."""
 
     item_type = ResourceTypes.ANALOG
@@ -407,12 +574,14 @@ class AnalogController(BaseController):
             # Update the existing data with the changed keys/data
             previous_state = my_io.state
             data = event_data["data"]
-            self._logger.debug(f"Update IO state for Analog IO Id: {item_id}")
+            self._tracer.trace(item_id, "Update IO state for Analog IO Id: %s", item_id)
 
             if isinstance(my_io.state, int):
                 if (len(data) >= 1) and (isinstance(data[0], int)):
                     my_io.state = data[0]
-                    self._logger.debug(f"---> Analog New state: {my_io.state}")
+                    self._tracer.trace(
+                        item_id, "---> Analog New state: %s", my_io.state
+                    )
                 else:
                     self._logger.warning(
                         f"Status for Analog IO has an incorrect format: data={data}"
@@ -420,7 +589,9 @@ class AnalogController(BaseController):
             elif isinstance(my_io.state, float):
                 if (len(data) >= 1) and (isinstance(data[0], float)):
                     my_io.state = data[0]
-                    self._logger.debug(f"---> Analog New state: {my_io.state}")
+                    self._tracer.trace(
+                        item_id, "---> Analog New state: %s", my_io.state
+                    )
                 else:
                     self._logger.warning(
                         f"Status for Analog IO has an incorrect format: data={data}"
@@ -465,12 +636,16 @@ class IlluminanceController(BaseController):
             # Update the existing data with the changed keys/data
             previous_state = my_io.state
             data = event_data["data"]
-            self._logger.debug(f"Update IO state for Illuminance IO Id: {item_id}")
+            self._tracer.trace(
+                item_id, "Update IO state for Illuminance IO Id: %s", item_id
+            )
 
             if isinstance(my_io.state, int):
                 if (len(data) >= 1) and (isinstance(data[0], int)):
                     my_io.state = data[0]
-                    self._logger.debug(f"---> Illuminance New state: {my_io.state}")
+                    self._tracer.trace(
+                        item_id, "---> Illuminance New state: %s", my_io.state
+                    )
                 else:
                     self._logger.warning(
                         f"Status for Illuminance IO has an incorrect format: data={data}"
@@ -487,7 +662,7 @@ class IlluminanceController(BaseController):
         await super()._handle_event(event_type, event_data)
 
 
-class HumidityController(BaseController):
+class HumidityController(FilteredSensorController):
     """Controller holding and managing Domintell resources of type `humidity`."""
 
     item_type = ResourceTypes.HUMIDITY
@@ -515,12 +690,16 @@ class HumidityController(BaseController):
             # Update the existing data with the changed keys/data
             previous_state = my_io.state
             data = event_data["data"]
-            self._logger.debug(f"Update IO state for Humidity IO Id: {item_id}")
+            self._tracer.trace(
+                item_id, "Update IO state for Humidity IO Id: %s", item_id
+            )
 
             if isinstance(my_io.state, float):
                 if (len(data) >= 1) and (isinstance(data[0], float)):
                     my_io.state = data[0]
-                    self._logger.debug(f"---> Humidity New state: {my_io.state}")
+                    self._tracer.trace(
+                        item_id, "---> Humidity New state: %s", my_io.state
+                    )
                 else:
                     self._logger.warning(
                         f"Status for HumidityIO has an incorrect format: data={data}"
@@ -537,7 +716,7 @@ class HumidityController(BaseController):
         await super()._handle_event(event_type, event_data)
 
 
-class PressureController(BaseController):
+class PressureController(FilteredSensorController):
     """Controller holding and managing Domintell resources of type `pressure`."""
 
     item_type = ResourceTypes.PRESSURE
@@ -565,12 +744,16 @@ class PressureController(BaseController):
             # Update the existing data with the changed keys/data
             previous_state = my_io.state
             data = event_data["data"]
-            self._logger.debug(f"Update IO state for Pressure IO Id: {item_id}")
+            self._tracer.trace(
+                item_id, "Update IO state for Pressure IO Id: %s", item_id
+            )
 
             if isinstance(my_io.state, float):
                 if (len(data) >= 1) and (isinstance(data[0], float)):
                     my_io.state = data[0]
-                    self._logger.debug(f"---> Pressure New state: {my_io.state}")
+                    self._tracer.trace(
+                        item_id, "---> Pressure New state: %s", my_io.state
+                    )
                 else:
                     self._logger.warning(
                         f"Status for PressureIO has an incorrect format: data={data}"
@@ -587,7 +770,7 @@ class PressureController(BaseController):
         await super()._handle_event(event_type, event_data)
 
 
-class CO2Controller(BaseController):
+class CO2Controller(FilteredSensorController):
     """Controller holding and managing Domintell resources of type `co2`."""
 
     item_type = ResourceTypes.CO2
@@ -615,12 +798,12 @@ class CO2Controller(BaseController):
             # Update the existing data with the changed keys/data
             previous_state = my_io.state
             data = event_data["data"]
-            self._logger.debug(f"Update IO state for CO2 IO Id: {item_id}")
+            self._tracer.trace(item_id, "Update IO state for CO2 IO Id: %s", item_id)
 
             if isinstance(my_io.state, float):
                 if (len(data) >= 1) and (isinstance(data[0], float)):
                     my_io.state = data[0]
-                    self._logger.debug(f"---> CO2 New state: {my_io.state}")
+                    self._tracer.trace(item_id, "---> CO2 New state: %s", my_io.state)
                 else:
                     self._logger.warning(
                         f"Status for CO2 IO has an incorrect format: data={data}"
@@ -637,7 +820,7 @@ class CO2Controller(BaseController):
         await super()._handle_event(event_type, event_data)
 
 
-class WindController(BaseController):
+class WindController(FilteredSensorController):
     """Controller holding and managing Domintell resources of type `wind`."""
 
     item_type = ResourceTypes.WIND
@@ -665,7 +848,7 @@ class WindController(BaseController):
             # Update the existing data with the changed keys/data
             previous_state = copy.deepcopy(my_io.state)
             data = event_data["data"]
-            self._logger.debug(f"Update IO state for Wind IO Id: {item_id}")
+            self._tracer.trace(item_id, "Update IO state for Wind IO Id: %s", item_id)
 
             if isinstance(my_io.state, WindState):
                 if (
@@ -679,7 +862,7 @@ class WindController(BaseController):
 
                     wind_direction = WindDirection(data[1])
                     my_io.state = WindState(wind_speed, wind_direction)
-                    self._logger.debug(f"---> Wind New state: {my_io.state}")
+                    self._tracer.trace(item_id, "---> Wind New state: %s", my_io.state)
                 else:
                     self._logger.warning(
                         f"Status for WindIO has an incorrect format: data={data}"
@@ -696,7 +879,7 @@ class WindController(BaseController):
         await super()._handle_event(event_type, event_data)
 
 
-class PowerSupplyController(BaseController):
+class PowerSupplyController(FilteredSensorController):
     """Controller holding and managing Domintell resources of type `power_supply`."""
 
     item_type = ResourceTypes.POWER_SUPPLY
@@ -724,7 +907,9 @@ class PowerSupplyController(BaseController):
             # Update the existing data with the changed keys/data
             previous_state = copy.deepcopy(my_io.state)
             data = event_data["data"]
-            self._logger.debug(f"Update IO state for Power supply IO Id: {item_id}")
+            self._tracer.trace(
+                item_id, "Update IO state for Power supply IO Id: %s", item_id
+            )
 
             if isinstance(my_io.state, PowerSupplyState):
                 if (
@@ -737,7 +922,9 @@ class PowerSupplyController(BaseController):
                     voltage = float(event_data["data"][1])
                     temperature = float(event_data["data"][2])
                     my_io.state = PowerSupplyState(load, voltage, temperature)
-                    self._logger.debug(f"---> Power supply New state: {my_io.state}")
+                    self._tracer.trace(
+                        item_id, "---> Power supply New state: %s", my_io.state
+                    )
                 else:
                     self._logger.warning(
                         f"Status for PowerSupplyIO has an incorrect format: data={data}"
@@ -754,11 +941,43 @@ class PowerSupplyController(BaseController):
         await super()._handle_event(event_type, event_data)
 
 
-class ElectricityController(BaseController):
+class ElectricityController(FilteredSensorController):
     """Controller holding and managing Domintell resources of type `electricity`."""
 
     item_type = ResourceTypes.ELECTRICITY
 
+    def __init__(self, gateway) -> None:
+        super().__init__(gateway)
+        self._aggregation_window = 0.0
+        self._aggregation_buckets = DEFAULT_WINDOW_BUCKETS
+        self._aggregators: dict[str, ElectricityAggregator] = {}
+
+    @property
+    def aggregation_window(self) -> float:
+        return self._aggregation_window
+
+    def set_aggregation(
+        self, window: float, buckets: int = DEFAULT_WINDOW_BUCKETS
+    ) -> None:
+        """Enable rolling aggregation of the electricity meters.
+
+        Parameters:
+            - `window` - Duration of the rolling window in seconds, 0 disables the aggregation.
+            - `buckets` - Number of time buckets per window, its resolution.
+        """
+        self._aggregation_window = max(float(window), 0.0)
+        self._aggregation_buckets = buckets
+        self._aggregators.clear()
+        if self._aggregation_window > 0:
+            for item_id in self._items:
+                self._aggregators[item_id] = ElectricityAggregator(
+                    self._aggregation_window, self._aggregation_buckets
+                )
+
+    def get_aggregator(self, id: str) -> ElectricityAggregator | None:
+        """Get the rolling aggregator of an electricity IO."""
+        return self._aggregators.get(id)
+
     async def _handle_event(
         self, event_type: EventType, event_data: dict | None
     ) -> None:
@@ -768,7 +987,14 @@ class ElectricityController(BaseController):
 
         item_id = event_data["id"]
 
-        if event_type == EventType.RESOURCE_UPDATED:
+        if event_type == EventType.RESOURCE_ADDED:
+            if self._aggregation_window > 0:
+                self._aggregators[item_id] = ElectricityAggregator(
+                    self._aggregation_window, self._aggregation_buckets
+                )
+        elif event_type == EventType.RESOURCE_DELETED:
+            self._aggregators.pop(item_id, None)
+        elif event_type == EventType.RESOURCE_UPDATED:
             # Existing item updated
             my_io = self.get_io(item_id)
             if my_io is None:
@@ -782,12 +1008,20 @@ class ElectricityController(BaseController):
             # Update the existing data with the changed keys/data
             previous_state = copy.deepcopy(my_io.state)
             data = event_data["data"]
-            self._logger.debug(f"Update IO state for Electricity IO Id: {item_id}")
+            self._tracer.trace(
+                item_id, "Update IO state for Electricity IO Id: %s", item_id
+            )
 
             if isinstance(my_io.state, ElectricityState):
                 if len(data) == 28:
                     my_io.state = ElectricityState.from_list(data)
-                    self._logger.debug(f"---> Electricity New state: {my_io.state}")
+                    self._tracer.trace(
+                        item_id, "---> Electricity New state: %s", my_io.state
+                    )
+                    # Every raw frame feeds the aggregates, even when not published
+                    aggregator = self._aggregators.get(item_id)
+                    if aggregator is not None:
+                        aggregator.add(my_io.state)
                 else:
                     self._logger.warning(
                         f"Status for ElectricityIO has an incorrect format: data={data}"
@@ -828,6 +1062,32 @@ class SensorsController(BaseController):
 
         super().__init__(gateway)
 
+    def set_filter(
+        self,
+        min_interval: float = 0.0,
+        deadband: float = 0.0,
+        deadband_percent: float = 0.0,
+    ) -> None:
+        """Set throttling and deadband of the measurement sensors.
+
+        Parameters:
+            - `min_interval` - Minimum time in seconds between two published updates of an IO.
+            - `deadband` - Minimum absolute change of a value to publish an update.
+            - `deadband_percent` - Minimum change of a value, in percent of the last published one.
+        """
+        for controller in (
+            self.analog,
+            self.humidity,
+            self.pressure,
+            self.carbon_dioxide,
+            self.wind,
+            self.power_supply,
+            self.electricity,
+        ):
+            controller.set_filter(
+                SensorFilter(min_interval, deadband, deadband_percent)
+            )
+
     async def initialize(self) -> None:
         """Initialize sensors IO."""
 
@@ -33,13 +33,15 @@ class SwitchesController(BaseController):
             # Update the existing data with the changed keys/data
             previous_state = my_io.state
             data = event_data["data"]
-            self._logger.debug(f"Update IO state for SWITCH IO Id: {item_id}")
+            self._tracer.trace(item_id, "Update IO state for SWITCH IO Id: %s", item_id)
 
             if isinstance(my_io.state, bool):
                 # Note: status.data[0] must be an integer
                 if (len(data) >= 1) and (isinstance(data[0], int)):
                     my_io.state = bool(data[0])
-                    self._logger.debug(f"---> Switch New state: {my_io.state}")
+                    self._tracer.trace(
+                        item_id, "---> Switch New state: %s", my_io.state
+                    )
                 else:
                     self._logger.warning(
                         f"Status for TorIO has an incorrect format: data={data}"
@@ -84,7 +86,9 @@ class MomentarySwitchesController(BaseController):
             # Update the existing data with the changed keys/data
             previous_state = my_io.state
             data = event_data["data"]
-            self._logger.debug(f"Update IO state for Momentary Switch IO Id: {item_id}")
+            self._tracer.trace(
+                item_id, "Update IO state for Momentary Switch IO Id: %s", item_id
+            )
 
             if isinstance(my_io.state, bool):
                 # Note: status.data[0] must be an integer
@@ -33,13 +33,17 @@ class VariablesController(BaseController):
             # Update the existing data with the changed keys/data
             previous_state = my_io.state
             data = event_data["data"]
-            self._logger.debug(f"Update IO state for Variable IO Id: {item_id}")
+            self._tracer.trace(
+                item_id, "Update IO state for Variable IO Id: %s", item_id
+            )
 
             if isinstance(my_io.state, int):
                 # Note: status.data[0] must be an integer
                 if (len(data) >= 1) and (isinstance(data[0], int)):
                     my_io.state = data[0]
-                    self._logger.debug(f"---> Variable New state: {my_io.state}")
+                    self._tracer.trace(
+                        item_id, "---> Variable New state: %s", my_io.state
+                    )
                 else:
                     self._logger.warning(
                         f"Status for Variable IO has an incorrect format: data={data}"
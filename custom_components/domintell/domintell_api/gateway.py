@@ -2,10 +2,12 @@ import asyncio
 import time
 from collections.abc import Callable
 import logging
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from .const import get_module_type_num_by_model
 from .websocket import DomintellClient
+from .metrics import Metrics
+from .trace import Tracer
 from .lightprotocol import LpAppInfo
 from .controllers.events import EventCallBackType, EventType
 from .controllers.modules import ModulesController
@@ -19,6 +21,9 @@ from .controllers.variables import VariablesController
 from .controllers.groups import GroupsController
 from .controllers.events import EventsController
 
+if TYPE_CHECKING:
+    from .hub import DomintellHub
+
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -97,14 +102,22 @@ class DomintellGateway:
     """Control Domintell installation with LightProtocol API."""
 
     def __init__(
-        self, host, username: str | None = None, password: str | None = None
+        self,
+        host,
+        username: str | None = None,
+        password: str | None = None,
+        port: int = 17481,
+        use_ssl: bool = True,
     ) -> None:
         self._logger = logging.getLogger(f"{__package__}[{host}]")
         self._host = host
-        self._port: int = 17481
+        self._port: int = port
+        self._username = username
+        self._password = password
         self._client: DomintellClient = DomintellClient(
-            self._host, self._port, username, password
+            self._host, self._port, username, password, use_ssl
         )
+        self._hub: DomintellHub | None = None
         self._app: LpAppInfo | None = None
         self._module_gateway: Any | None = None
         self._gateway_info: dict | None = None
@@ -131,6 +144,16 @@ class DomintellGateway:
     def is_connected(self) -> bool:
         return self._client.is_connected
 
+    @property
+    def metrics(self) -> Metrics:
+        """Return the runtime metrics of the connection."""
+        return self._client.metrics
+
+    @property
+    def tracer(self) -> Tracer:
+        """Return the debug tracer of the IOs, see Tracer.set_filter."""
+        return self._client.tracer
+
     @property
     def gateway_id(self) -> str | None:
         """Return the ID of the gateway we're currently connected to."""
@@ -231,7 +254,9 @@ class DomintellGateway:
 
         # Subscribe to connection state event
         self._events.subscribe(
-            self._handle_connect_event, (EventType.RECONNECTED, EventType.DISCONNECTED)
+            self._handle_connect_event,
+            (EventType.RECONNECTED, EventType.DISCONNECTED),
+            inline=True,
         )
 
         # Initialize the connection with the gateway
@@ -247,22 +272,69 @@ class DomintellGateway:
             if time.time() - start_time > 5:
                 return
 
+    @property
+    def hub(self) -> "DomintellHub | None":
+        """Return the local hub sharing this connection, if started."""
+        return self._hub
+
+    async def start_hub(
+        self, port: int | None = None, host: str = "127.0.0.1", **kwargs
+    ) -> "DomintellHub":
+        """Share the gateway session with local clients.
+
+        The clients log in to the hub with the credentials of this gateway.
+        Without an SSL context (ssl_context=), the hub only listens locally.
+        """
+        # Only loaded when the hub is enabled
+        from .hub import DEFAULT_HUB_PORT, DomintellHub
+
+        if self._hub is None:
+            self._hub = DomintellHub(
+                self._client,
+                host,
+                DEFAULT_HUB_PORT if port is None else port,
+                self._username,
+                self._password,
+                **kwargs,
+            )
+        await self._hub.start()
+        return self._hub
+
+    def start_recording(self, path: str, **kwargs) -> None:
+        """Record the raw traffic with the gateway in a capture file."""
+        self._client.start_recording(path, **kwargs)
+
+    async def stop_recording(self) -> None:
+        await self._client.stop_recording()
+
     async def close(self) -> None:
         """Close connection and cleanup."""
 
+        if self._hub is not None:
+            await self._hub.stop()
+            self._hub = None
+
         await self._client.disconnect()
+        await self._client.stop_recording()
         await self.events.stop()
 
     async def _appinfo_handler(self, appinfo: str) -> None:
         """Initialize all controllers."""
 
-        self._logger.debug(f"APPINFO received: {appinfo}")
+        self._logger.debug("APPINFO received: %s", appinfo)
         # First line gives information about the DAP/configuration file
         # ie: "(PROG M 42.3 00/00/00 00h00 Rev=2 CP=UTF8) => MyHome Name :"
 
         try:
             # The gateway is already configured
             if self._initialized:
+                # Typically after a reconnection, nothing to update when the
+                # configuration is the same
+                if LpAppInfo.compute_digest(appinfo) == self._app.digest:
+                    self._logger.debug("APPINFO unchanged")
+                    await self.fetch_full_state()
+                    return
+
                 new_app = LpAppInfo(appinfo)
 
                 io_removed, io_added = get_changed_dictionaries(
@@ -283,7 +355,9 @@ class DomintellGateway:
                     await self._variables.update(io_removed, io_added)
                     await self._groups.update(io_removed, io_added)
 
-                    self._app = new_app
+                # Keep the new one even without io changes, for its digest
+                self._app = new_app
+                self._client.endpoints = new_app.endpoints
 
                 # Request current status of all IO
                 await self.fetch_full_state()
@@ -291,12 +365,13 @@ class DomintellGateway:
                 return
             else:
                 self._app = LpAppInfo(appinfo)
+                self._client.endpoints = self._app.endpoints
         except Exception as ex:
             self._logger.error(f"Error parsing appinfo : {ex}")
             return
 
-        self._logger.debug(f"Installation name: {self._app.name}")
-        self._logger.debug(f"Lightprotocol version: {self._app.lp_version}")
+        self._logger.debug("Installation name: %s", self._app.name)
+        self._logger.debug("Lightprotocol version: %s", self._app.lp_version)
         # self._logger.debug(f"IOs: {self._app.ios}")
 
         # Validate version
@@ -436,4 +511,13 @@ class DomintellGateway:
             last_events.append(item)
         result["events"] = last_events
 
+        # Add runtime metrics
+        metrics = self.metrics.as_dict()
+        metrics["event_queue_size"] = self._events.queue_depth
+        metrics["unchanged_status_lines"] = self._client.unchanged_status_count
+        result["metrics"] = metrics
+
+        # Add recorded IO states (only when history is enabled)
+        result["history"] = self._events.get_history()
+
         return result
@@ -0,0 +1,156 @@
+"""Per-IO history of the received states."""
+
+import math
+from array import array
+
+
+class IOHistory:
+    """Ring buffer of (timestamp, data) samples of one IO.
+
+    Samples are stored in two flat arrays of doubles, the data of a status
+    taking `width` consecutive slots. Text values (e.g. a wind direction) are
+    stored as an index in a small table of labels, other values which are not
+    numbers are stored as NaN and exported as None. The table of labels is
+    rebuilt from the samples still in the buffer when it grows past twice the
+    number of text values the buffer can hold.
+    """
+
+    __slots__ = (
+        "_capacity",
+        "_width",
+        "_times",
+        "_values",
+        "_start",
+        "_count",
+        "_text_columns",
+        "_labels",
+        "_label_index",
+        "_label_limit",
+    )
+
+    def __init__(self, capacity: int):
+        if capacity < 1:
+            raise ValueError("The history depth must be at least 1")
+
+        self._capacity = capacity
+        self._width = 0
+        self._times = array("d", bytes(8 * capacity))
+        self._values = array("d")
+        self._start = 0
+        self._count = 0
+        self._text_columns: tuple[bool, ...] = ()
+        self._labels: list[str] = []
+        self._label_index: dict[str, int] = {}
+        self._label_limit = 0
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _reset(self, data: list) -> None:
+        # (Re)build the layout of the buffer from the shape of a sample
+        self._width = len(data)
+        self._text_columns = tuple(isinstance(value, str) for value in data)
+        self._values = array("d", bytes(8 * self._capacity * self._width))
+        self._start = 0
+        self._count = 0
+        self._labels.clear()
+        self._label_index.clear()
+        self._label_limit = 2 * self._capacity * sum(self._text_columns)
+
+    def _compact_labels(self) -> None:
+        # Keep only the labels still referenced by the buffer
+        labels: list[str] = []
+        label_index: dict[str, int] = {}
+        width = self._width
+        for sample in range(self._count):
+            offset = ((self._start + sample) % self._capacity) * width
+            for column, text in enumerate(self._text_columns):
+                value = self._values[offset + column]
+                if not text or math.isnan(value):
+                    continue
+                label = self._labels[int(value)]
+                index = label_index.get(label)
+                if index is None:
+                    index = label_index[label] = len(labels)
+                    labels.append(label)
+                self._values[offset + column] = float(index)
+
+        self._labels = labels
+        self._label_index = label_index
+
+    def _encode(self, value, text: bool) -> float:
+        if text:
+            index = self._label_index.get(value)
+            if index is None:
+                index = len(self._labels)
+                self._labels.append(value)
+                self._label_index[value] = index
+            return float(index)
+        if isinstance(value, int | float):
+            return float(value)
+        return math.nan
+
+    def append(self, timestamp: float, data: list) -> None:
+        """Add a sample."""
+        if len(data) != self._width or any(
+            isinstance(value, str) != text
+            for value, text in zip(data, self._text_columns)
+        ):
+            self._reset(data)
+        elif self._label_limit and len(self._labels) >= self._label_limit:
+            self._compact_labels()
+
+        if self._count == self._capacity:
+            # Buffer full, overwrite the oldest sample
+            self._start = (self._start + 1) % self._capacity
+            self._count -= 1
+
+        index = (self._start + self._count) % self._capacity
+        self._times[index] = timestamp
+        offset = index * self._width
+        for column, value in enumerate(data):
+            self._values[offset + column] = self._encode(
+                value, self._text_columns[column]
+            )
+        self._count += 1
+
+    def clear(self) -> None:
+        self._start = 0
+        self._count = 0
+
+    def _decode(self, values) -> list:
+        result = []
+        for value, text in zip(values, self._text_columns):
+            if math.isnan(value):
+                result.append(None)
+            elif text:
+                result.append(self._labels[int(value)])
+            else:
+                result.append(value)
+        return result
+
+    def _ordered(self, buffer: array, width: int) -> list:
+        # Copy the used part of a buffer, oldest sample first
+        view = memoryview(buffer)
+        end = self._start + self._count
+        if end <= self._capacity:
+            return view[self._start * width : end * width].tolist()
+        return (
+            view[self._start * width : self._capacity * width].tolist()
+            + view[: (end - self._capacity) * width].tolist()
+        )
+
+    def export(self) -> list[tuple[float, list]]:
+        """Return the samples, oldest first."""
+        width = self._width
+        times = self._ordered(self._times, 1)
+        values = self._ordered(self._values, width)
+
+        return [
+            (timestamp, self._decode(values[i * width : (i + 1) * width]))
+            for i, timestamp in enumerate(times)
+        ]
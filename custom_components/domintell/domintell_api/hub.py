@@ -0,0 +1,316 @@
+"""Local hub sharing one gateway session between several clients."""
+
+import asyncio
+import ipaddress
+import logging
+import secrets
+import ssl
+from collections.abc import Callable
+
+import websockets
+
+from .const import MODULE_TYPES
+from .websocket import DomintellClient, hash_password
+
+DEFAULT_HUB_PORT = 17482
+DEFAULT_MAX_CLIENTS = 8
+# Frames waiting to be sent to a client before it is considered too slow
+DEFAULT_CLIENT_QUEUE_SIZE = 1000
+# Seconds given to a client to log in
+LOGIN_TIMEOUT = 10.0
+
+# Control messages handled by the hub itself, never sent to the gateway
+HUB_PREFIX = "HUB:"
+HUB_SUBSCRIBE = "HUB:SUBSCRIBE="
+HUB_UNSUBSCRIBE = "HUB:UNSUBSCRIBE"
+
+# Requests of the clients forwarded to the gateway, besides the IO commands.
+# Session control (LOGINPSW@, REQUESTSALT@, LOGOUT, ...) is never forwarded.
+FORWARDED_REQUESTS = frozenset({"APPINFO", "GETLPVER", "DISCOVER", "PING"})
+
+# Requests whose reply is only sent to the clients which asked for it
+REPLY_MATCHERS: dict[str, Callable[[str], bool]] = {
+    "APPINFO": lambda message: message.startswith("APPINFO"),
+    "GETLPVER": lambda message: message.startswith("INFO:LPVER="),
+    "DISCOVER": lambda message: message.startswith("INFO:I AM A"),
+}
+
+
+def is_forwarded(request: str) -> bool:
+    """Check that every line of a client frame is a request or an IO command."""
+    lines = [line.strip() for line in request.splitlines() if line.strip()]
+    return bool(lines) and all(
+        line in FORWARDED_REQUESTS or line[:3] in MODULE_TYPES for line in lines
+    )
+
+
+def is_loopback(host: str) -> bool:
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+class HubSession:
+    """A client connected to the hub."""
+
+    __slots__ = ("connection", "name", "subscriptions", "outbox")
+
+    def __init__(self, connection, queue_size: int) -> None:
+        self.connection = connection
+        self.name = "{}:{}".format(*connection.remote_address[:2])
+        # Prefixes of the status lines sent to the client (None = all)
+        self.subscriptions: tuple[str, ...] | None = None
+        self.outbox: asyncio.Queue[str] = asyncio.Queue(queue_size)
+
+    def filter_status(self, lines: list[str]) -> list[str]:
+        if self.subscriptions is None:
+            return lines
+        return [line for line in lines if line.startswith(self.subscriptions)]
+
+
+class DomintellHub:
+    """Multiplex one authenticated gateway session between local clients.
+
+    Clients connect to the hub as they would to the gateway (same login
+    handshake, checked against the credentials given to the hub). Their IO
+    commands and info requests are forwarded on the shared session, session
+    control requests are rejected. The hub only listens on the loopback
+    interface, unless given an SSL context. The status lines received
+    from the gateway are fanned out to every client, optionally restricted to
+    the prefixes set with `HUB:SUBSCRIBE=<prefix>,<prefix>`. Replies to
+    APPINFO, GETLPVER and DISCOVER are only sent to the clients which asked.
+    """
+
+    def __init__(
+        self,
+        client: DomintellClient,
+        host: str = "127.0.0.1",
+        port: int = DEFAULT_HUB_PORT,
+        username: str | None = None,
+        password: str | None = None,
+        max_clients: int = DEFAULT_MAX_CLIENTS,
+        ssl_context: ssl.SSLContext | None = None,
+    ) -> None:
+        self._logger = logging.getLogger(f"{__package__}.hub[{port}]")
+        self._client = client
+        self._host = host
+        self._port = port
+        self._username = username or ""
+        self._password = password or ""
+        self._max_clients = max_clients
+        self._ssl_context = ssl_context
+        self._salt = str(secrets.randbelow(10**10))
+        self._server = None
+        self._remove_listener: Callable[[], None] | None = None
+        self._sessions: set[HubSession] = set()
+        self._tasks: set[asyncio.Task] = set()
+        # Connections, logged in or not
+        self._connections = 0
+        self._pending_replies: dict[str, set[HubSession]] = {
+            request: set() for request in REPLY_MATCHERS
+        }
+
+    @property
+    def port(self) -> int:
+        return self._port
+
+    @property
+    def is_running(self) -> bool:
+        return self._server is not None
+
+    @property
+    def clients(self) -> list[str]:
+        """Return the address of the connected clients."""
+        return [session.name for session in self._sessions]
+
+    async def start(self) -> None:
+        """Start listening for local clients."""
+        if self._server is not None:
+            return
+
+        if self._ssl_context is None and not is_loopback(self._host):
+            # The gateway session is encrypted, do not expose it in clear
+            raise ValueError(
+                f"The hub only listens on {self._host} with an SSL context"
+            )
+
+        self._remove_listener = self._client.add_raw_listener(self._on_upstream)
+        self._server = await websockets.serve(
+            self._handle_connection, self._host, self._port, ssl=self._ssl_context
+        )
+        if self._port == 0:
+            # Port chosen by the system
+            self._port = self._server.sockets[0].getsockname()[1]
+        self._logger.info(f"Hub listening on {self._host}:{self._port}")
+
+    async def stop(self) -> None:
+        """Disconnect the clients and stop listening."""
+        if self._server is None:
+            return
+
+        if self._remove_listener is not None:
+            self._remove_listener()
+            self._remove_listener = None
+
+        self._server.close()
+        await self._server.wait_closed()
+        self._server = None
+        self._sessions.clear()
+
+    async def _login(self, connection) -> bool:
+        """Run the gateway login handshake with a new client."""
+        if self._username == "" and self._password == "":
+            await connection.send("INFO:Session opened:INFO")
+            return True
+
+        nonce = str(secrets.randbelow(10**19))
+        await connection.send(f"INFO:Waiting for LOGINPSW:NONCE={nonce}:INFO")
+
+        salt = ""
+        while True:
+            message = (await connection.recv()).strip()
+
+            if message.startswith("REQUESTSALT@"):
+                username = message[len("REQUESTSALT@") :]
+                salt = self._salt if self._password != "" else ""
+                await connection.send(
+                    f"INFO:REQUESTSALT:USERNAME={username}:NONCE={nonce}:SALT={salt}:INFO"
+                )
+            elif message.startswith("LOGINPSW@"):
+                username, _, token = message[len("LOGINPSW@") :].partition(":")
+                expected = hash_password(self._password, salt, nonce)
+                if username == self._username and secrets.compare_digest(
+                    token, expected
+                ):
+                    await connection.send("INFO:Session opened:INFO")
+                    return True
+                await connection.send("ERROR:Invalid credentials:ERROR")
+                return False
+            else:
+                await connection.send("ERROR:Invalid command:ERROR")
+                return False
+
+    async def _handle_connection(self, connection) -> None:
+        # Clients still logging in count, so they cannot exceed the limit
+        if self._connections >= self._max_clients:
+            await connection.send("ERROR:Max connected clients reached:ERROR")
+            return
+
+        self._connections += 1
+        try:
+            await self._serve(connection)
+        finally:
+            self._connections -= 1
+
+    async def _serve(self, connection) -> None:
+        try:
+            async with asyncio.timeout(LOGIN_TIMEOUT):
+                if not await self._login(connection):
+                    return
+        except websockets.ConnectionClosed:
+            return
+        except TimeoutError:
+            self._logger.warning(
+                "Client {}:{} did not log in on time".format(
+                    *connection.remote_address[:2]
+                )
+            )
+            await connection.close()
+            return
+
+        session = HubSession(connection, DEFAULT_CLIENT_QUEUE_SIZE)
+        self._sessions.add(session)
+        self._logger.info(f"Client {session.name} connected")
+        writer = asyncio.create_task(self._write_to(session))
+
+        try:
+            async for message in connection:
+                if isinstance(message, str):
+                    await self._on_downstream(session, message)
+        except websockets.ConnectionClosed:
+            pass
+        finally:
+            writer.cancel()
+            self._sessions.discard(session)
+            for sessions in self._pending_replies.values():
+                sessions.discard(session)
+            self._logger.info(f"Client {session.name} disconnected")
+
+    async def _write_to(self, session: HubSession) -> None:
+        while True:
+            message = await session.outbox.get()
+            await session.connection.send(message)
+
+    def _push(self, session: HubSession, message: str) -> None:
+        try:
+            session.outbox.put_nowait(message)
+        except asyncio.QueueFull:
+            # The client does not keep up, drop it rather than the whole hub
+            self._logger.warning(f"Client {session.name} is too slow, disconnecting")
+            self._sessions.discard(session)
+            task = asyncio.create_task(session.connection.close())
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _on_downstream(self, session: HubSession, message: str) -> None:
+        """Handle a message received from a client."""
+        request = message.strip()
+
+        if request.startswith(HUB_PREFIX):
+            if request.startswith(HUB_SUBSCRIBE):
+                prefixes = tuple(
+                    prefix for prefix in request[len(HUB_SUBSCRIBE) :].split(",") if prefix
+                )
+                session.subscriptions = prefixes or None
+            elif request == HUB_UNSUBSCRIBE:
+                session.subscriptions = None
+            else:
+                self._push(session, "ERROR:Invalid command:ERROR")
+                return
+            self._push(session, "INFO:HUB:SUBSCRIBED:INFO")
+            return
+
+        if request == "HELLO":
+            # Keep alive of the client, the upstream session has its own
+            return
+
+        if not is_forwarded(request):
+            self._push(session, "ERROR:Invalid command:ERROR")
+            return
+
+        if request in self._pending_replies:
+            self._pending_replies[request].add(session)
+
+        await self._client.send_message(message)
+
+    def _on_upstream(self, message: str) -> None:
+        """Fan out a frame received from the gateway."""
+        if not self._sessions:
+            return
+
+        for request, matcher in REPLY_MATCHERS.items():
+            if matcher(message):
+                sessions = self._pending_replies[request]
+                for session in sessions:
+                    self._push(session, message)
+                sessions.clear()
+                return
+
+        if message.startswith(("INFO:", "ERROR:")):
+            for session in list(self._sessions):
+                self._push(session, message)
+            return
+
+        lines = None
+        for session in list(self._sessions):
+            if session.subscriptions is None:
+                self._push(session, message)
+                continue
+            if lines is None:
+                lines = message.splitlines()
+            selected = session.filter_status(lines)
+            if selected:
+                self._push(session, "\r\n".join(selected))
@@ -1,7 +1,6 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 import inspect
-import types
 from enum import Enum, StrEnum
 from .const import IO_TYPES_INT, IO_TYPES_STRING
 from .lightprotocol import LpCommand, construct_endpoint_id
@@ -271,6 +270,13 @@ class LightColorMode(StrEnum):
     WHITE = "white"
 
 
+# Color mode sets shared by all light IOs (read-only)
+COLOR_MODES_ONOFF = frozenset({LightColorMode.ONOFF})
+COLOR_MODES_BRIGHTNESS = frozenset({LightColorMode.ONOFF, LightColorMode.BRIGHTNESS})
+COLOR_MODES_RGB = COLOR_MODES_BRIGHTNESS | {LightColorMode.RGB}
+COLOR_MODES_RGBW = COLOR_MODES_BRIGHTNESS | {LightColorMode.RGBW}
+
+
 class LightType(StrEnum):
     """Possible light types."""
 
@@ -928,7 +934,7 @@ class DiBusGwInfoState:
         return f"DiBusGwInfoState(version={self.version}, online={self.online}, state={self.state}, description={self.description})"
 
 
-@dataclass
+@dataclass(slots=True)
 class BaseIO:
     """Domintell base io representation."""
 
@@ -946,6 +952,10 @@ class BaseIO:
     sw_version: str | None = None
     extra_info: list[str] | None = None
 
+    # Set by each io type, not part of the io description
+    _gateway: Any = field(default=None, init=False, repr=False, compare=False)
+    _state: Any = field(default=None, init=False, repr=False, compare=False)
+
     # async def _send_command(self, cmd: str) -> None:
     #     command_message = LpCommand(self.id, cmd)
     #     await self._gateway._client.send_command(command_message)
@@ -967,6 +977,8 @@ class BaseIO:
 class SceneIO(BaseIO):
     """Domintell SceneIO reprensentation."""
 
+    __slots__ = ()
+
     def __init__(self, gateway, **kwargs) -> None:
         kwargs["io_type"] = IO_TYPES_INT.get("TypeIoNotHandled", 0)
 
@@ -993,6 +1005,8 @@ class SceneIO(BaseIO):
 class TorIO(BaseIO):
     """Domintell TorIO reprensentation."""
 
+    __slots__ = ("_color_mode",)
+
     def __init__(self, gateway, **kwargs) -> None:
         kwargs["io_type"] = IO_TYPES_INT.get("TypeTorIo", 1)
 
@@ -1003,9 +1017,7 @@ class TorIO(BaseIO):
         super().__init__(**kwargs)
         self._gateway = gateway
         self._state: bool = False
-        self._color_mode: set[LightColorMode] = {
-            LightColorMode.ONOFF,
-        }
+        self._color_mode: frozenset[LightColorMode] = COLOR_MODES_ONOFF
 
     @property
     def color_mode(self) -> LightColorMode:
@@ -1042,6 +1054,8 @@ class TorIO(BaseIO):
 class TorBasicTempoIO(BaseIO):
     """Domintell TorBasicTempoIO reprensentation."""
 
+    __slots__ = ()
+
     def __init__(self, gateway, **kwargs) -> None:
         kwargs["io_type"] = IO_TYPES_INT.get("TypeTorBasicTempoIO", 52)
 
@@ -1081,6 +1095,8 @@ class TorBasicTempoIO(BaseIO):
 class InputTriggerIO(BaseIO):
     """Domintell InputTriggerIO reprensentation."""
 
+    __slots__ = ()
+
     def __init__(self, gateway, **kwargs) -> None:
         kwargs["io_type"] = IO_TYPES_INT.get("TypeInputTriggerIO", 53)
 
@@ -1125,6 +1141,8 @@ class InputTriggerIO(BaseIO):
 class InputIO(BaseIO):
     """domintell InputIO reprensentation."""
 
+    __slots__ = ()
+
     def __init__(self, gateway, **kwargs) -> None:
         kwargs["io_type"] = IO_TYPES_INT.get("TypeInputIo", 2)
 
@@ -1173,6 +1191,8 @@ class InputIO(BaseIO):
 class TrvIO(BaseIO):
     """domintell TrvIO reprensentation."""
 
+    __slots__ = ()
+
     def __init__(self, gateway, **kwargs) -> None:
         kwargs["io_type"] = IO_TYPES_INT.get("TypeTrvIo", 6)
 
@@ -1212,6 +1232,8 @@ class TrvIO(BaseIO):
 class TrvBtIO(BaseIO):
     """domintell TrvBtIO reprensentation."""
 
+    __slots__ = ()
+
     def __init__(self, gateway, **kwargs) -> None:
         kwargs["io_type"] = IO_TYPES_INT.get("TypeTrvBtIo", 7)
 
@@ -1251,6 +1273,8 @@ class TrvBtIO(BaseIO):
 class LedIO(BaseIO):
     """Domintell LedIO reprensentation."""
 
+    __slots__ = ("_color_mode",)
+
     def __init__(self, gateway, **kwargs) -> None:
         kwargs["io_type"] = IO_TYPES_INT.get("TypeLedIo", 10)
 
@@ -1261,9 +1285,7 @@ class LedIO(BaseIO):
         super().__init__(**kwargs)
         self._gateway = gateway
         self._state: bool = False
-        self._color_mode: set[LightColorMode] = {
-            LightColorMode.ONOFF,
-        }
+        self._color_mode: frozenset[LightColorMode] = COLOR_MODES_ONOFF
 
     @property
     def color_mode(self) -> LightColorMode:
@@ -1300,6 +1322,8 @@ class LedIO(BaseIO):
 class Led8cIO(BaseIO):
     """Domintell Led8cIO reprensentation."""
 
+    __slots__ = ("_color_mode",)
+
     def __init__(self, gateway, **kwargs) -> None:
         kwargs["io_type"] = IO_TYPES_INT.get("TypeLed8cIo", 15)
 
@@ -1310,9 +1334,7 @@ class Led8cIO(BaseIO):
         super().__init__(**kwargs)
         self._gateway = gateway
         self._state: bool = False
-        self._color_mode: set[LightColorMode] = {
-            LightColorMode.ONOFF,
-        }
+        self._color_mode: frozenset[LightColorMode] = COLOR_MODES_ONOFF
 
     @property
     def color_mode(self) -> LightColorMode:
@@ -1349,6 +1371,8 @@ class Led8cIO(BaseIO):
 class LedRgbIo(BaseIO):
     """Domintell LedRgbIo reprensentation."""
 
+    __slots__ = ("_color_mode",)
+
     def __init__(self, gateway, **kwargs) -> None:
         kwargs["io_type"] = IO_TYPES_INT.get("TypeLedRgbIo", 60)
 
@@ -1359,9 +1383,7 @@ class LedRgbIo(BaseIO):
         super().__init__(**kwargs)
         self._gateway = gateway
         self._state: bool = False
-        self._color_mode: set[LightColorMode] = {
-            LightColorMode.ONOFF,
-        }
+        self._color_mode: frozenset[LightColorMode] = COLOR_MODES_ONOFF
 
     @property
     def color_mode(self) -> LightColorMode:
@@ -1398,6 +1420,8 @@ class LedRgbIo(BaseIO):
 class PblcdIO(BaseIO):
     """Domintell PblcdIO reprensentation."""
 
+    __slots__ = ("_color_mode",)
+
     def __init__(self, gateway, **kwargs) -> None:
         kwargs["io_type"] = IO_TYPES_INT.get("TypePblcdIo", 20)
 
@@ -1408,9 +1432,7 @@ class PblcdIO(BaseIO):
         super().__init__(**kwargs)
         self._gateway = gateway
         self._state: bool = False
-        self._color_mode: set[LightColorMode] = {
-            LightColorMode.ONOFF,
-        }
+        self._color_mode: frozenset[LightColorMode] = COLOR_MODES_ONOFF
 
     @property
     def color_mode(self) -> LightColorMode:
@@ -1447,6 +1469,8 @@ class PblcdIO(BaseIO):
 class Out10VIO(BaseIO):
     """domintell Out10VIO reprensentation."""
 
+    __slots__ = ("_brightness_scale", "_color_mode")
+
     def __init__(self, gateway, **kwargs) -> None:
         kwargs["io_type"] = IO_TYPES_INT.get("TypeOut10VIo", 23)
 
@@ -1458,10 +1482,7 @@ class Out10VIO(BaseIO):
         self._gateway = gateway
         self._brightness_scale: tuple = (1, 100)
         self._state: int = 0
-        self._color_mode: set[LightColorMode] = {
-            LightColorMode.ONOFF,
-            LightColorMode.BRIGHTNESS,
-        }
+        self._color_mode: frozenset[LightColorMode] = COLOR_MODES_BRIGHTNESS
 
     @property
     def color_mode(self) -> LightColorMode:
@@ -1516,6 +1537,8 @@ class Out10VIO(BaseIO):
 class AccessControlIO(BaseIO):
     """domintell AccessControlIO reprensentation."""
 
+    __slots__ = ()
+
     # Note: This IO type is not handled
 
     def __init__(self, gateway, **kwargs) -> None:
@@ -1541,6 +1564,8 @@ class AccessControlIO(BaseIO):
 class VideoIO(BaseIO):
     """domintell VideoIO reprensentation."""
 
+    __slots__ = ()
+
     def __init__(self, gateway, **kwargs) -> None:
         kwargs["io_type"] = IO_TYPES_INT.get("TypeVideoIo", 31)
 
@@ -1583,6 +1608,8 @@ class VideoIO(BaseIO):
 class CamIO(BaseIO):
     """Domintell CamIO reprensentation."""
 
+    __slots__ = ()
+
     # Note: This IO type is not handled
 
     def __init__(self, gateway, **kwargs) -> None:
@@ -1615,6 +1642,8 @@ class CamIO(BaseIO):
 class DimmerIO(BaseIO):
     """domintell DimmerIO reprensentation."""
 
+    __slots__ = ("_color_mode", "_brightness_scale")
+
     def __init__(self, gateway, **kwargs) -> None:
         kwargs["io_type"] = IO_TYPES_INT.get("TypeDimmerIo", 3)
 
@@ -1625,10 +1654,7 @@ class DimmerIO(BaseIO):
         super().__init__(**kwargs)
         self._gateway = gateway
         self._state: int = 0
-        self._color_mode: set[LightColorMode] = {
-            LightColorMode.ONOFF,
-            LightColorMode.BRIGHTNESS,
-        }
+        self._color_mode: frozenset[LightColorMode] = COLOR_MODES_BRIGHTNESS
 
         if self.module_type == "DIM":
             self._brightness_scale = (10, 100)
@@ -1688,6 +1714,8 @@ class DimmerIO(BaseIO):
 class LbIO(BaseIO):
     """domintell LbIO reprensentation."""
 
+    __slots__ = ("_brightness_scale", "_color_mode")
+
     def __init__(self, gateway, **kwargs) -> None:
         kwargs["io_type"] = IO_TYPES_INT.get("TypeLbIo", 42)
 
@@ -1699,10 +1727,7 @@ class LbIO(BaseIO):
         self._gateway = gateway
         self._brightness_scale: tuple = (1, 100)
         self._state: int = 0
-        self._color_mode: set[LightColorMode] = {
-            LightColorMode.ONOFF,
-            LightColorMode.BRIGHTNESS,
-        }
+        self._color_mode: frozenset[LightColorMode] = COLOR_MODES_BRIGHTNESS
 
     @property
     def color_mode(self) -> LightColorMode:
@@ -1751,6 +1776,14 @@ class LbIO(BaseIO):
 class DmxIO(BaseIO):
     """domintell DmxIO reprensentation."""
 
+    __slots__ = (
+        "_brightness_scale",
+        "_nbr_of_channels",
+        "_dmx_type",
+        "_color_mode",
+        "_configuration",
+    )
+
     def __init__(self, gateway, **kwargs) -> None:
         kwargs["io_type"] = IO_TYPES_INT.get("TypeDmxIo", 25)
 
@@ -1763,10 +1796,7 @@ class DmxIO(BaseIO):
         self._brightness_scale: tuple = (0, 255)
         self._nbr_of_channels = 0
         self._dmx_type = DmxType.UNKNOWN
-        self._color_mode: set[LightColorMode] = {
-            LightColorMode.ONOFF,
-            LightColorMode.BRIGHTNESS,
-        }
+        self._color_mode: frozenset[LightColorMode] = COLOR_MODES_BRIGHTNESS
 
         # Process configuration
         if self.module_type == "DMX":
@@ -1805,16 +1835,16 @@ class DmxIO(BaseIO):
         # Set state type and color mode
         if self._dmx_type == DmxType.RGBWI:
             self._state: ColorRGBWI = ColorRGBWI(0, 0, 0, 0, 0)
-            self._color_mode.add(LightColorMode.RGBW)
+            self._color_mode = COLOR_MODES_RGBW
         elif self._dmx_type == DmxType.RGBW:
             self._state: ColorRGBW = ColorRGBW(0, 0, 0, 0)
-            self._color_mode.add(LightColorMode.RGBW)
+            self._color_mode = COLOR_MODES_RGBW
         elif self._dmx_type == DmxType.RGBI:
             self._state: ColorRGBI = ColorRGBI(0, 0, 0, 0)
-            self._color_mode.add(LightColorMode.RGB)
+            self._color_mode = COLOR_MODES_RGB
         elif self._dmx_type == DmxType.RGB:
             self._state: ColorRGB = ColorRGB(0, 0, 0)
-            self._color_mode.add(LightColorMode.RGB)
+            self._color_mode = COLOR_MODES_RGB
         elif self._dmx_type == DmxType.SINGLE:
             self._state: int = 0
         else:
@@ -1914,6 +1944,8 @@ class DmxIO(BaseIO):
 class DaliIO(BaseIO):
     """domintell DaliIO reprensentation."""
 
+    __slots__ = ("_brightness_scale", "_light_type", "_color_mode")
+
     def __init__(self, gateway, **kwargs) -> None:
         kwargs["io_type"] = IO_TYPES_INT.get("TypeDali", 29)
 
@@ -1926,10 +1958,7 @@ class DaliIO(BaseIO):
         self._brightness_scale: tuple = (1, 100)
         self._state: int = 0
         self._light_type: str = self.extra_info[0]
-        self._color_mode: set[LightColorMode] = {
-            LightColorMode.ONOFF,
-            LightColorMode.BRIGHTNESS,
-        }
+        self._color_mode: frozenset[LightColorMode] = COLOR_MODES_BRIGHTNESS
 
     @property
     def color_mode(self) -> LightColorMode:
@@ -1982,6 +2011,8 @@ class DaliIO(BaseIO):
 class RgbwIO(BaseIO):
     """domintell RgbwIO reprensentation."""
 
+    __slots__ = ("_brightness_scale", "_color_mode")
+
     def __init__(self, gateway, **kwargs) -> None:
         kwargs["io_type"] = IO_TYPES_INT.get("TypeRgbwIo", 46)
 
@@ -1993,11 +2024,7 @@ class RgbwIO(BaseIO):
         self._gateway = gateway
         self._brightness_scale: tuple = (0, 255)
         self._state: ColorRGBW = ColorRGBW(0, 0, 0, 0)
-        self._color_mode: set[LightColorMode] = {
-            LightColorMode.ONOFF,
-            LightColorMode.BRIGHTNESS,
-            LightColorMode.RGBW,
-        }
+        self._color_mode: frozenset[LightColorMode] = COLOR_MODES_RGBW
 
     @property
     def color_mode(self) -> LightColorMode:
@@ -2067,6 +2094,8 @@ class RgbwIO(BaseIO):
 class In10VIO(BaseIO):
     """domintell In10VIO reprensentation."""
 
+    __slots__ = ("_configuration", "temperature", "liter", "meter", "cubic_meter")
+
     def __init__(self, gateway, **kwargs) -> None:
         kwargs["io_type"] = IO_TYPES_INT.get("TypeIn10VIo", 21)
 
@@ -2162,6 +2191,8 @@ class In10VIO(BaseIO):
 class GestureIO(BaseIO):
     """domintell GestureIO reprensentation."""
 
+    __slots__ = ()
+
     def __init__(self, gateway, **kwargs) -> None:
         kwargs["io_type"] = IO_TYPES_INT.get("TypeGestureIo", 49)
 
@@ -2210,6 +2241,8 @@ class GestureIO(BaseIO):
 class IrIO(BaseIO):
     """domintell IrIO reprensentation."""
 
+    __slots__ = ("_key",)
+
     def __init__(self, gateway, **kwargs) -> None:
         kwargs["io_type"] = IO_TYPES_INT.get("TypeIrIO", 9)
 
@@ -2250,6 +2283,8 @@ class IrIO(BaseIO):
 class DfanComboIO(BaseIO):
     """domintell DfanComboIO reprensentation."""
 
+    __slots__ = ()
+
     def __init__(self, gateway, **kwargs) -> None:
         kwargs["io_type"] = IO_TYPES_INT.get("TypeDfanComboIo", 12)
 
@@ -2346,6 +2381,8 @@ class DfanComboIO(BaseIO):
 class FanIO(BaseIO):
     """domintell FanIO reprensentation."""
 
+    __slots__ = ("_configuration",)
+
     def __init__(self, gateway, **kwargs) -> None:
         kwargs["io_type"] = IO_TYPES_INT.get("TypeFanIo", 13)
 
@@ -2470,6 +2507,8 @@ class FanIO(BaseIO):
 class VanesIO(BaseIO):
     """domintell VanesIO reprensentation."""
 
+    __slots__ = ("_configuration",)
+
     def __init__(self, gateway, **kwargs) -> None:
         kwargs["io_type"] = IO_TYPES_INT.get("TypeVanesIo", 54)
 
@@ -2560,6 +2599,8 @@ class VanesIO(BaseIO):
 class MovIO(BaseIO):
     """domintell MovIO reprensentation."""
 
+    __slots__ = ()
+
     def __init__(self, gateway, **kwargs) -> None:
         kwargs["io_type"] = IO_TYPES_INT.get("TypeMovIo", 34)
 
@@ -2608,6 +2649,8 @@ class MovIO(BaseIO):
 class SensorIO(BaseIO):
     """domintell SensorIO reprensentation."""
 
+    __slots__ = ("_configuration", "_have_link")
+
     def __init__(self, gateway, **kwargs) -> None:
         kwargs["io_type"] = IO_TYPES_INT.get("TypeSensorIo", 8)
 
@@ -2706,6 +2749,8 @@ class SensorIO(BaseIO):
 class LuxIO(BaseIO):
     """domintell LuxIO reprensentation."""
 
+    __slots__ = ()
+
     def __init__(self, gateway, **kwargs) -> None:
         kwargs["io_type"] = IO_TYPES_INT.get("TypeLuxIo", 36)
 
@@ -2740,6 +2785,8 @@ class LuxIO(BaseIO):
 class HumidityIO(BaseIO):
     """domintell HumidityIO reprensentation."""
 
+    __slots__ = ()
+
     def __init__(self, gateway, **kwargs) -> None:
         kwargs["io_type"] = IO_TYPES_INT.get("TypeHumidityIo", 37)
 
@@ -2774,6 +2821,8 @@ class HumidityIO(BaseIO):
 class PressureIO(BaseIO):
     """domintell PressureIO reprensentation."""
 
+    __slots__ = ()
+
     def __init__(self, gateway, **kwargs) -> None:
         kwargs["io_type"] = IO_TYPES_INT.get("TypePressureIo", 38)
 
@@ -2808,6 +2857,8 @@ class PressureIO(BaseIO):
 class Co2IO(BaseIO):
     """domintell Co2IO reprensentation."""
 
+    __slots__ = ()
+
     def __init__(self, gateway, **kwargs) -> None:
         kwargs["io_type"] = IO_TYPES_INT.get("TypeCo2Io", 39)
 
@@ -2842,6 +2893,8 @@ class Co2IO(BaseIO):
 class WindIO(BaseIO):
     """domintell WindIO reprensentation."""
 
+    __slots__ = ()
+
     def __init__(self, gateway, **kwargs) -> None:
         kwargs["io_type"] = IO_TYPES_INT.get("TypeWindIo", 41)
 
@@ -2880,6 +2933,8 @@ class WindIO(BaseIO):
 class PowerSupplyIO(BaseIO):
     """domintell PowerSupplyIO reprensentation."""
 
+    __slots__ = ()
+
     def __init__(self, gateway, **kwargs) -> None:
         kwargs["io_type"] = IO_TYPES_INT.get("TypePowerSupplyIo", 51)
 
@@ -2922,6 +2977,8 @@ class PowerSupplyIO(BaseIO):
 class ElecIO(BaseIO):
     """domintell ElecIO reprensentation."""
 
+    __slots__ = ("_nbr_of_phases",)
+
     def __init__(self, gateway, **kwargs) -> None:
         kwargs["io_type"] = IO_TYPES_INT.get("TypeElecIo", 51)
 
@@ -2966,6 +3023,8 @@ class ElecIO(BaseIO):
 class SoundIO(BaseIO):
     """domintell SoundIO reprensentation."""
 
+    __slots__ = ()
+
     # Note: This IO type is not handled
 
     def __init__(self, gateway, **kwargs) -> None:
@@ -3001,6 +3060,8 @@ class SoundIO(BaseIO):
 class GenericSoundIo(BaseIO):
     """domintell GenericSoundIo reprensentation."""
 
+    __slots__ = ()
+
     def __init__(self, gateway, **kwargs) -> None:
         kwargs["io_type"] = IO_TYPES_INT.get("TypeGenericSoundIo", 43)
 
@@ -3031,6 +3092,8 @@ class GenericSoundIo(BaseIO):
 class DeviceStatus(BaseIO):
     """Domintell DeviceStatus reprensentation."""
 
+    __slots__ = ()
+
     def __init__(self, gateway, **kwargs) -> None:
         kwargs["io_type"] = IO_TYPES_INT.get("TypeDeviceStatus", 55)
 
@@ -3061,6 +3124,8 @@ class DeviceStatus(BaseIO):
 class PercentIO(BaseIO):
     """Domintell PercentIO reprensentation."""
 
+    __slots__ = ()
+
     def __init__(self, gateway, **kwargs) -> None:
         kwargs["io_type"] = IO_TYPES_INT.get("TypePercentIo", 56)
 
@@ -3092,6 +3157,8 @@ class PercentIO(BaseIO):
 class AnalogInIO(BaseIO):
     """Domintell AnalogInIO reprensentation."""
 
+    __slots__ = ()
+
     def __init__(self, gateway, **kwargs) -> None:
         kwargs["io_type"] = IO_TYPES_INT.get("TypeAnalogInIo", 57)
 
@@ -3126,6 +3193,8 @@ class AnalogInIO(BaseIO):
 class VarIO(BaseIO):
     """Domintell VarIO reprensentation."""
 
+    __slots__ = ("_is_read_only", "_is_master_only", "_is_bool_status", "_state_range")
+
     def __init__(self, gateway, **kwargs) -> None:
         kwargs["io_type"] = IO_TYPES_INT.get("TypeVar", 16)
 
@@ -3235,6 +3304,14 @@ class VarIO(BaseIO):
 class VarSysIO(BaseIO):
     """Domintell VarSysIO reprensentation."""
 
+    __slots__ = (
+        "_is_read_only",
+        "_is_master_only",
+        "_is_bool_status",
+        "_state_range",
+        "night_and_day",
+    )
+
     def __init__(self, gateway, **kwargs) -> None:
         kwargs["io_type"] = IO_TYPES_INT.get("TypeVarSys", 17)
 
@@ -3363,6 +3440,8 @@ class VarSysIO(BaseIO):
 class CloudInfo(BaseIO):
     """Domintell CloudInfo reprensentation."""
 
+    __slots__ = ()
+
     def __init__(self, gateway, **kwargs) -> None:
         kwargs["io_type"] = IO_TYPES_INT.get("TypeCloudInfo", 62)
 
@@ -3413,6 +3492,8 @@ class CloudInfo(BaseIO):
 class EthernetInfo(BaseIO):
     """Domintell EthernetInfo reprensentation."""
 
+    __slots__ = ()
+
     def __init__(self, gateway, **kwargs) -> None:
         kwargs["io_type"] = IO_TYPES_INT.get("TypeEthernetInfo", 63)
 
@@ -3443,6 +3524,8 @@ class EthernetInfo(BaseIO):
 class MemoryInfo(BaseIO):
     """Domintell MemoryInfo reprensentation."""
 
+    __slots__ = ()
+
     def __init__(self, gateway, **kwargs) -> None:
         kwargs["io_type"] = IO_TYPES_INT.get("TypeMemoryInfo", 64)
 
@@ -3473,6 +3556,8 @@ class MemoryInfo(BaseIO):
 class StorageInfo(BaseIO):
     """Domintell StorageInfo reprensentation."""
 
+    __slots__ = ()
+
     def __init__(self, gateway, **kwargs) -> None:
         kwargs["io_type"] = IO_TYPES_INT.get("TypeStorageInfo", 64)
 
@@ -3503,6 +3588,8 @@ class StorageInfo(BaseIO):
 class CpuInfo(BaseIO):
     """Domintell CpuInfo reprensentation."""
 
+    __slots__ = ()
+
     def __init__(self, gateway, **kwargs) -> None:
         kwargs["io_type"] = IO_TYPES_INT.get("TypeCpuInfo", 66)
 
@@ -3533,6 +3620,8 @@ class CpuInfo(BaseIO):
 class DiBusGwInfo(BaseIO):
     """Domintell DiBusGwInfo reprensentation."""
 
+    __slots__ = ()
+
     def __init__(self, gateway, **kwargs) -> None:
         kwargs["io_type"] = IO_TYPES_INT.get("TypeDiBusGwInfo", 66)
 
@@ -3563,6 +3652,16 @@ class DiBusGwInfo(BaseIO):
 class GroupIO(BaseIO):
     """Domintell GroupIO reprensentation."""
 
+    # Properties of the target class, filled in by the generated proxy class
+    _group_properties: tuple = ()
+
+    def __new__(cls, *args, **kwargs):
+        if cls is GroupIO:
+            # Instantiate the proxy class of the target io type instead
+            io_type_str = IO_TYPES_STRING.get(kwargs.get("io_type"), "TypeIoNotHandled")
+            cls = _get_group_io_class(io_type_str)
+        return super().__new__(cls)
+
     def __init__(self, gateway, **kwargs) -> None:
         # Set io_name to default if empty (ie: "Group #01")
         if kwargs["io_name"] == "":
@@ -3572,23 +3671,10 @@ class GroupIO(BaseIO):
         self._gateway = gateway
         self._state: Any | None = None
 
-        # Configuration
-        io_type_str = IO_TYPES_STRING.get(self.io_type, "TypeIoNotHandled")
-
-        # Retrieving target class methods
-        parent_class = IOFactory()._io_classes[io_type_str]
-        members = inspect.getmembers(parent_class)
-
-        # Dynamic creation of methods and properties
-        for member_name, member in members:
-            if not member_name.startswith("__"):
-                if inspect.isfunction(member):
-                    # Bind methods
-                    bound_method = types.MethodType(member, self)
-                    setattr(self, member_name, bound_method)
-                elif isinstance(member, property):
-                    # Bind properties
-                    setattr(self, member_name, member)
+        # Target class methods are inherited from the proxy class,
+        # properties are bound on the instance
+        for member_name, member in self._group_properties:
+            setattr(self, member_name, member)
 
         # Configuration
         try:
@@ -3606,60 +3692,89 @@ class GroupIO(BaseIO):
         return self._ref_io
 
 
+_group_io_classes: dict[str, type] = {}  # io_type_str -> GroupIO proxy class
+
+
+def _get_group_io_class(io_type_str: str) -> type:
+    """Return the GroupIO proxy class of a target io type, created once."""
+
+    group_class = _group_io_classes.get(io_type_str)
+    if group_class is not None:
+        return group_class
+
+    # Retrieving target class methods and properties
+    parent_class = IOFactory._io_classes[io_type_str]
+    methods: dict = {}
+    properties: list = []
+
+    for member_name, member in inspect.getmembers(parent_class):
+        if not member_name.startswith("__"):
+            if inspect.isfunction(member):
+                methods[member_name] = member
+            elif isinstance(member, property):
+                properties.append((member_name, member))
+
+    methods["_group_properties"] = tuple(properties)
+    group_class = type(f"Group{parent_class.__name__}", (GroupIO,), methods)
+    _group_io_classes[io_type_str] = group_class
+
+    return group_class
+
+
 class IOFactory:
     """IO instance factory."""
 
-    def __init__(self):
-        self._io_classes: dict = {
-            "TypeIoNotHandled": SceneIO,
-            "TypeTorIo": TorIO,
-            "TypeTorBasicTempoIo": TorBasicTempoIO,
-            "TypeInputTriggerIo": InputTriggerIO,
-            "TypeInputIo": InputIO,
-            "TypeTrvIo": TrvIO,
-            "TypeTrvBtIo": TrvBtIO,
-            "TypeLedIo": LedIO,
-            "TypeLed8cIo": Led8cIO,
-            "TypeLedRgbIo": LedRgbIo,
-            "TypePbLcdIo": PblcdIO,
-            "TypeOut10VIo": Out10VIO,
-            "TypeAccessControlIo": AccessControlIO,
-            "TypeVideoIo": VideoIO,
-            "TypeDimmerIo": DimmerIO,
-            "TypeLbIo": LbIO,
-            "TypeDmxIo": DmxIO,
-            "TypeDali": DaliIO,
-            "TypeRgbwIo": RgbwIO,
-            "TypeIn10VIo": In10VIO,
-            "TypeGestureIo": GestureIO,
-            "TypeIrIo": IrIO,
-            "TypeFanIo": FanIO,
-            "TypeDfanComboIo": DfanComboIO,
-            "TypeVanesIo": VanesIO,
-            "TypeMovIo": MovIO,
-            "TypeSensorIo": SensorIO,
-            "TypeLuxIo": LuxIO,
-            "TypeHumidityIo": HumidityIO,
-            "TypePressureIo": PressureIO,
-            "TypeCo2Io": Co2IO,
-            "TypeWindIo": WindIO,
-            "TypePowerSupplyIo": PowerSupplyIO,
-            "TypeElecIo": ElecIO,
-            "TypeSoundIo": SoundIO,
-            "TypeGenericSoundIo": GenericSoundIo,
-            "TypeDeviceStatus": DeviceStatus,
-            "TypePercentInIo": PercentIO,
-            "TypeAnalogInIo": AnalogInIO,
-            "TypeVar": VarIO,
-            "TypeVarSys": VarSysIO,
-            # "TypeCloudNotif": CloudNotifInfo,
-            "TypeCloudInfo": CloudInfo,
-            "TypeEthernetInfo": EthernetInfo,
-            "TypeMemoryInfo": MemoryInfo,
-            "TypeStorageInfo": StorageInfo,
-            "TypeCpuInfo": CpuInfo,
-            "TypeDiBusGwInfo": DiBusGwInfo,
-        }
+    # Registry shared by all factory instances, built once at import
+    _io_classes: dict = {
+        "TypeIoNotHandled": SceneIO,
+        "TypeTorIo": TorIO,
+        "TypeTorBasicTempoIo": TorBasicTempoIO,
+        "TypeInputTriggerIo": InputTriggerIO,
+        "TypeInputIo": InputIO,
+        "TypeTrvIo": TrvIO,
+        "TypeTrvBtIo": TrvBtIO,
+        "TypeLedIo": LedIO,
+        "TypeLed8cIo": Led8cIO,
+        "TypeLedRgbIo": LedRgbIo,
+        "TypePbLcdIo": PblcdIO,
+        "TypeOut10VIo": Out10VIO,
+        "TypeAccessControlIo": AccessControlIO,
+        "TypeVideoIo": VideoIO,
+        "TypeDimmerIo": DimmerIO,
+        "TypeLbIo": LbIO,
+        "TypeDmxIo": DmxIO,
+        "TypeDali": DaliIO,
+        "TypeRgbwIo": RgbwIO,
+        "TypeIn10VIo": In10VIO,
+        "TypeGestureIo": GestureIO,
+        "TypeIrIo": IrIO,
+        "TypeFanIo": FanIO,
+        "TypeDfanComboIo": DfanComboIO,
+        "TypeVanesIo": VanesIO,
+        "TypeMovIo": MovIO,
+        "TypeSensorIo": SensorIO,
+        "TypeLuxIo": LuxIO,
+        "TypeHumidityIo": HumidityIO,
+        "TypePressureIo": PressureIO,
+        "TypeCo2Io": Co2IO,
+        "TypeWindIo": WindIO,
+        "TypePowerSupplyIo": PowerSupplyIO,
+        "TypeElecIo": ElecIO,
+        "TypeSoundIo": SoundIO,
+        "TypeGenericSoundIo": GenericSoundIo,
+        "TypeDeviceStatus": DeviceStatus,
+        "TypePercentInIo": PercentIO,
+        "TypeAnalogInIo": AnalogInIO,
+        "TypeVar": VarIO,
+        "TypeVarSys": VarSysIO,
+        # "TypeCloudNotif": CloudNotifInfo,
+        "TypeCloudInfo": CloudInfo,
+        "TypeEthernetInfo": EthernetInfo,
+        "TypeMemoryInfo": MemoryInfo,
+        "TypeStorageInfo": StorageInfo,
+        "TypeCpuInfo": CpuInfo,
+        "TypeDiBusGwInfo": DiBusGwInfo,
+    }
 
     def create_io(self, io_type_str: str, *args, **kwargs):
         """Create an io instance."""
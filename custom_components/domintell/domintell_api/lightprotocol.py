@@ -1,26 +1,52 @@
+import hashlib
 import re
+import sys
 import copy
 import traceback
 
 from .const import (
     IO_TYPES_STRING,
     IO_TYPES_INT,
-    MODULE_TYPE_DICTIONNARY,
+    MODULE_TYPES,
     IO_DEFAULT_TARGET_TYPES,
-    LEGACY_MODULE_TYPE_LIST,
     LEGACY_MODULE_DMX_LIST,
-    LEGACY_MODULE_WITH_TEMP_SENSOR_LIST,
     IOTYPE_OF_LEGACY_DATA_TYPE,
     IOTYPE_OF_GROUP_CATEGORY,
-    SUPPORTED_MODULE_TYPE_LIST,
-    SUPPORTED_IO_TYPE_LIST,
-    SHUTTERS_MODULE_TYPE_LIST,
-    BUTTONS_MODULE_TYPE_LIST,
     cmd_type_new_gen,
     cmd_type_legacy,
 )
 
 
+# Bits of each byte value, least significant bit first
+_BYTE_BITS: tuple[tuple[int, ...], ...] = tuple(
+    tuple((value >> bit) & 1 for bit in range(8)) for value in range(256)
+)
+
+
+def _hex_to_bits(raw_data: str, nbr_bits: int) -> list:
+    """Convert an hexadecimal value into a list of bits, least significant first."""
+    if len(raw_data) % 2:
+        raw_data = "0" + raw_data
+
+    payload = bytes.fromhex(raw_data)
+    if not payload:
+        raise ValueError("Empty payload")
+
+    data = []
+    for value in reversed(payload[-((nbr_bits + 7) // 8) :]):
+        data.extend(_BYTE_BITS[value])
+
+    if len(data) < nbr_bits:
+        data.extend([0] * (nbr_bits - len(data)))
+
+    return data[:nbr_bits]
+
+
+def _hex_to_bytes(raw_data: str) -> list:
+    """Convert an hexadecimal payload into a list of byte values (ignore odd char)."""
+    return list(bytes.fromhex(raw_data[: len(raw_data) - len(raw_data) % 2]))
+
+
 def is_new_gen_status(message: str) -> bool:
     return "/" in message
 
@@ -34,7 +60,7 @@ def is_new_gen_module(module_type: str) -> bool:
 
 
 def is_legacy_module(module_type: str) -> bool:
-    return module_type in LEGACY_MODULE_TYPE_LIST
+    return module_type in MODULE_TYPES.legacy_module_types
 
 
 def is_hour_message(message: str) -> bool:
@@ -104,13 +130,9 @@ def construct_endpoint_id(data: str):
             try:
                 # Determine the io offset
                 io_num = int(io_num_str, 16)
-                io_offset = MODULE_TYPE_DICTIONNARY.get(module_type)["io_offsets"][
-                    io_num - 1
-                ]
+                io_offset = MODULE_TYPES[module_type].io_offsets[io_num - 1]
                 # Determine the io type
-                io_type: int = MODULE_TYPE_DICTIONNARY.get(module_type)["io_types"][
-                    io_num - 1
-                ]
+                io_type: int = MODULE_TYPES[module_type].io_types[io_num - 1]
             except ValueError as ex:
                 raise ValueError("Invalid io_offset format") from ex
 
@@ -127,8 +149,59 @@ def construct_endpoint_id(data: str):
     return endpoint_id
 
 
+class LpEndpointTable:
+    """Table of the known endpoints, interned into compact integer handles.
+
+    Built when APPINFO is parsed. Statuses resolve their endpoint with a
+    (module_type, end_of_sn, io_type, io_offset) tuple instead of rebuilding
+    the endpoint id string.
+    """
+
+    def __init__(self) -> None:
+        self._handles: dict[tuple, int] = {}  # key -> handle
+        self._keys: list[tuple] = []  # handle -> key
+        self._ids: list[str] = []  # handle -> endpoint id
+        self._serial_numbers: list[str] = []  # handle -> module serial number
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def intern(
+        self,
+        module_type: str,
+        end_of_sn: int,
+        io_type: int,
+        io_offset: int,
+        id: str,
+        serial_number: str,
+    ) -> int:
+        """Register an endpoint and return its handle."""
+        key = (module_type, end_of_sn, io_type, io_offset)
+        handle = self._handles.get(key)
+        if handle is None:
+            handle = len(self._ids)
+            self._handles[key] = handle
+            self._keys.append(key)
+            self._ids.append(sys.intern(id))
+            self._serial_numbers.append(sys.intern(serial_number))
+        return handle
+
+    def get_handle(self, key: tuple) -> int | None:
+        """Get the handle of an endpoint by (module_type, end_of_sn, io_type, io_offset)."""
+        return self._handles.get(key)
+
+    def get_key(self, handle: int) -> tuple:
+        return self._keys[handle]
+
+    def get_id(self, handle: int) -> str:
+        return self._ids[handle]
+
+    def get_serial_number(self, handle: int) -> str:
+        return self._serial_numbers[handle]
+
+
 class LpStatus:
-    def __init__(self, message: str):
+    def __init__(self, message: str, endpoints: LpEndpointTable | None = None):
         self._raw_message = message.strip()
         self._id: str = ""
         self._serial_number: str = ""
@@ -139,9 +212,10 @@ class LpStatus:
         self._data: list = []
         self._status_requested: bool = False
         self._legacy: bool = True
+        self._handle: int | None = None  # Endpoint handle (see LpEndpointTable)
 
         if message is not None and len(message) > 0:
-            self._parse_status_message(message.strip())
+            self._parse_status_message(message.strip(), endpoints)
         else:
             raise ValueError("message is empty")
 
@@ -177,6 +251,10 @@ class LpStatus:
     def is_legacy(self) -> bool:
         return self._legacy
 
+    @property
+    def handle(self) -> int | None:
+        return self._handle
+
     # @property
     # def get_dict(self) -> dict:
     #     exclude = {"_raw_message", "_raw_data"}
@@ -321,7 +399,7 @@ class LpStatus:
             # Split by 2-character chunks and convert to integers
             try:
                 self._raw_data = self._raw_data.replace(" ", "0")
-                data = [int(part, 16) for part in re.findall(r".{2}", self._raw_data)]
+                data = _hex_to_bytes(self._raw_data)
             except ValueError as ex:
                 raise ValueError("Invalid raw data (not in hexadecimal format)") from ex
         else:
@@ -330,34 +408,27 @@ class LpStatus:
             # of legacy modules, generaly relays, buttons, leds and ism (LT4 and LT2)
 
             # Raw Data Format: <data> (n * 2 char hexa)
-            # Parse single value as hexadecimal integer
+            # Parse value as hexadecimal bytes and expand it into individual bits
+            module_type_info = MODULE_TYPES.get(self._module_type)
+            nbr_bool = (
+                8 if module_type_info is None else module_type_info.nbr_of_bool_io
+            )
+
             try:
                 self._raw_data = self._raw_data.replace(" ", "0")
 
                 if self._module_type == "IS8":
-                    output_state = int(self._raw_data[:2], 16)
+                    data = _hex_to_bits(self._raw_data[:2], nbr_bool)
                 elif self._module_type == "I20":
-                    output_state = int(
+                    data = _hex_to_bits(
                         self._raw_data[4:6] + self._raw_data[2:4] + self._raw_data[0:2],
-                        16,
+                        nbr_bool,
                     )
                 else:
-                    output_state = int(self._raw_data, 16)
+                    data = _hex_to_bits(self._raw_data, nbr_bool)
             except ValueError as ex:
                 raise ValueError("Invalid raw data (not in hexadecimal format)") from ex
 
-            nbr_bool = MODULE_TYPE_DICTIONNARY.get(self._module_type, {}).get(
-                "nbr_of_bool_io", 8
-            )
-            # Convert to list of individual bits
-            data = [0] * nbr_bool
-            the_range = range(nbr_bool)
-
-            for i in the_range:
-                shift = i
-                mask = 1 << shift
-                data[i] = (output_state & mask) >> shift
-
         return data
 
     def _parse_raw_data_new_gen(self):
@@ -522,7 +593,9 @@ class LpStatus:
 
         return data
 
-    def _parse_newgen_message(self, message: str):
+    def _parse_newgen_message(
+        self, message: str, endpoints: LpEndpointTable | None = None
+    ):
         # Frame Format New Gen: <Module type>/<serial number without mod type>/<IO type>/<IO offset>/<data1>#<data2>#...
         msg_tab = message.split("/")
         self._module_type = msg_tab[0]
@@ -537,28 +610,49 @@ class LpStatus:
             raise ValueError("Invalid message format") from ex
 
         # Ignore unsupported io_type
-        if self._io_type not in SUPPORTED_IO_TYPE_LIST:
+        if self._io_type not in MODULE_TYPES.supported_io_types:
             raise TypeError(f"Unsupported io type: {self._io_type}")
 
-        # Formatting end_of_sn
-        end_of_sn_hex = f"{end_of_sn:06X}"  # formatting with 0-padding to 6 digits
+        if not self._resolve_endpoint(endpoints, end_of_sn):
+            # Formatting end_of_sn
+            end_of_sn_hex = f"{end_of_sn:06X}"  # formatting with 0-padding to 6 digits
 
-        module_type_num = MODULE_TYPE_DICTIONNARY.get(self._module_type)["mod_type_num"]
-        self._serial_number = module_type_num + end_of_sn_hex
+            module_type_num = MODULE_TYPES.type_num(self._module_type)
+            self._serial_number = module_type_num + end_of_sn_hex
 
-        self._id = (
-            f"{self._module_type}{end_of_sn_hex}-{self._io_type}-{self._io_offset}"
-        )
+            self._id = (
+                f"{self._module_type}{end_of_sn_hex}-{self._io_type}-{self._io_offset}"
+            )
 
         self._data = self._parse_raw_data_new_gen()
 
-    def _parse_legacy_message(self, message: str):
+    def _resolve_endpoint(
+        self, endpoints: LpEndpointTable | None, end_of_sn: int
+    ) -> bool:
+        """Take id and serial number from the endpoint table if the endpoint is known."""
+        if endpoints is None:
+            return False
+
+        handle = endpoints.get_handle(
+            (self._module_type, end_of_sn, self._io_type, self._io_offset)
+        )
+        if handle is None:
+            return False
+
+        self._handle = handle
+        self._id = endpoints.get_id(handle)
+        self._serial_number = endpoints.get_serial_number(handle)
+        return True
+
+    def _parse_legacy_message(
+        self, message: str, endpoints: LpEndpointTable | None = None
+    ):
         # Frame Format Legacy: <Module type> + <serial number 6 char hexadecimal> + <optional io number> + <data type> + <Data>
         self._module_type = message[:3]
         end_of_sn = message[3:9].replace(" ", "0")
 
         # Note: we can haveTPR,TPL et STA which do not exist in the module type
-        module_type_num = MODULE_TYPE_DICTIONNARY.get(self._module_type)["mod_type_num"]
+        module_type_num = MODULE_TYPES.type_num(self._module_type)
         self._serial_number = module_type_num + end_of_sn
 
         # Case of DMX, DAL, AMP or ...
@@ -653,14 +747,22 @@ class LpStatus:
 
         self._data_type = data_type
 
-        self._id = (
-            self._module_type
-            + self._serial_number[2:9]
-            + "-"
-            + str(self._io_type)
-            + "-"
-            + str(self._io_offset)
-        )
+        try:
+            resolved = self._resolve_endpoint(
+                endpoints, int(self._serial_number[2:9], 16)
+            )
+        except ValueError:
+            resolved = False
+
+        if not resolved:
+            self._id = (
+                self._module_type
+                + self._serial_number[2:9]
+                + "-"
+                + str(self._io_type)
+                + "-"
+                + str(self._io_offset)
+            )
 
         if self._io_type == 8:  # "TypeSensorIo"
             # Keep the letter T or U
@@ -673,22 +775,24 @@ class LpStatus:
             self._raw_data = message[10:]
 
         # Ignore unsupported io_type
-        if self._io_type not in SUPPORTED_IO_TYPE_LIST:
+        if self._io_type not in MODULE_TYPES.supported_io_types:
             raise TypeError(f"Unsupported io type: {self._io_type}")
 
         self._data = self._parse_raw_data_legacy()
         self._status_requested = False
 
-    def _parse_status_message(self, message: str):
+    def _parse_status_message(
+        self, message: str, endpoints: LpEndpointTable | None = None
+    ):
         if is_clock_status(message):
             self._legacy = True
-            self._parse_legacy_message(message)
+            self._parse_legacy_message(message, endpoints)
         elif is_new_gen_status(message):
             self._legacy = False
-            self._parse_newgen_message(message)
+            self._parse_newgen_message(message, endpoints)
         else:
             self._legacy = True
-            self._parse_legacy_message(message)
+            self._parse_legacy_message(message, endpoints)
 
 
 class LpCommand:
@@ -705,7 +809,7 @@ class LpCommand:
 
         # Formatting end_of_sn
         end_of_sn_hex = id[3:9]
-        module_type_num = MODULE_TYPE_DICTIONNARY.get(self._module_type)["mod_type_num"]
+        module_type_num = MODULE_TYPES.type_num(self._module_type)
         self._serial_number: str = module_type_num + end_of_sn_hex
         id_tab = id.split("-")
         self._data: list | None = data
@@ -849,6 +953,8 @@ class LpAppInfo:
         self._charset = "UTF-8"
         self._name: str = "Unknown"  # Installation name
         self._ios_list: list = []  # Liste de dictonnaires représentant les ios
+        self._endpoints: LpEndpointTable = LpEndpointTable()
+        self._digest: bytes = self.compute_digest(message)
 
         # Clean message, remove caracters before "APPINFO" and after "END APPINFO"
         result = re.search(r"APPINFO(.*)END APPINFO", message, re.DOTALL)
@@ -890,6 +996,20 @@ class LpAppInfo:
     def ios(self) -> list:
         return self._ios_list
 
+    @property
+    def endpoints(self) -> LpEndpointTable:
+        return self._endpoints
+
+    @property
+    def digest(self) -> bytes:
+        """Digest of the raw APPINFO this object was parsed from."""
+        return self._digest
+
+    @staticmethod
+    def compute_digest(message: str) -> bytes:
+        """Cheap digest of a raw APPINFO, to detect an unchanged configuration."""
+        return hashlib.blake2b(message.encode("utf-8"), digest_size=16).digest()
+
     def _get_next_lines(lines: list, current_index: int, nbr_of_lines: int):
         if current_index + nbr_of_lines <= len(lines):
             return lines[current_index + 1 : current_index + nbr_of_lines + 1]
@@ -947,7 +1067,7 @@ class LpAppInfo:
         sw_version: str | None = None
         extra_info: str | None = None
 
-        if module_type not in LEGACY_MODULE_TYPE_LIST:
+        if module_type not in MODULE_TYPES.legacy_module_types:
             # "ZON", "TPR", "TPL", "STA", "CAM", "FRO", "RS2", "TSB" will be ignored too
             print("Not concerns a legacy module type, line ignored")
             return None
@@ -1078,13 +1198,9 @@ class LpAppInfo:
                 # Determine the io offset
                 io_num = int(io_num_str, 16)
 
-                io_offset = MODULE_TYPE_DICTIONNARY.get(module_type)["io_offsets"][
-                    io_num - 1
-                ]
+                io_offset = MODULE_TYPES[module_type].io_offsets[io_num - 1]
                 # Determine the io type
-                io_type: int = MODULE_TYPE_DICTIONNARY.get(module_type)["io_types"][
-                    io_num - 1
-                ]
+                io_type: int = MODULE_TYPES[module_type].io_types[io_num - 1]
             except ValueError as ex:
                 raise ValueError("Invalid io_offset format") from ex
 
@@ -1153,13 +1269,9 @@ class LpAppInfo:
                         io_num = self._convert_legacy_ism20_io_num(io_num_str)
                         io_name: str = line[12 : line.find("[")].strip()
 
-                io_offset = MODULE_TYPE_DICTIONNARY.get(module_type)["io_offsets"][
-                    io_num - 1
-                ]
+                io_offset = MODULE_TYPES[module_type].io_offsets[io_num - 1]
                 # Determine the io type
-                io_type: int = MODULE_TYPE_DICTIONNARY.get(module_type)["io_types"][
-                    io_num - 1
-                ]
+                io_type: int = MODULE_TYPES[module_type].io_types[io_num - 1]
             except ValueError as ex:
                 raise ValueError("Invalid io_offset format") from ex
 
@@ -1169,7 +1281,7 @@ class LpAppInfo:
                     return None
 
             # Case of TypeInputIo: Convert extra_info into new gen format
-            if module_type in BUTTONS_MODULE_TYPE_LIST:
+            if module_type in MODULE_TYPES.buttons_module_types:
                 if io_type == 2:
                     if len(extra_info) >= 1:
                         match extra_info[0]:
@@ -1183,12 +1295,12 @@ class LpAppInfo:
                         extra_info = ["0"]
 
             # Case of Shutters:
-            if module_type in SHUTTERS_MODULE_TYPE_LIST:
+            if module_type in MODULE_TYPES.shutters_module_types:
                 # TODO At the moment there is no extra_info available
                 pass
 
             # Case of typeSensorIo: Convert extra_info into new gen format
-            if module_type in LEGACY_MODULE_WITH_TEMP_SENSOR_LIST:
+            if module_type in MODULE_TYPES.temp_sensor_module_types:
                 if io_type == 8:  # TypeSensorIo
                     # extra_info = ['NOLINK', 'LOCAL', 'HMR=0x70-HMT=0x00', 'LHH=30.0-LHL=10.0-LCH=40.0-LCL=20.0-ISP=0.5']
                     # or           ['LOCAL', 'HMR=0x70-HMT=0x00', 'LHH=30.0-LHL=10.0-LCH=40.0-LCL=20.0-ISP=0.5']
@@ -1231,12 +1343,12 @@ class LpAppInfo:
                             extra_info.extend([link])
 
         # Ignore unsupported io_type
-        if io_type not in SUPPORTED_IO_TYPE_LIST:
+        if io_type not in MODULE_TYPES.supported_io_types:
             return None
 
         # Format serial number
         serial_number_hex: str = serial_number.strip().lstrip("0").zfill(6).upper()
-        module_type_num = MODULE_TYPE_DICTIONNARY.get(module_type)["mod_type_num"]
+        module_type_num = MODULE_TYPES.type_num(module_type)
         full_serial_number: str = module_type_num + serial_number_hex
 
         # Endpoint Id construction
@@ -1298,7 +1410,7 @@ class LpAppInfo:
             io_type = int(io_type_str)
 
         # Ignore unsupported io_type
-        if io_type not in SUPPORTED_IO_TYPE_LIST:
+        if io_type not in MODULE_TYPES.supported_io_types:
             # print(f"Concerns an unsupported io type: '{io_type}', line ignored")
             return None
 
@@ -1315,7 +1427,7 @@ class LpAppInfo:
         serial_number_int = int(serial_number)
         serial_number_hex = hex(serial_number_int)[2:].zfill(6).upper()
 
-        module_type_num = MODULE_TYPE_DICTIONNARY.get(module_type)["mod_type_num"]
+        module_type_num = MODULE_TYPES.type_num(module_type)
         full_serial_number = module_type_num + serial_number_hex
 
         # Endpoint Id construction
@@ -1394,7 +1506,7 @@ class LpAppInfo:
 
             module_type = line[:3].strip()
 
-            if module_type not in SUPPORTED_MODULE_TYPE_LIST:
+            if module_type not in MODULE_TYPES.supported_module_types:
                 # TPR, TPL, STA, ZON, FRO, RS2, TSB are ingored too, because they are not module types
                 continue
 
@@ -1411,7 +1523,7 @@ class LpAppInfo:
                     else:
                         result = None
 
-                elif module_type in LEGACY_MODULE_TYPE_LIST:
+                elif module_type in MODULE_TYPES.legacy_module_types:
                     result = self._parse_legacy_line(line)
                 else:
                     result = self._parse_new_gen_line(line)
@@ -1429,6 +1541,25 @@ class LpAppInfo:
                 if result["id"] not in set(element["id"] for element in self._ios_list):
                     self._ios_list.append(result)
 
+        # Intern known endpoints
+        for element in self._ios_list:
+            try:
+                end_of_sn = int(element["serial_number"][2:], 16)
+            except (TypeError, ValueError):
+                continue
+
+            handle = self._endpoints.intern(
+                element["module_type"],
+                end_of_sn,
+                element["io_type"],
+                element["io_offset"],
+                element["id"],
+                element["serial_number"],
+            )
+            # Share the interned strings with the IO instances
+            element["id"] = self._endpoints.get_id(handle)
+            element["serial_number"] = self._endpoints.get_serial_number(handle)
+
 
 def convert_legacy_to_new_gen(legacy_status: LpStatus) -> list[LpStatus] | None:
     """Convert legacy status data in new gen status if possible"""
@@ -1438,7 +1569,7 @@ def convert_legacy_to_new_gen(legacy_status: LpStatus) -> list[LpStatus] | None:
     if legacy_status.is_legacy:
         return [legacy_status]
 
-    if legacy_status.module_type in SHUTTERS_MODULE_TYPE_LIST:
+    if legacy_status.module_type in MODULE_TYPES.shutters_module_types:
         # "V24" (1 output), "TPV" (2 outputs), "TRV" (4 outputs)
         # V24 -> data = [a]
         # TPV -> data = [a,b]
@@ -1507,7 +1638,7 @@ def convert_legacy_to_new_gen(legacy_status: LpStatus) -> list[LpStatus] | None:
 
     # BU1, BU2, BU4, BU6, BRT, PBL, PRL, BR2, BR4, B81, B82, B84, B86, BR6,
     # CL1, CL2, CL4, CL6, PRL
-    elif legacy_status.module_type in BUTTONS_MODULE_TYPE_LIST:
+    elif legacy_status.module_type in MODULE_TYPES.buttons_module_types:
         # on peut avoir du
         # TypeInputIo (on aura du 'I')
         # TypeLedIo, TypeLed8cIo (on aura du 'O')
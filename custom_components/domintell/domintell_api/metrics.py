@@ -0,0 +1,111 @@
+"""Runtime metrics of the Domintell pipeline."""
+
+from bisect import bisect_left
+
+# Upper bounds in seconds of the dispatch latency buckets
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0)
+
+# Upper bounds of the event queue depth buckets
+QUEUE_DEPTH_BUCKETS = (1, 5, 10, 50, 100, 500, 1000)
+
+
+class Histogram:
+    """Histogram with fixed buckets."""
+
+    __slots__ = ("_bounds", "_counts", "_count", "_sum", "_max")
+
+    def __init__(self, bounds: tuple) -> None:
+        self._bounds = bounds
+        # Last bucket counts the values above the highest bound
+        self._counts = [0] * (len(bounds) + 1)
+        self._count = 0
+        self._sum = 0
+        self._max = 0
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def max(self):
+        return self._max
+
+    @property
+    def mean(self) -> float | None:
+        return self._sum / self._count if self._count else None
+
+    def observe(self, value) -> None:
+        self._counts[bisect_left(self._bounds, value)] += 1
+        self._count += 1
+        self._sum += value
+        if value > self._max:
+            self._max = value
+
+    def reset(self) -> None:
+        self._counts = [0] * (len(self._bounds) + 1)
+        self._count = 0
+        self._sum = 0
+        self._max = 0
+
+    def as_dict(self) -> dict:
+        buckets = {f"<={bound}": count for bound, count in zip(self._bounds, self._counts)}
+        buckets[f">{self._bounds[-1]}"] = self._counts[-1]
+        return {
+            "count": self._count,
+            "mean": self.mean,
+            "max": self._max,
+            "buckets": buckets,
+        }
+
+
+class Metrics:
+    """Counters and histograms of the websocket client and the events processing."""
+
+    __slots__ = (
+        "frames_received",
+        "status_lines_parsed",
+        "parse_errors",
+        "commands_sent",
+        "reconnect_attempts",
+        "reconnects",
+        "event_queue_depth",
+        "events_coalesced",
+        "events_dropped",
+        "dispatch_latency",
+    )
+
+    def __init__(self) -> None:
+        self.frames_received = 0
+        self.status_lines_parsed = 0
+        # Number of status lines which could not be parsed, per module type
+        self.parse_errors: dict[str, int] = {}
+        self.commands_sent = 0
+        self.reconnect_attempts = 0
+        self.reconnects = 0
+        self.event_queue_depth = Histogram(QUEUE_DEPTH_BUCKETS)
+        # Events replaced by a newer one of the same IO or dropped, queue full
+        self.events_coalesced = 0
+        self.events_dropped = 0
+        self.dispatch_latency = Histogram(LATENCY_BUCKETS)
+
+    @property
+    def parse_errors_total(self) -> int:
+        return sum(self.parse_errors.values())
+
+    def add_parse_error(self, module_type: str) -> None:
+        self.parse_errors[module_type] = self.parse_errors.get(module_type, 0) + 1
+
+    def as_dict(self) -> dict:
+        return {
+            "frames_received": self.frames_received,
+            "status_lines_parsed": self.status_lines_parsed,
+            "parse_errors": dict(self.parse_errors),
+            "commands_sent": self.commands_sent,
+            "reconnect_attempts": self.reconnect_attempts,
+            "reconnects": self.reconnects,
+            "event_queue_depth": self.event_queue_depth.as_dict(),
+            "event_queue_high_water": self.event_queue_depth.max,
+            "events_coalesced": self.events_coalesced,
+            "events_dropped": self.events_dropped,
+            "dispatch_latency": self.dispatch_latency.as_dict(),
+        }
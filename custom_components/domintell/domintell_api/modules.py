@@ -1,30 +1,38 @@
 import inspect
-from .const import MODULE_TYPE_DICTIONNARY
+from .const import MODULE_TYPES, ModuleTypeInfo
 
 
 class BaseModule:
     """Base representation of Domintell module."""
 
+    __slots__ = (
+        "_ios",
+        "_ios_by_type",
+        "_ios_by_position",
+        "_id",
+        "_serial_number",
+        "_module_type",
+        "_type_info",
+        "_software_version",
+        "_module_number",
+        "_name",
+    )
+
+    _manufacturer: str = "Domintell"
+
     def __init__(
         self, module_type: str, id: str, sw_version: str | None = None
     ) -> None:
         self._ios: dict = {}  # Listing of IO instances
+        self._ios_by_type: dict[int, dict] = {}  # io_type -> {io_id: IO instance}
+        self._ios_by_position: dict[tuple, object] = {}  # (io_type, io_offset) -> IO
         self._id: str = id
         self._serial_number: str = id
         self._module_type = module_type  # (ie: "BIR")
-        self._model: str | None = MODULE_TYPE_DICTIONNARY[self._module_type]["model"]
-        self._module_type_number: str = MODULE_TYPE_DICTIONNARY[self._module_type][
-            "mod_type_num"
-        ]
+        # Shared, read-only description of the module type
+        self._type_info: ModuleTypeInfo = MODULE_TYPES[self._module_type]
         self._software_version: str | None = sw_version  # (ie: "1.0.0")
         self._module_number: int | None = None  # (ie: 10)
-        self._io_types: tuple = MODULE_TYPE_DICTIONNARY[self._module_type][
-            "io_types_list"
-        ]
-        self._manufacturer: str = "Domintell"
-        self._description: str = MODULE_TYPE_DICTIONNARY[self._module_type][
-            "description"
-        ]
 
         # Process module number
         try:
@@ -35,7 +43,7 @@ class BaseModule:
         # Define module name
         if self._module_type == "SFE":
             # Note: Virtual module DSCENE is not used
-            self._name: str = self._model  # (ie: "SCENE")
+            self._name: str = self._type_info.model  # (ie: "SCENE")
         else:
             # (ie: "DQG02-253" or "DQG02-253-VIRTUAL")
             self._name: str = self.serial_number_text
@@ -59,9 +67,9 @@ class BaseModule:
     def model(self) -> str | None:
         """Model of the module."""
         if self._module_number & (1 << 23):
-            return self._model + "-VIRTUAL"
+            return self._type_info.model + "-VIRTUAL"
 
-        return self._model
+        return self._type_info.model
 
     @property
     def module_type(self) -> str:
@@ -71,7 +79,7 @@ class BaseModule:
     @property
     def module_type_number(self) -> str:
         """Type number of the module."""
-        return self._module_type_number
+        return self._type_info.type_num
 
     @property
     def module_number(self) -> int | None:
@@ -85,7 +93,7 @@ class BaseModule:
     @property
     def serial_number_text(self) -> str | None:
         """Serial Number of the module in text ."""
-        sn_text = self._model + "-" + str(self.module_number)
+        sn_text = self._type_info.model + "-" + str(self.module_number)
 
         # Check if module is virtual
         if self._module_number & (1 << 23):
@@ -107,12 +115,12 @@ class BaseModule:
     @property
     def description(self) -> str:
         """Module description."""
-        return self._description
+        return self._type_info.description
 
     @property
     def io_types(self) -> tuple:
         """List of io types held by the module."""
-        return self._io_types
+        return self._type_info.io_types_list
 
     @property
     def ios(self) -> list:
@@ -132,10 +140,7 @@ class BaseModule:
     def _get_io(self, io_type: str, io_offset: str):
         """Get IO by io_type and io_offset."""
 
-        for io in self.ios:
-            if io.io_type == io_type and io.io_offset == io_offset:
-                return io
-        return None
+        return self._ios_by_position.get((io_type, io_offset), None)
 
     def _get_io_by_id(self, id: str):
         """Get IO by id."""
@@ -150,17 +155,34 @@ class BaseModule:
         return self._get_io(arg1, arg2)
 
     def get_ios_by_type(self, io_type: int) -> list:
-        my_list = []
-        for io_instance in self.ios:
-            if io_instance.io_type == io_type:
-                my_list.append(io_instance)
-        return my_list
+        return list(self._ios_by_type.get(io_type, {}).values())
+
+    def count_ios_by_type(self, io_type: int) -> int:
+        """Number of IOs of the given io_type held by the module."""
+        return len(self._ios_by_type.get(io_type, ()))
 
     def add_io(self, id: str, io_instance) -> None:
+        self.remove_io(id)
         self._ios[id] = io_instance
+        self._ios_by_type.setdefault(io_instance.io_type, {})[id] = io_instance
+        self._ios_by_position[(io_instance.io_type, io_instance.io_offset)] = (
+            io_instance
+        )
 
     def remove_io(self, id: str) -> None:
-        self._ios.pop(id, None)
+        io_instance = self._ios.pop(id, None)
+        if io_instance is None:
+            return
+
+        bucket = self._ios_by_type.get(io_instance.io_type)
+        if bucket is not None:
+            bucket.pop(id, None)
+            if not bucket:
+                del self._ios_by_type[io_instance.io_type]
+
+        position = (io_instance.io_type, io_instance.io_offset)
+        if self._ios_by_position.get(position) is io_instance:
+            del self._ios_by_position[position]
 
     def values(self) -> list:
         return list(self._ios.values())
@@ -175,11 +197,11 @@ class BaseModule:
         return iter(self._ios.values())
 
     def __len__(self):
-        return len(self.values())
+        return len(self._ios)
 
     def __str__(self):
         return f"""
-{self._model}:
+{self._type_info.model}:
   Id: "{self.id}"
   Model: "{self.model}"
   Module Type: "{self.module_type}"
@@ -194,6 +216,8 @@ class BaseModule:
 class DQGQ02(BaseModule):
     """Representation of Domintell DGQG02 module."""
 
+    __slots__ = ()
+
     def __init__(self, id: str, sw_version: str | None = None) -> None:
         super().__init__("QG2", id, sw_version)
 
@@ -209,6 +233,8 @@ class DQGQ02(BaseModule):
 class DGQG03(BaseModule):
     """Representation of Domintell DQGQ03 module."""
 
+    __slots__ = ()
+
     def __init__(self, id: str, sw_version: str | None = None) -> None:
         super().__init__("QG3", id, sw_version)
 
@@ -218,6 +244,8 @@ class DGQG03(BaseModule):
 class DQGQ04(BaseModule):
     """Representation of Domintell DQGQ04 module."""
 
+    __slots__ = ()
+
     def __init__(self, id: str, sw_version: str | None = None) -> None:
         super().__init__("QG4", id, sw_version)
 
@@ -227,6 +255,8 @@ class DQGQ04(BaseModule):
 class DQGQ05(BaseModule):
     """Representation of Domintell DQGQ05 module."""
 
+    __slots__ = ()
+
     def __init__(self, id: str, sw_version: str | None = None) -> None:
         super().__init__("QG5", id, sw_version)
 
@@ -237,6 +267,8 @@ class DQGQ05(BaseModule):
 class DNET01(BaseModule):
     """Representation of Domintell DNET01 module."""
 
+    __slots__ = ()
+
     def __init__(self, id: str, sw_version: str | None = None) -> None:
         super().__init__("NT1", id, sw_version)
 
@@ -246,6 +278,8 @@ class DNET01(BaseModule):
 class DNET02(BaseModule):
     """Representation of Domintell DNET02 module."""
 
+    __slots__ = ()
+
     def __init__(self, id: str, sw_version: str | None = None) -> None:
         super().__init__("NT2", id, sw_version)
 
@@ -255,6 +289,8 @@ class DNET02(BaseModule):
 class DLED01(BaseModule):
     """Representation of Domintell DLED01 module."""
 
+    __slots__ = ()
+
     def __init__(self, id: str, sw_version: str | None = None) -> None:
         super().__init__("LED", id, sw_version)
 
@@ -265,6 +301,8 @@ class DLED01(BaseModule):
 class DBIR01(BaseModule):
     """Representation of Domintell DBIR01 module."""
 
+    __slots__ = ()
+
     def __init__(self, id: str, sw_version: str | None = None) -> None:
         super().__init__("BIR", id, sw_version)
 
@@ -275,6 +313,8 @@ class DBIR01(BaseModule):
 class DMR01(BaseModule):
     """Representation of Domintell DMR01 module."""
 
+    __slots__ = ()
+
     def __init__(self, id: str, sw_version: str | None = None) -> None:
         super().__init__("DMR", id, sw_version)
 
@@ -285,6 +325,8 @@ class DMR01(BaseModule):
 class DMR02(BaseModule):
     """Representation of Domintell DMR02 module."""
 
+    __slots__ = ()
+
     def __init__(self, id: str, sw_version: str | None = None) -> None:
         super().__init__("MR2", id, sw_version)
 
@@ -295,6 +337,8 @@ class DMR02(BaseModule):
 class DDIM01(BaseModule):
     """Representation of Domintell DDIM01 module."""
 
+    __slots__ = ()
+
     def __init__(self, id: str, sw_version: str | None = None) -> None:
         super().__init__("DIM", id, sw_version)
 
@@ -305,6 +349,8 @@ class DDIM01(BaseModule):
 class DDIMLV01(BaseModule):
     """Representation of Domintell DDIMLV01 module."""
 
+    __slots__ = ()
+
     def __init__(self, id: str, sw_version: str | None = None) -> None:
         super().__init__("LV1", id, sw_version)
 
@@ -315,6 +361,8 @@ class DDIMLV01(BaseModule):
 class DOUT10V02(BaseModule):
     """Representation of Domintell DOUT10V02 module."""
 
+    __slots__ = ()
+
     def __init__(self, id: str, sw_version: str | None = None) -> None:
         super().__init__("D10", id, sw_version)
 
@@ -325,6 +373,8 @@ class DOUT10V02(BaseModule):
 class DINTDALI01(BaseModule):
     """Representation of Domintell DINTDALI01 module."""
 
+    __slots__ = ()
+
     def __init__(self, id: str, sw_version: str | None = None) -> None:
         super().__init__("DAL", id, sw_version)
 
@@ -335,6 +385,8 @@ class DINTDALI01(BaseModule):
 class DRGBW01(BaseModule):
     """Representation of Domintell DRGBW01 module."""
 
+    __slots__ = ()
+
     def __init__(self, id: str, sw_version: str | None = None) -> None:
         super().__init__("RW1", id, sw_version)
 
@@ -345,6 +397,8 @@ class DRGBW01(BaseModule):
 class DDMX01(BaseModule):
     """Representation of Domintell DDMX01 module."""
 
+    __slots__ = ()
+
     def __init__(self, id: str, sw_version: str | None = None) -> None:
         super().__init__("DMX", id, sw_version)
 
@@ -355,6 +409,8 @@ class DDMX01(BaseModule):
 class DDMX02(BaseModule):
     """Representation of Domintell DDMX02 module."""
 
+    __slots__ = ()
+
     def __init__(self, id: str, sw_version: str | None = None) -> None:
         super().__init__("DX2", id, sw_version)
 
@@ -365,6 +421,8 @@ class DDMX02(BaseModule):
 class DTRP01(BaseModule):
     """Representation of Domintell DTRP01 module."""
 
+    __slots__ = ()
+
     def __init__(self, id: str, sw_version: str | None = None) -> None:
         super().__init__("TRP", id, sw_version)
 
@@ -375,6 +433,8 @@ class DTRP01(BaseModule):
 class DTRP02(BaseModule):
     """Representation of Domintell DTRP02 module."""
 
+    __slots__ = ()
+
     def __init__(self, id: str, sw_version: str | None = None) -> None:
         super().__init__("TPV", id, sw_version)
 
@@ -385,6 +445,8 @@ class DTRP02(BaseModule):
 class DTRVBT01(BaseModule):
     """Representation of Domintell DTRVBT01 module."""
 
+    __slots__ = ()
+
     def __init__(self, id: str, sw_version: str | None = None) -> None:
         super().__init__("V24", id, sw_version)
 
@@ -395,6 +457,8 @@ class DTRVBT01(BaseModule):
 class DTRV01(BaseModule):
     """Representation of Domintell DTRV01 module."""
 
+    __slots__ = ()
+
     def __init__(self, id: str, sw_version: str | None = None) -> None:
         super().__init__("TRV", id, sw_version)
 
@@ -405,6 +469,8 @@ class DTRV01(BaseModule):
 class DISM04(BaseModule):
     """Representation of Domintell DISM04 module."""
 
+    __slots__ = ()
+
     def __init__(self, id: str, sw_version: str | None = None) -> None:
         super().__init__("IS4", id, sw_version)
 
@@ -415,6 +481,8 @@ class DISM04(BaseModule):
 class DISM08(BaseModule):
     """Representation of Domintell DISM08 module."""
 
+    __slots__ = ()
+
     def __init__(self, id: str, sw_version: str | None = None) -> None:
         super().__init__("IS8", id, sw_version)
 
@@ -425,6 +493,8 @@ class DISM08(BaseModule):
 class DISM20(BaseModule):
     """Representation of Domintell DISM20 module."""
 
+    __slots__ = ()
+
     def __init__(self, id: str, sw_version: str | None = None) -> None:
         super().__init__("I20", id, sw_version)
 
@@ -435,6 +505,8 @@ class DISM20(BaseModule):
 class DIN10V02(BaseModule):
     """Representation of Domintell DIN10V02 module."""
 
+    __slots__ = ()
+
     def __init__(self, id: str, sw_version: str | None = None) -> None:
         super().__init__("I10", id, sw_version)
 
@@ -445,6 +517,8 @@ class DIN10V02(BaseModule):
 class DPBx01(BaseModule):
     """Representation of Domintell DPBx01 module."""
 
+    __slots__ = ()
+
     def __init__(self, id: str, sw_version: str | None = None) -> None:
         super().__init__("BU1", id, sw_version)
 
@@ -456,6 +530,8 @@ class DPBx01(BaseModule):
 class DPBx02(BaseModule):
     """Representation of Domintell DPBx02 module."""
 
+    __slots__ = ()
+
     def __init__(self, id: str, sw_version: str | None = None) -> None:
         super().__init__("BU2", id, sw_version)
 
@@ -467,6 +543,8 @@ class DPBx02(BaseModule):
 class DPBx04(BaseModule):
     """Representation of Domintell DPBx04 module."""
 
+    __slots__ = ()
+
     def __init__(self, id: str, sw_version: str | None = None) -> None:
         super().__init__("BU4", id, sw_version)
 
@@ -478,6 +556,8 @@ class DPBx04(BaseModule):
 class DPBx06(BaseModule):
     """Representation of Domintell DPBx06 module."""
 
+    __slots__ = ()
+
     def __init__(self, id: str, sw_version: str | None = None) -> None:
         super().__init__("BU6", id, sw_version)
 
@@ -489,6 +569,8 @@ class DPBx06(BaseModule):
 class DPBTLCD0x(BaseModule):
     """Representation of Domintell DPBTLCD0x module."""
 
+    __slots__ = ()
+
     def __init__(self, id: str, sw_version: str | None = None) -> None:
         super().__init__("PBL", id, sw_version)
 
@@ -501,6 +583,8 @@ class DPBTLCD0x(BaseModule):
 class DPBR02(BaseModule):
     """Representation of Domintell DPBR02 module."""
 
+    __slots__ = ()
+
     def __init__(self, id: str, sw_version: str | None = None) -> None:
         super().__init__("BR2", id, sw_version)
 
@@ -512,6 +596,8 @@ class DPBR02(BaseModule):
 class DPBR04(BaseModule):
     """Representation of Domintell DPBR04 module."""
 
+    __slots__ = ()
+
     def __init__(self, id: str, sw_version: str | None = None) -> None:
         super().__init__("BR4", id, sw_version)
 
@@ -523,6 +609,8 @@ class DPBR04(BaseModule):
 class DPBRLCD02(BaseModule):
     """Representation of Domintell DPBRLCD02 module."""
 
+    __slots__ = ()
+
     def __init__(self, id: str, sw_version: str | None = None) -> None:
         super().__init__("PRL", id, sw_version)
 
@@ -534,6 +622,8 @@ class DPBRLCD02(BaseModule):
 class DPBL01(BaseModule):
     """Representation of Domintell DPBL01 module."""
 
+    __slots__ = ()
+
     def __init__(self, id: str, sw_version: str | None = None) -> None:
         super().__init__("B81", id, sw_version)
 
@@ -545,6 +635,8 @@ class DPBL01(BaseModule):
 class DPBL02(BaseModule):
     """Representation of Domintell DPBL02 module."""
 
+    __slots__ = ()
+
     def __init__(self, id: str, sw_version: str | None = None) -> None:
         super().__init__("B82", id, sw_version)
 
@@ -556,6 +648,8 @@ class DPBL02(BaseModule):
 class DPBL04(BaseModule):
     """Representation of Domintell DPBL04 module."""
 
+    __slots__ = ()
+
     def __init__(self, id: str, sw_version: str | None = None) -> None:
         super().__init__("B84", id, sw_version)
 
@@ -567,6 +661,8 @@ class DPBL04(BaseModule):
 class DPBR06(BaseModule):
     """Representation of Domintell DPBR06 module."""
 
+    __slots__ = ()
+
     def __init__(self, id: str, sw_version: str | None = None) -> None:
         super().__init__("BR6", id, sw_version)
 
@@ -578,6 +674,8 @@ class DPBR06(BaseModule):
 class DPBC01(BaseModule):
     """Representation of Domintell DPBC01 module."""
 
+    __slots__ = ()
+
     def __init__(self, id: str, sw_version: str | None = None) -> None:
         super().__init__("CL1", id, sw_version)
 
@@ -590,6 +688,8 @@ class DPBC01(BaseModule):
 class DPBC02(BaseModule):
     """Representation of Domintell DPBC02 module."""
 
+    __slots__ = ()
+
     def __init__(self, id: str, sw_version: str | None = None) -> None:
         super().__init__("CL2", id, sw_version)
 
@@ -602,6 +702,8 @@ class DPBC02(BaseModule):
 class DPBC04(BaseModule):
     """Representation of Domintell DPBC04 module."""
 
+    __slots__ = ()
+
     def __init__(self, id: str, sw_version: str | None = None) -> None:
         super().__init__("CL4", id, sw_version)
 
@@ -614,6 +716,8 @@ class DPBC04(BaseModule):
 class DPBC06(BaseModule):
     """Representation of Domintell DPBC06 module."""
 
+    __slots__ = ()
+
     def __init__(self, id: str, sw_version: str | None = None) -> None:
         super().__init__("CL6", id, sw_version)
 
@@ -626,6 +730,8 @@ class DPBC06(BaseModule):
 class DPBRT0x(BaseModule):
     """Representation of Domintell DPBRT0x module."""
 
+    __slots__ = ()
+
     def __init__(self, id: str, sw_version: str | None = None) -> None:
         super().__init__("BRT", id, sw_version)
 
@@ -638,6 +744,8 @@ class DPBRT0x(BaseModule):
 class DTSC02(BaseModule):
     """Representation of Domintell DTSC02 module."""
 
+    __slots__ = ()
+
     def __init__(self, id: str, sw_version: str | None = None) -> None:
         super().__init__("LT2", id, sw_version)
 
@@ -651,6 +759,8 @@ class DTSC02(BaseModule):
 class DTSC04(BaseModule):
     """Representation of Domintell DTSC04 module."""
 
+    __slots__ = ()
+
     def __init__(self, id: str, sw_version: str | None = None) -> None:
         super().__init__("LT4", id, sw_version)
 
@@ -664,6 +774,8 @@ class DTSC04(BaseModule):
 class DTSC05(BaseModule):
     """Representation of Domintell DTSC05 module."""
 
+    __slots__ = ()
+
     def __init__(self, id: str, sw_version: str | None = None) -> None:
         super().__init__("LT5", id, sw_version)
 
@@ -679,6 +791,8 @@ class DTSC05(BaseModule):
 class DTEM01(BaseModule):
     """Representation of Domintell DTEM01 module."""
 
+    __slots__ = ()
+
     def __init__(self, id: str, sw_version: str | None = None) -> None:
         super().__init__("TE1", id, sw_version)
 
@@ -689,6 +803,8 @@ class DTEM01(BaseModule):
 class DTEM02(BaseModule):
     """Representation of Domintell DTEM02 module."""
 
+    __slots__ = ()
+
     def __init__(self, id: str, sw_version: str | None = None) -> None:
         super().__init__("TE2", id, sw_version)
 
@@ -699,6 +815,8 @@ class DTEM02(BaseModule):
 class DMOV0x(BaseModule):
     """Representation of Domintell DMOV01/02/05 module."""
 
+    __slots__ = ()
+
     def __init__(self, id: str, sw_version: str | None = None) -> None:
         super().__init__("DET", id, sw_version)
 
@@ -709,6 +827,8 @@ class DMOV0x(BaseModule):
 class DMOV06(BaseModule):
     """Representation of Domintell DMOV06 module."""
 
+    __slots__ = ()
+
     def __init__(self, id: str, sw_version: str | None = None) -> None:
         super().__init__("MV6", id, sw_version)
 
@@ -720,6 +840,8 @@ class DMOV06(BaseModule):
 class DMOV07(BaseModule):
     """Representation of Domintell DMOV07 module."""
 
+    __slots__ = ()
+
     def __init__(self, id: str, sw_version: str | None = None) -> None:
         super().__init__("MV7", id, sw_version)
 
@@ -731,6 +853,8 @@ class DMOV07(BaseModule):
 class DWIND01(BaseModule):
     """Representation of Domintell DWIND01 module."""
 
+    __slots__ = ()
+
     def __init__(self, id: str, sw_version: str | None = None) -> None:
         super().__init__("WI1", id, sw_version)
 
@@ -741,6 +865,8 @@ class DWIND01(BaseModule):
 class DENV01(BaseModule):
     """Representation of Domintell DENV01 module."""
 
+    __slots__ = ()
+
     def __init__(self, id: str, sw_version: str | None = None) -> None:
         super().__init__("EV1", id, sw_version)
 
@@ -754,6 +880,8 @@ class DENV01(BaseModule):
 class DENV02(BaseModule):
     """Representation of Domintell DENV02 module."""
 
+    __slots__ = ()
+
     def __init__(self, id: str, sw_version: str | None = None) -> None:
         super().__init__("EV2", id, sw_version)
 
@@ -766,6 +894,8 @@ class DENV02(BaseModule):
 class DALI04(BaseModule):
     """Representation of Domintell DALI04 module."""
 
+    __slots__ = ()
+
     def __init__(self, id: str, sw_version: str | None = None) -> None:
         super().__init__("PS4", id, sw_version)
 
@@ -776,6 +906,8 @@ class DALI04(BaseModule):
 class DALI05(BaseModule):
     """Representation of Domintell DALI05 module."""
 
+    __slots__ = ()
+
     def __init__(self, id: str, sw_version: str | None = None) -> None:
         super().__init__("PS5", id, sw_version)
 
@@ -786,6 +918,8 @@ class DALI05(BaseModule):
 class DPBRTHERM01(BaseModule):
     """Representation of Domintell DPBRTHERM01 module."""
 
+    __slots__ = ()
+
     def __init__(self, id: str, sw_version: str | None = None) -> None:
         super().__init__("RT1", id, sw_version)
 
@@ -796,6 +930,8 @@ class DPBRTHERM01(BaseModule):
 class DMONOELEC01(BaseModule):
     """Representation of Domintell DMONOELEC01 device."""
 
+    __slots__ = ()
+
     def __init__(self, id: str, sw_version: str | None = None) -> None:
         super().__init__("MON", id, sw_version)
 
@@ -806,6 +942,8 @@ class DMONOELEC01(BaseModule):
 class DTRIELEC01(BaseModule):
     """Representation of Domintell DTRIELEC01 device."""
 
+    __slots__ = ()
+
     def __init__(self, id: str, sw_version: str | None = None) -> None:
         super().__init__("TRI", id, sw_version)
 
@@ -816,6 +954,8 @@ class DTRIELEC01(BaseModule):
 class DELEC01(BaseModule):
     """Representation of Domintell DELEC01 module."""
 
+    __slots__ = ()
+
     def __init__(self, id: str, sw_version: str | None = None) -> None:
         super().__init__("EL1", id, sw_version)
 
@@ -826,6 +966,8 @@ class DELEC01(BaseModule):
 class DMV01(BaseModule):
     """Representation of Domintell DMV01 virtual module."""
 
+    __slots__ = ()
+
     def __init__(self, id: str, sw_version: str | None = None) -> None:
         super().__init__("DMV", id, sw_version)
 
@@ -837,6 +979,8 @@ class DMV01(BaseModule):
 class DFAN01(BaseModule):
     """Representation of Domintell DFAN01 virtual module."""
 
+    __slots__ = ()
+
     def __init__(self, id: str, sw_version: str | None = None) -> None:
         super().__init__("FAN", id, sw_version)
 
@@ -847,6 +991,8 @@ class DFAN01(BaseModule):
 class DOORSTATION(BaseModule):
     """Representation of Domintell DOORSTATION virtual module."""
 
+    __slots__ = ()
+
     def __init__(self, id: str, sw_version: str | None = None) -> None:
         super().__init__("DST", id, sw_version)
 
@@ -860,6 +1006,8 @@ class DOORSTATION(BaseModule):
 class DDIR0x(BaseModule):
     """Representation of Domintell DDIR01 and DDIR02 virtual module."""
 
+    __slots__ = ()
+
     def __init__(self, id: str, sw_version: str | None = None) -> None:
         super().__init__("DIR", id, sw_version)
 
@@ -870,6 +1018,8 @@ class DDIR0x(BaseModule):
 class DAMPLI01(BaseModule):
     """Representation of Domintell DAMPLI01 module."""
 
+    __slots__ = ()
+
     def __init__(self, id: str, sw_version: str | None = None) -> None:
         super().__init__("AMP", id, sw_version)
 
@@ -880,6 +1030,8 @@ class DAMPLI01(BaseModule):
 class DMODBUS(BaseModule):
     """Representation of Domintell Modbus generic device."""
 
+    __slots__ = ()
+
     def __init__(self, id: str, sw_version: str | None = None) -> None:
         super().__init__("MBG", id, sw_version)
 
@@ -890,6 +1042,8 @@ class DMODBUS(BaseModule):
 class DAIRCO(BaseModule):
     """Representation of Domintell Modbus Air conditioner device."""
 
+    __slots__ = ()
+
     def __init__(self, id: str, sw_version: str | None = None) -> None:
         super().__init__("MBA", id, sw_version)
 
@@ -900,75 +1054,75 @@ class DAIRCO(BaseModule):
 class ModuleFactory:
     """Generic representation of a Domintell module."""
 
-    def __init__(self):
-        self._module_classes: dict = {
-            "QG2": DQGQ02,
-            "QG3": DGQG03,
-            "QG4": DQGQ04,
-            "QG5": DQGQ05,
-            "NT1": DNET01,
-            "NT2": DNET02,
-            "LED": DLED01,
-            "BIR": DBIR01,
-            "DMR": DMR01,
-            "MR2": DMR02,
-            "DIM": DDIM01,
-            "LV1": DDIMLV01,
-            "D10": DOUT10V02,
-            "DAL": DINTDALI01,
-            "RW1": DRGBW01,
-            "DMX": DDMX01,
-            "DX2": DDMX02,
-            "TRP": DTRP01,
-            "TPV": DTRP02,
-            "V24": DTRVBT01,
-            "TRV": DTRV01,
-            "IS4": DISM04,
-            "IS8": DISM08,
-            "I20": DISM20,
-            "I10": DIN10V02,
-            "BU1": DPBx01,
-            "BU2": DPBx02,
-            "BU4": DPBx04,
-            "BU6": DPBx06,
-            "PBL": DPBTLCD0x,
-            "BR2": DPBR02,
-            "BR4": DPBR04,
-            "PRL": DPBRLCD02,
-            "B81": DPBL01,
-            "B82": DPBL02,
-            "B84": DPBL04,
-            "BR6": DPBR06,
-            "CL1": DPBC01,
-            "CL2": DPBC02,
-            "CL4": DPBC04,
-            "CL6": DPBC06,
-            "BRT": DPBRT0x,
-            "LT2": DTSC02,
-            "LT4": DTSC04,
-            "LT5": DTSC05,
-            "TE1": DTEM01,
-            "TE2": DTEM02,
-            "DET": DMOV0x,
-            "MV6": DMOV06,
-            "MV7": DMOV07,
-            "WI1": DWIND01,
-            "EV1": DENV01,
-            "EV2": DENV02,
-            "PS4": DALI04,
-            "PS5": DALI05,
-            "RT1": DPBRTHERM01,
-            "MON": DMONOELEC01,
-            "TRI": DTRIELEC01,
-            "EL1": DELEC01,
-            "DMV": DMV01,
-            "FAN": DFAN01,
-            "DST": DOORSTATION,
-            "DIR": DDIR0x,
-            "AMP": DAMPLI01,
-            "MBG": DMODBUS,  # ModBus generic device
-            "MBA": DAIRCO,  # Air conditioner device
-        }
+    # Registry shared by all factory instances, built once at import
+    _module_classes: dict = {
+        "QG2": DQGQ02,
+        "QG3": DGQG03,
+        "QG4": DQGQ04,
+        "QG5": DQGQ05,
+        "NT1": DNET01,
+        "NT2": DNET02,
+        "LED": DLED01,
+        "BIR": DBIR01,
+        "DMR": DMR01,
+        "MR2": DMR02,
+        "DIM": DDIM01,
+        "LV1": DDIMLV01,
+        "D10": DOUT10V02,
+        "DAL": DINTDALI01,
+        "RW1": DRGBW01,
+        "DMX": DDMX01,
+        "DX2": DDMX02,
+        "TRP": DTRP01,
+        "TPV": DTRP02,
+        "V24": DTRVBT01,
+        "TRV": DTRV01,
+        "IS4": DISM04,
+        "IS8": DISM08,
+        "I20": DISM20,
+        "I10": DIN10V02,
+        "BU1": DPBx01,
+        "BU2": DPBx02,
+        "BU4": DPBx04,
+        "BU6": DPBx06,
+        "PBL": DPBTLCD0x,
+        "BR2": DPBR02,
+        "BR4": DPBR04,
+        "PRL": DPBRLCD02,
+        "B81": DPBL01,
+        "B82": DPBL02,
+        "B84": DPBL04,
+        "BR6": DPBR06,
+        "CL1": DPBC01,
+        "CL2": DPBC02,
+        "CL4": DPBC04,
+        "CL6": DPBC06,
+        "BRT": DPBRT0x,
+        "LT2": DTSC02,
+        "LT4": DTSC04,
+        "LT5": DTSC05,
+        "TE1": DTEM01,
+        "TE2": DTEM02,
+        "DET": DMOV0x,
+        "MV6": DMOV06,
+        "MV7": DMOV07,
+        "WI1": DWIND01,
+        "EV1": DENV01,
+        "EV2": DENV02,
+        "PS4": DALI04,
+        "PS5": DALI05,
+        "RT1": DPBRTHERM01,
+        "MON": DMONOELEC01,
+        "TRI": DTRIELEC01,
+        "EL1": DELEC01,
+        "DMV": DMV01,
+        "FAN": DFAN01,
+        "DST": DOORSTATION,
+        "DIR": DDIR0x,
+        "AMP": DAMPLI01,
+        "MBG": DMODBUS,  # ModBus generic device
+        "MBA": DAIRCO,  # Air conditioner device
+    }
 
     def create_module(self, module_type: str, **kwargs):
         if module_type in self._module_classes:
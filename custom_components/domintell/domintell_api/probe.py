@@ -0,0 +1,159 @@
+"""Time bounded probing of Domintell gateways."""
+
+import asyncio
+import hashlib
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from .errors import InvalidCredentials, UserDatabaseEmpty
+from .websocket import DomintellClient
+
+DEFAULT_PORT = 17481
+# Budget (s) to connect and log in to a gateway
+DEFAULT_PROBE_TIMEOUT = 10.0
+# Budget (s) for the answers to GETLPVER and DISCOVER, only sent from LP 43.7
+DEFAULT_ANSWER_TIMEOUT = 2.0
+# Time (s) during which a probe result is reused
+DEFAULT_PROBE_CACHE_TTL = 60.0
+
+
+@dataclass(slots=True)
+class ProbeResult:
+    """Outcome of a probe of a gateway."""
+
+    host: str
+    lp_version: str | None = None
+    server_info: dict | None = None
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def raise_for_error(self) -> None:
+        if self.error is not None:
+            raise self.error
+
+
+async def probe_gateway(
+    host: str,
+    username: str | None = None,
+    password: str | None = None,
+    port: int = DEFAULT_PORT,
+    login: bool = True,
+    timeout: float = DEFAULT_PROBE_TIMEOUT,
+    answer_timeout: float = DEFAULT_ANSWER_TIMEOUT,
+) -> ProbeResult:
+    """Probe a gateway, never raising the connection errors.
+
+    Without login, only check that the gateway accepts a connection. Otherwise
+    log in and collect the answers to the GETLPVER and DISCOVER requests sent
+    by the client once the session is opened.
+    """
+    result = ProbeResult(host)
+    client = DomintellClient(host, port, username, password)
+
+    try:
+        async with asyncio.timeout(timeout):
+            if not login:
+                await client.test_connection(host, port)
+                return result
+
+            await client.connect(exit_on_error=True)
+
+        try:
+            async with asyncio.timeout(answer_timeout):
+                while client.lp_version is None or client.server_info is None:
+                    await asyncio.sleep(0.05)
+        except TimeoutError:
+            # Lightprotocol older than 43.7, or one of the answers is missing
+            pass
+
+        result.lp_version = client.lp_version
+        result.server_info = client.server_info
+
+    except Exception as ex:
+        result.error = ex
+    finally:
+        await client.disconnect()
+
+    return result
+
+
+class ProbeCache:
+    """Share the probes of gateways between callers for a short time.
+
+    Concurrent probes of the same gateway with the same credentials are merged
+    into one. Successful results and credential errors are kept `ttl` seconds,
+    other failures (unreachable, max clients, ...) are never cached.
+    """
+
+    def __init__(self, ttl: float = DEFAULT_PROBE_CACHE_TTL) -> None:
+        self._ttl = ttl
+        self._results: dict[tuple, tuple[float, ProbeResult]] = {}
+        self._pending: dict[tuple, asyncio.Task] = {}
+
+    @staticmethod
+    def _key(
+        host: str, port: int, username: str | None, password: str | None, login: bool
+    ) -> tuple:
+        # Do not keep the password itself in the key
+        secret = hashlib.sha256((password or "").encode("utf-8")).hexdigest()
+        return (host.lower(), port, username or "", secret, login)
+
+    def _store(self, key: tuple, task: asyncio.Task) -> None:
+        self._pending.pop(key, None)
+        if task.cancelled():
+            return
+
+        result: ProbeResult = task.result()
+        if result.error is None or isinstance(
+            result.error, (InvalidCredentials, UserDatabaseEmpty)
+        ):
+            self._results[key] = (time.monotonic(), result)
+
+    async def probe(
+        self,
+        host: str,
+        username: str | None = None,
+        password: str | None = None,
+        port: int = DEFAULT_PORT,
+        login: bool = True,
+        **kwargs,
+    ) -> ProbeResult:
+        """Return the cached result of a probe, probing if needed."""
+        key = self._key(host, port, username, password, login)
+
+        cached = self._results.get(key)
+        if cached is not None:
+            if time.monotonic() - cached[0] < self._ttl:
+                return cached[1]
+            del self._results[key]
+
+        task = self._pending.get(key)
+        if task is None:
+            task = asyncio.create_task(
+                probe_gateway(host, username, password, port, login, **kwargs)
+            )
+            self._pending[key] = task
+            task.add_done_callback(lambda task: self._store(key, task))
+
+        # A caller giving up must not cancel the probe shared with the others
+        return await asyncio.shield(task)
+
+    async def probe_all(self, hosts: Iterable[str], **kwargs) -> list[ProbeResult]:
+        """Probe several gateways in parallel, results in the order of hosts."""
+        return list(
+            await asyncio.gather(*(self.probe(host, **kwargs) for host in hosts))
+        )
+
+    def invalidate(self, host: str | None = None) -> None:
+        """Forget the results of a host, or of all hosts."""
+        if host is None:
+            self._results.clear()
+            return
+
+        host = host.lower()
+        for key in [key for key in self._results if key[0] == host]:
+            del self._results[key]
@@ -0,0 +1,198 @@
+"""Capture of the raw LightProtocol traffic."""
+
+import os
+import queue
+import struct
+import threading
+import time
+from collections.abc import Iterator
+from typing import NamedTuple
+
+# Direction of a captured frame
+RECEIVED = 0
+SENT = 1
+
+# Start of each capture file, followed by records:
+#   timestamp (double) | direction (byte) | length (uint32) | utf-8 frame
+CAPTURE_MAGIC = b"DOMLPCAP1\n"
+_RECORD_HEADER = struct.Struct("<dBI")
+
+DEFAULT_MAX_BYTES = 5 * 1024 * 1024
+DEFAULT_BACKUP_COUNT = 3
+# Frames waiting to be written before new ones are dropped
+DEFAULT_QUEUE_SIZE = 10000
+
+_LOGIN_PREFIX = "LOGINPSW@"
+_STOP = object()
+
+
+class CapturedFrame(NamedTuple):
+    timestamp: float
+    direction: int
+    message: str
+
+
+def redact(message: str) -> str:
+    """Remove the login token of a LOGINPSW@<username>:<token> request."""
+    if message.startswith(_LOGIN_PREFIX):
+        username, separator, _ = message[len(_LOGIN_PREFIX) :].partition(":")
+        return f"{_LOGIN_PREFIX}{username}{separator}<redacted>"
+    return message
+
+
+class TrafficRecorder:
+    """Append the raw frames to a rotating capture file.
+
+    Frames are only packed on the event loop, a writer thread does the file
+    I/O in batches. When a file would exceed `max_bytes`, it is renamed to
+    `<path>.1` (and the previous ones shifted up to `<path>.<backup_count>`)
+    and a new file is started. The file is opened by the constructor, so that
+    an unusable path raises there. Frames are dropped (and counted) when the
+    writer does not keep up or has stopped on an error.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        backup_count: int = DEFAULT_BACKUP_COUNT,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+    ) -> None:
+        if max_bytes <= len(CAPTURE_MAGIC):
+            raise ValueError("The capture size limit is too small")
+
+        self._path = path
+        self._max_bytes = max_bytes
+        self._backup_count = backup_count
+        self._queue: queue.Queue = queue.Queue(queue_size)
+        self._dropped = 0
+        self._error: OSError | None = None
+        file = self._open()
+        self._thread = threading.Thread(
+            target=self._writer,
+            args=(file,),
+            name=f"TrafficRecorder[{path}]",
+            daemon=True,
+        )
+        self._thread.start()
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def is_recording(self) -> bool:
+        return self._thread.is_alive()
+
+    @property
+    def dropped(self) -> int:
+        """Return the number of frames which were not recorded."""
+        return self._dropped
+
+    @property
+    def error(self) -> OSError | None:
+        """Return the error which stopped the writer, if any."""
+        return self._error
+
+    def record(self, direction: int, message: str | bytes) -> None:
+        """Queue a frame to be written."""
+        if not self._thread.is_alive():
+            self._dropped += 1
+            return
+
+        if isinstance(message, str):
+            message = redact(message).encode("utf-8")
+        try:
+            self._queue.put_nowait(
+                _RECORD_HEADER.pack(time.time(), direction, len(message)) + message
+            )
+        except queue.Full:
+            self._dropped += 1
+
+    def close(self) -> None:
+        """Write the pending frames and stop the writer (blocking)."""
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join()
+
+    def _open(self):
+        file = open(self._path, "ab")
+        if file.tell() == 0:
+            file.write(CAPTURE_MAGIC)
+        return file
+
+    def _rotate(self, file):
+        file.close()
+        if self._backup_count > 0:
+            for index in range(self._backup_count - 1, 0, -1):
+                source = f"{self._path}.{index}"
+                if os.path.exists(source):
+                    os.replace(source, f"{self._path}.{index + 1}")
+            os.replace(self._path, f"{self._path}.1")
+        else:
+            os.remove(self._path)
+        return self._open()
+
+    def _writer(self, file) -> None:
+        header_size = len(CAPTURE_MAGIC)
+        size = file.tell()
+        try:
+            while True:
+                records = [self._queue.get()]
+                # Batch all the frames queued meanwhile
+                while True:
+                    try:
+                        records.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+
+                stop = _STOP in records
+                for record in records:
+                    if record is _STOP:
+                        continue
+                    # A frame larger than the limit still gets its own file
+                    if size > header_size and size + len(record) > self._max_bytes:
+                        file = self._rotate(file)
+                        size = file.tell()
+                    file.write(record)
+                    size += len(record)
+                file.flush()
+
+                if stop:
+                    return
+        except OSError as ex:
+            # Disk full, capture removed, ... the frames are now dropped
+            self._error = ex
+        finally:
+            file.close()
+
+
+def read_capture(path: str) -> Iterator[CapturedFrame]:
+    """Iterate the frames of a capture file."""
+    with open(path, "rb") as file:
+        if file.read(len(CAPTURE_MAGIC)) != CAPTURE_MAGIC:
+            raise ValueError(f"{path} is not a traffic capture")
+
+        while header := file.read(_RECORD_HEADER.size):
+            if len(header) < _RECORD_HEADER.size:
+                # Truncated by a crash while writing
+                return
+            timestamp, direction, length = _RECORD_HEADER.unpack(header)
+            data = file.read(length)
+            if len(data) < length:
+                return
+            yield CapturedFrame(
+                timestamp, direction, data.decode("utf-8", errors="replace")
+            )
+
+
+def read_captures(path: str) -> Iterator[CapturedFrame]:
+    """Iterate the frames of a capture and its rotated files, oldest first."""
+    index = 1
+    while os.path.exists(f"{path}.{index}"):
+        index += 1
+
+    for backup in range(index - 1, 0, -1):
+        yield from read_capture(f"{path}.{backup}")
+    if os.path.exists(path):
+        yield from read_capture(path)
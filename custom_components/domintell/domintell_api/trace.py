@@ -0,0 +1,96 @@
+"""Debug tracing of the status and command pipeline."""
+
+import logging
+import time
+
+# Minimum delay (s) between two logged parse errors of a module type
+PARSE_ERROR_REPORT_INTERVAL = 60.0
+
+
+class Tracer:
+    """Debug traces about IOs, formatted only when emitted.
+
+    Without filter, the traces follow the debug level of the logger (every
+    IO). With a filter, only the traces of the matching IOs are emitted, even
+    if debug is not enabled on the parent loggers. A filter is either an io id
+    ("MR2000001-1-1"), or a module ("MR2000001") or a module type ("MR2")
+    matching the start of the io ids.
+    """
+
+    __slots__ = ("_logger", "_ios", "_prefixes")
+
+    def __init__(self, logger: logging.Logger) -> None:
+        self._logger = logger
+        self._ios: frozenset[str] = frozenset()
+        self._prefixes: tuple[str, ...] = ()
+
+    @property
+    def logger(self) -> logging.Logger:
+        return self._logger
+
+    @property
+    def is_filtered(self) -> bool:
+        return bool(self._ios or self._prefixes)
+
+    @property
+    def filters(self) -> dict[str, list[str]]:
+        return {"ios": sorted(self._ios), "modules": list(self._prefixes)}
+
+    def set_filter(self, ios=(), modules=()) -> None:
+        """Only trace the given IOs and modules, nothing given = every IO."""
+        self._ios = frozenset(ios)
+        self._prefixes = tuple(modules)
+        self._logger.setLevel(logging.DEBUG if self.is_filtered else logging.NOTSET)
+
+    def is_traced(self, io_id: str) -> bool:
+        if self._ios or self._prefixes:
+            return io_id in self._ios or io_id.startswith(self._prefixes)
+        return self._logger.isEnabledFor(logging.DEBUG)
+
+    def trace(self, io_id: str, msg: str, *args) -> None:
+        """Log a debug message about an IO."""
+        if self.is_traced(io_id):
+            self._logger.debug(msg, *args)
+
+
+class ParseErrorReporter:
+    """Log the status parse errors at most once per interval and module type.
+
+    The errors occurring in between are counted and reported with the next
+    logged one.
+    """
+
+    __slots__ = ("_logger", "_interval", "_pending")
+
+    def __init__(
+        self, logger: logging.Logger, interval: float = PARSE_ERROR_REPORT_INTERVAL
+    ) -> None:
+        self._logger = logger
+        self._interval = interval
+        # module type -> [number of errors not logged, time of the next log]
+        self._pending: dict[str, list] = {}
+
+    def report(self, module_type: str, line: str, error: Exception) -> None:
+        now = time.monotonic()
+        entry = self._pending.get(module_type)
+        if entry is None:
+            entry = self._pending[module_type] = [0, now]
+
+        if now < entry[1]:
+            entry[0] += 1
+            return
+
+        if entry[0]:
+            self._logger.error(
+                "Error parsing status message: '%s' - %s"
+                " (%d other %s errors since the last report)",
+                line,
+                error,
+                entry[0],
+                module_type,
+            )
+        else:
+            self._logger.error("Error parsing status message: '%s' - %s", line, error)
+
+        entry[0] = 0
+        entry[1] = now + self._interval
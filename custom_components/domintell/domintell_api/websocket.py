@@ -3,30 +3,50 @@ import ssl
 import re
 import enum
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
+from functools import cache
 import hashlib
 import logging
+import time
 
 import websockets
 
-from .const import SUPPORTED_MODULE_TYPE_LIST
+from .const import MODULE_TYPES
 from .errors import (
     MaxConnectedClient,
     InvalidCredentials,
     SessionNotOpened,
     UserDatabaseEmpty,
 )
+from .metrics import Metrics
+from .trace import Tracer, ParseErrorReporter
+from .recorder import (
+    RECEIVED,
+    SENT,
+    DEFAULT_MAX_BYTES,
+    DEFAULT_BACKUP_COUNT,
+    CapturedFrame,
+    TrafficRecorder,
+)
 from .lightprotocol import (
     LpStatus,
+    LpEndpointTable,
     LpCommand,
     is_hour_message,
     convert_legacy_to_new_gen,
 )
 
 
-# Create SSL context without certificate verification
-ssl_context = ssl.SSLContext()
-ssl_context.verify_mode = ssl.CERT_NONE
+@cache
+def get_ssl_context() -> ssl.SSLContext:
+    """Return the SSL context of the gateway connections, created on first use.
+
+    The certificate of the gateway is not verified.
+    """
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+    context.check_hostname = False
+    context.verify_mode = ssl.CERT_NONE
+    return context
 
 
 class ConnectionState(enum.Enum):
@@ -51,6 +71,18 @@ def clean_appinfo(message: str):
     return None
 
 
+def hash_password(password: str, salt: str, nonce: str) -> str:
+    """Compute the LOGINPSW token from the password, its salt and the nonce."""
+    if salt == "":
+        return ""
+
+    # Hash the salted password, then the result with the nonce
+    hashed_salted_password = hashlib.sha512((password + salt).encode("utf-8"))
+    return hashlib.sha512(
+        (hashed_salted_password.hexdigest() + nonce).encode("utf-8")
+    ).hexdigest()
+
+
 def parse_lp_version(message: str) -> str | None:
     """Extract lightprotocol version from message."""
     # ie: "INFO:LPVER=43.7.1:INFO"
@@ -77,7 +109,7 @@ def parse_discover(message: str) -> dict | None:
                 module_ip: str = parts[1] if parts[1] != "0" else parts[2]
                 serial_number: str = parts[4].upper()  # id: "54000001"
                 model: str = parts[0].rsplit(" ", 1)[1]  # "DGQG04"
-                module_number: int = int(serial_number[3:])  # 1
+                module_number: int = int(serial_number[2:], 16)  # 1
                 name: str = model + "-" + str(module_number)  # "DGQG04-1"
                 return {
                     "id": serial_number,
@@ -93,6 +125,10 @@ def parse_discover(message: str) -> dict | None:
     return None
 
 
+# End of the io part of legacy status lines, for modules reporting one io per line
+_LEGACY_STATUS_KEY_END = {"AMP": 11, "DMX": 12, "DAL": 13}
+
+
 class DomintellClient:
     def __init__(
         self,
@@ -100,10 +136,13 @@ class DomintellClient:
         port: int,
         username: str | None = None,
         password: str | None = None,
+        use_ssl: bool = True,
     ) -> None:
         self._logger = logging.getLogger(f"{__package__}[{host}]")
         self._host: str = host
         self._port: int = port
+        # Gateways use TLS, a local hub may not
+        self._use_ssl: bool = use_ssl
         self._username: str = username or ""
         self._password: str = password or ""
         self._nonce: str | None = None
@@ -117,11 +156,22 @@ class DomintellClient:
         self._on_message: Callable[[str], None] = None
         self._on_status: Callable[[list[LpStatus]], None] = None
         self._on_appinfo: Callable[[str], None] = None
+        self._raw_listeners: list[Callable[[str], None]] = []
         self._keep_alive_task = None
         self._listen_task = None
         self._lp_version: str | None = None
         self._server_info: dict | None = None
         self._exit_on_error: bool = False
+        self._endpoints: LpEndpointTable | None = None
+        # Last status line received, per module then per io (see _is_status_unchanged)
+        self._status_cache: dict[str, dict[str, str]] = {}
+        self._unchanged_status_count: int = 0
+        self._metrics = Metrics()
+        self._tracer = Tracer(self._logger.getChild("trace"))
+        self._parse_errors = ParseErrorReporter(self._logger)
+        self._recorder: TrafficRecorder | None = None
+        # Time (monotonic) at which the frame being processed was received
+        self._frame_time: float = 0.0
 
     @property
     def host(self) -> str:
@@ -137,6 +187,85 @@ class DomintellClient:
     def is_connected(self) -> bool:
         return self._is_connected and self._is_session_opened
 
+    @property
+    def unchanged_status_count(self) -> int:
+        """Return the number of status lines dropped because they were unchanged."""
+        return self._unchanged_status_count
+
+    @property
+    def metrics(self) -> Metrics:
+        """Return the runtime metrics of the client."""
+        return self._metrics
+
+    @property
+    def tracer(self) -> Tracer:
+        """Return the debug tracer of the IOs."""
+        return self._tracer
+
+    @property
+    def recorder(self) -> TrafficRecorder | None:
+        """Return the raw traffic recorder, if recording."""
+        return self._recorder
+
+    def start_recording(
+        self,
+        path: str,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        backup_count: int = DEFAULT_BACKUP_COUNT,
+    ) -> None:
+        """Record the raw frames exchanged with the gateway (see recorder)."""
+        if self._recorder is not None:
+            return
+        self._recorder = TrafficRecorder(path, max_bytes, backup_count)
+        self._logger.info(f"Recording the traffic in {path}")
+
+    async def stop_recording(self) -> None:
+        """Stop recording once the pending frames are written."""
+        if self._recorder is None:
+            return
+        recorder = self._recorder
+        self._recorder = None
+        await asyncio.get_running_loop().run_in_executor(None, recorder.close)
+        if recorder.error is not None:
+            self._logger.error(f"Recording stopped on error: {recorder.error}")
+        if recorder.dropped:
+            self._logger.warning(f"{recorder.dropped} frames were not recorded")
+
+    async def replay(self, frames: Iterable[CapturedFrame]) -> None:
+        """Process captured frames as if received from the gateway.
+
+        Sent frames are skipped.
+        """
+        for frame in frames:
+            if frame.direction == RECEIVED:
+                await self._process_message(frame.message)
+
+    async def _recv(self):
+        message = await self._websocket.recv()
+        if self._recorder is not None and message is not None:
+            self._recorder.record(RECEIVED, message)
+        return message
+
+    async def _send(self, message: str) -> None:
+        if self._recorder is not None:
+            self._recorder.record(SENT, message)
+        await self._websocket.send(message)
+
+    @property
+    def frame_time(self) -> float:
+        """Return the time (monotonic) at which the current frame was received."""
+        return self._frame_time
+
+    @property
+    def endpoints(self) -> LpEndpointTable | None:
+        """Return the table of known endpoints used to parse statuses."""
+        return self._endpoints
+
+    @endpoints.setter
+    def endpoints(self, endpoints: LpEndpointTable | None) -> None:
+        """Set the table of known endpoints (from APPINFO)."""
+        self._endpoints = endpoints
+
     @property
     def is_session_opened(self) -> bool:
         return self._is_session_opened
@@ -156,7 +285,7 @@ class DomintellClient:
 
         try:
             self._websocket = await websockets.connect(
-                f"wss://{host}:{port}", ssl=ssl_context
+                f"wss://{host}:{port}", ssl=get_ssl_context()
             )
 
             response = await self._websocket.recv()
@@ -180,6 +309,7 @@ class DomintellClient:
     async def connect(self, exit_on_error: bool = False) -> None:
         """Start websocket connection."""
         self._exit_on_error = exit_on_error
+        self._status_cache.clear()
         self._is_connected = False
         self._is_reconnected = False
         self._is_session_opened = False
@@ -193,15 +323,21 @@ class DomintellClient:
                 self._logger.info("Retry Connection...")
 
             self._emit(ConnectionState.CONNECTING)
-            self._websocket = await websockets.connect(
-                f"wss://{self._host}:{self._port}", ssl=ssl_context
-            )
+            if self._use_ssl:
+                self._websocket = await websockets.connect(
+                    f"wss://{self._host}:{self._port}", ssl=get_ssl_context()
+                )
+            else:
+                self._websocket = await websockets.connect(
+                    f"ws://{self._host}:{self._port}"
+                )
 
             if self._connect_attempts == 1:
                 self._is_reconnected = False
                 self._emit(ConnectionState.CONNECTED)
             else:
                 self._is_reconnected = True
+                self._metrics.reconnects += 1
                 self._emit(ConnectionState.RECONNECTED)
 
             self._is_connected = True
@@ -209,7 +345,7 @@ class DomintellClient:
             self._logger.info(f"Connected to {self.host}")
             self._logger.debug("Login...")
 
-            response = await self._websocket.recv()
+            response = await self._recv()
 
             if "ERROR:Max connected clients reached:ERROR" in response:
                 await self.disconnect()
@@ -224,9 +360,9 @@ class DomintellClient:
 
                 # Request salt for specified user
                 self._logger.debug("Request salt...")
-                await self._websocket.send("REQUESTSALT@" + self._username)
+                await self._send("REQUESTSALT@" + self._username)
 
-                response = await self._websocket.recv()
+                response = await self._recv()
                 # response : "INFO:REQUESTSALT:USERNAME=toto:NONCE=9301906811536867321:SALT=1007182019:INFO"
                 if "INFO:REQUESTSALT:USERNAME=" in response:
                     # Extract NONCE
@@ -237,27 +373,17 @@ class DomintellClient:
                     pattern_salt = r"SALT=(.*?):"
                     self._salt = re.findall(pattern_salt, response)[0]
 
-                    if self._salt != "":
-                        self._logger.debug("Compute token...")
-                        salted_password = (self._password + self._salt).encode("utf-8")
-
-                        # Hash the salted password
-                        sha512 = hashlib.sha512()
-                        sha512.update(salted_password)
-                        hashed_salted_password = sha512.hexdigest()
-                        tmp = (hashed_salted_password + self._nonce).encode("utf-8")
-                        sha512 = hashlib.sha512()
-                        sha512.update(tmp)
-                        hashed_final = sha512.hexdigest()
-                    else:
-                        hashed_final = ""
+                    self._logger.debug("Compute token...")
+                    hashed_final = hash_password(
+                        self._password, self._salt, self._nonce
+                    )
 
                 # Logging
-                await self._websocket.send(
+                await self._send(
                     "LOGINPSW@" + self._username + ":" + hashed_final
                 )
 
-                response = await self._websocket.recv()
+                response = await self._recv()
 
             # expected response: "INFO:Session opened:INFO"
             if "INFO:Session opened:INFO" in response:
@@ -383,6 +509,20 @@ class DomintellClient:
     def on_message(self, callback: Callable[[str], None]) -> None:
         self._on_message = callback
 
+    def add_raw_listener(self, callback: Callable[[str], None]) -> Callable:
+        """Add a callback receiving every frame from the gateway, unprocessed.
+
+        Returns:
+            function to remove the listener.
+        """
+        self._raw_listeners.append(callback)
+
+        def remove():
+            if callback in self._raw_listeners:
+                self._raw_listeners.remove(callback)
+
+        return remove
+
     def on_status(self, callback: Callable[[LpStatus], None]) -> None:
         self._on_status = callback
 
@@ -395,24 +535,25 @@ class DomintellClient:
 
     async def send_command(self, cmd: LpCommand) -> None:
         if self.is_session_opened:
-            self._logger.debug("Send command: {cmd}")
+            self._tracer.trace(cmd.id, "Send command: %s", cmd)
             try:
                 await self.send_message(cmd.get_message() + "\r\n")
+                self._metrics.commands_sent += 1
             except Exception as ex:
                 self._logger.error(f"Error sending command: {ex}")
 
     async def send_message(self, message: str) -> None:
         if self.is_session_opened:
-            self._logger.debug(f"Send message: {message}")
+            self._logger.debug("Send message: %s", message)
             try:
-                await self._websocket.send(message)
+                await self._send(message)
             except Exception as ex:
                 self._logger.error(f"Error sending message: {ex}")
 
     async def request_appinfo(self) -> None:
         if self.is_session_opened:
             try:
-                await self._websocket.send("APPINFO\r\n")
+                await self._send("APPINFO\r\n")
             except Exception as ex:
                 self._logger.error(f"Error sending APPINFO message: {ex}")
 
@@ -420,7 +561,7 @@ class DomintellClient:
         """Disponible from Lightprotocol version 43.7.0"""
         if self.is_session_opened:
             try:
-                await self._websocket.send("GETLPVER\r\n")
+                await self._send("GETLPVER\r\n")
             except Exception as ex:
                 self._logger.error(f"Error sending GETLPVER message: {ex}")
 
@@ -428,14 +569,22 @@ class DomintellClient:
         """Disponible from Lightprotocol version 43.7.0"""
         if self.is_session_opened:
             try:
-                await self._websocket.send("DISCOVER\r\n")
+                await self._send("DISCOVER\r\n")
             except Exception as ex:
                 self._logger.error(f"Error sending DISCOVER message: {ex}")
 
-    async def request_all_status(self) -> None:
+    async def request_all_status(self, use_cache: bool = False) -> None:
+        """Request the status of all IOs.
+
+        Unless use_cache is set, the last status cache is cleared so that
+        every status of the refresh is processed.
+        """
+        if not use_cache:
+            self._status_cache.clear()
+
         if self.is_session_opened:
             try:
-                await self._websocket.send("PING\r\n")
+                await self._send("PING\r\n")
             except Exception as ex:
                 self._logger.error(f"Error sending PING message: {ex}")
 
@@ -447,72 +596,158 @@ class DomintellClient:
         self._server_info = parse_discover(message)
         print("Client info:", self._server_info)
 
-    async def _listen_for_messages(self) -> None:
-        while True:
-            try:
-                message = await self._websocket.recv()
-                if message is None:
-                    continue
-
-                conditions = [
-                    "INFO:" not in message,
-                    "APPINFO" not in message,
-                    "PONG" not in message,
-                    not message.startswith("INFO:"),
-                    "disconnected" not in message,
-                    "connected" not in message,
-                    "{" not in message,  # voice info
-                ]
-
-                if all(conditions) and self._on_message:
-                    self._on_message(message)
-
-                if all(conditions) and not is_hour_message(message) and self._on_status:
-                    # The message may contain multiple lines
-                    lines = message.splitlines()
-                    lp_status_list = []
-
-                    for line in lines[:]:
-                        try:
-                            if line[:3] in SUPPORTED_MODULE_TYPE_LIST:
-                                new_status = LpStatus(line)
-
-                                # Convert status in new_gen if necessary
-                                if new_status.is_legacy:
-                                    new_gen_status_list = convert_legacy_to_new_gen(
-                                        new_status
-                                    )
-
-                                    if new_gen_status_list is not None:
-                                        lp_status_list.extend(new_gen_status_list)
-
-                                else:
-                                    # Is a newGen status
-                                    lp_status_list.append(new_status)
-
-                        except Exception as ex:
-                            self._logger.error(
-                                f"Error parsing status message: '{line}' - {ex}"
+    @staticmethod
+    def _locate_status(line: str) -> tuple[str, str, str] | None:
+        """Split a status line into (module key, io key, payload).
+
+        The line is only located, not parsed. None for the lines never cached:
+        the IOs reporting events (gesture, ir code, trigger), as a repeated
+        event is a new event, and the malformed lines.
+        """
+        if "/" in line:
+            # NewGen: <Module type>/<serial number>/<IO type>/<IO offset>/<data>[/S]
+            index = line.find("/", line.find("/") + 1)
+            type_index = line.find("/", index + 1)
+            io_index = line.find("/", type_index + 1)
+            if index < 0 or type_index < 0 or io_index < 0:
+                return None
+            io_type = line[index + 1 : type_index]
+            if io_type.isdigit() and int(io_type) in MODULE_TYPES.event_io_types:
+                return None
+            payload = line[io_index:]
+            if payload.endswith("/S"):
+                payload = payload[:-2]
+            return line[:index], line[index:io_index], payload
+
+        # Legacy: <Module type><serial number><io number and/or data type><data>
+        if line[:3] in MODULE_TYPES.legacy_event_module_types:
+            return None
+        index = _LEGACY_STATUS_KEY_END.get(line[:3], 10)
+        return line[:9], line[9:index], line[index:]
+
+    def _is_status_unchanged(self, line: str) -> bool:
+        """Check a status line against the last one received for the same io.
+
+        A newGen status holding several values separated by '#' can cover
+        several ios (ie: all the outputs of a relay module), in that case the
+        other cached lines of the module are forgotten.
+        """
+        location = self._locate_status(line)
+        if location is None:
+            return False
+        module_key, io_key, payload = location
+
+        module_cache = self._status_cache.get(module_key)
+        if module_cache is None:
+            self._status_cache[module_key] = {io_key: payload}
+            return False
+
+        if module_cache.get(io_key) == payload:
+            self._unchanged_status_count += 1
+            return True
+
+        if "#" in payload or any("#" in item for item in module_cache.values()):
+            module_cache.clear()
+        module_cache[io_key] = payload
+        return False
+
+    def forget_status(self, line: str) -> None:
+        """Forget a cached status line, so that the next identical one is processed.
+
+        Used when the status of the line could not be delivered.
+        """
+        location = self._locate_status(line)
+        if location is None:
+            return
+        module_key, io_key, payload = location
+
+        module_cache = self._status_cache.get(module_key)
+        if module_cache is None:
+            return
+        if "#" in payload:
+            module_cache.clear()
+        else:
+            module_cache.pop(io_key, None)
+
+    async def _process_message(self, message: str) -> None:
+        """Process a frame received from the gateway."""
+        self._frame_time = time.monotonic()
+        self._metrics.frames_received += 1
+
+        conditions = [
+            "INFO:" not in message,
+            "APPINFO" not in message,
+            "PONG" not in message,
+            not message.startswith("INFO:"),
+            "disconnected" not in message,
+            "connected" not in message,
+            "{" not in message,  # voice info
+        ]
+
+        if all(conditions) and self._on_message:
+            self._on_message(message)
+
+        if all(conditions) and not is_hour_message(message) and self._on_status:
+            # The message may contain multiple lines
+            lines = message.splitlines()
+            lp_status_list = []
+
+            for line in lines[:]:
+                try:
+                    if line[:3] in MODULE_TYPES.supported_module_types:
+                        if self._is_status_unchanged(line):
+                            continue
+
+                        new_status = LpStatus(line, self._endpoints)
+                        self._metrics.status_lines_parsed += 1
+                        self._tracer.trace(new_status.id, "Status received: '%s'", line)
+
+                        # Convert status in new_gen if necessary
+                        if new_status.is_legacy:
+                            new_gen_status_list = convert_legacy_to_new_gen(
+                                new_status
                             )
 
-                    if len(lp_status_list) > 0:
-                        self._on_status(lp_status_list)
+                            if new_gen_status_list is not None:
+                                lp_status_list.extend(new_gen_status_list)
 
-                    continue
+                        else:
+                            # Is a newGen status
+                            lp_status_list.append(new_status)
 
-                if message.startswith("INFO:LPVER="):
-                    self._on_lp_version(message)
-                    continue
+                except Exception as ex:
+                    self._metrics.add_parse_error(line[:3])
+                    self._parse_errors.report(line[:3], line, ex)
+
+            if len(lp_status_list) > 0:
+                self._on_status(lp_status_list)
+
+            return
+
+        if message.startswith("INFO:LPVER="):
+            self._on_lp_version(message)
+            return
+
+        if message.startswith("INFO:I AM A"):
+            self._on_discover_message(message)
+            return
 
-                if message.startswith("INFO:I AM A"):
-                    self._on_discover_message(message)
+        if message.startswith("APPINFO") and self._on_appinfo:
+            appinfo = clean_appinfo(message)
+            if appinfo is not None:
+                await self._on_appinfo(appinfo)
+
+    async def _listen_for_messages(self) -> None:
+        while True:
+            try:
+                message = await self._recv()
+                if message is None:
                     continue
 
-                if message.startswith("APPINFO") and self._on_appinfo:
-                    appinfo = clean_appinfo(message)
-                    if appinfo is not None:
-                        await self._on_appinfo(appinfo)
-                        continue
+                for listener in self._raw_listeners:
+                    listener(message)
+
+                await self._process_message(message)
 
             except Exception as ex:
                 self._logger.error(f"Error receiving message: {ex}")
@@ -528,6 +763,7 @@ class DomintellClient:
 
     async def _reconnect(self) -> None:
         """Retry to connect to Domintell bridge."""
+        self._metrics.reconnect_attempts += 1
         reconnect_wait = min(2 * self._connect_attempts, 30)
         # every 10 failed connect attempts log warning
         if self._connect_attempts % 10 == 0:
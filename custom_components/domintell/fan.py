@@ -8,7 +8,6 @@ from typing import Any
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers import entity_registry as er
 from homeassistant.components.fan import (
-    DOMAIN as FAN_DOMAIN,
     FanEntity,
     FanEntityFeature,
 )
@@ -58,21 +57,6 @@ async def async_setup_entry(
         controller.subscribe(async_add_entity, event_filter=EventType.RESOURCE_ADDED)
     )
 
-    # Check for entities that no longer exist and remove them
-    entity_reg = er.async_get(hass)
-    reg_entities = er.async_entries_for_config_entry(entity_reg, config_entry.entry_id)
-
-    for entity in reg_entities:
-        if entity.domain != FAN_DOMAIN:
-            continue
-
-        part = entity.unique_id.split("_")
-        if len(part) >= 3:
-            endpoint_id = part[2]
-
-            if endpoint_id not in controller.keys():
-                entity_reg.async_remove(entity.entity_id)
-
 
 class DomintellFan(FanEntity):
     """Representation of a Domintell Fan."""
@@ -229,7 +213,7 @@ class DomintellFan(FanEntity):
                 if self._status_ref_io is not None
                 else self._resource.speed
             )
-            self.async_write_ha_state()
+            self._bridge.state_writer.async_schedule(self)
 
     async def async_added_to_hass(self) -> None:
         """Call when entity is added."""
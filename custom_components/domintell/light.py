@@ -7,7 +7,6 @@ import math
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers import entity_registry as er
 from homeassistant.components.light import (
-    DOMAIN as LIGHT_DOMAIN,
     ATTR_RGBW_COLOR,
     ATTR_RGB_COLOR,
     ATTR_BRIGHTNESS,
@@ -56,21 +55,6 @@ async def async_setup_entry(
         controller.subscribe(async_add_entity, event_filter=EventType.RESOURCE_ADDED)
     )
 
-    # Check for entities that no longer exist and remove them
-    entity_reg = er.async_get(hass)
-    reg_entities = er.async_entries_for_config_entry(entity_reg, config_entry.entry_id)
-
-    for entity in reg_entities:
-        if entity.domain != LIGHT_DOMAIN:
-            continue
-
-        part = entity.unique_id.split("_")
-        if len(part) >= 3:
-            endpoint_id = part[2]
-
-            if endpoint_id not in controller.keys():
-                entity_reg.async_remove(entity.entity_id)
-
 
 class DomintellLight(LightEntity):
     """Representation of a Domintell Light."""
@@ -257,7 +241,7 @@ class DomintellLight(LightEntity):
                     if self._status_ref_io is not None
                     else self._resource.brightness
                 )
-            self.async_write_ha_state()
+            self._bridge.state_writer.async_schedule(self)
 
     async def async_added_to_hass(self) -> None:
         """Call when entity is added."""
@@ -0,0 +1,81 @@
+"""Removal of the Domintell entities which no longer exist."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from homeassistant.const import Platform
+from homeassistant.core import callback
+from homeassistant.helpers import entity_registry as er
+
+from .domintell_api import DomintellGateway
+
+if TYPE_CHECKING:
+    from .bridge import DomintellBridge
+
+
+@callback
+def async_cleanup_entities(bridge: DomintellBridge) -> None:
+    """Remove the registry entities whose endpoint is no longer known.
+
+    Run once per config entry, when all controllers are initialized and the
+    platforms are set up.
+    """
+    # Platform modules, already loaded by now
+    from .sensor import ELECTRICITY_AGGREGATE_SENSORS, METRIC_SENSORS
+
+    entry = bridge.config_entry
+    api: DomintellGateway = bridge.api
+    sensors = api.sensors
+    variables = set(api.variables.keys())
+
+    # Endpoint ids still provided by the controllers, by platform
+    endpoints: dict[str, set[str]] = {
+        Platform.BINARY_SENSOR: set(sensors.motion.keys()),
+        Platform.BUTTON: set(api.momentary_switches.keys()),
+        Platform.CLIMATE: set(sensors.temperature.keys()),
+        Platform.COVER: set(api.covers.keys()),
+        Platform.FAN: set(api.fans.keys()),
+        Platform.LIGHT: set(api.lights.keys()),
+        Platform.NUMBER: variables,
+        Platform.SCENE: set(api.scenes.keys()),
+        Platform.SENSOR: variables.union(
+            sensors.temperature.keys(),
+            sensors.analog.keys(),
+            sensors.illuminance.keys(),
+            sensors.humidity.keys(),
+            sensors.pressure.keys(),
+            sensors.carbon_dioxide.keys(),
+            sensors.wind.keys(),
+            sensors.power_supply.keys(),
+            sensors.electricity.keys(),
+        ),
+        Platform.SWITCH: variables.union(api.switches.keys()),
+    }
+
+    aggregate_keys = tuple(
+        f"_{description.key}" for description in ELECTRICITY_AGGREGATE_SENSORS
+    )
+    metric_ids = {
+        f"{entry.unique_id}_{bridge.bridge_id}_{description.key}"
+        for description in METRIC_SENSORS
+    }
+
+    entity_reg = er.async_get(bridge.hass)
+    for entity in er.async_entries_for_config_entry(entity_reg, entry.entry_id):
+        known = endpoints.get(entity.domain)
+        if known is None or entity.unique_id in metric_ids:
+            continue
+
+        if (
+            entity.domain == Platform.SENSOR
+            and sensors.electricity.aggregation_window == 0
+            and entity.unique_id.endswith(aggregate_keys)
+        ):
+            # Aggregation has been disabled in options
+            entity_reg.async_remove(entity.entity_id)
+            continue
+
+        part = entity.unique_id.split("_")
+        if len(part) >= 3 and part[2] not in known:
+            entity_reg.async_remove(entity.entity_id)
@@ -9,7 +9,6 @@ from typing import Any
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers import entity_registry as er
 from homeassistant.components.sensor import (
-    DOMAIN as SENSOR_DOMAIN,
     SensorDeviceClass,
     SensorEntity,
     SensorEntityDescription,
@@ -30,6 +29,7 @@ from homeassistant.const import (
     UnitOfElectricCurrent,
     UnitOfPower,
     UnitOfVolume,
+    UnitOfTime,
 )
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.config_entries import ConfigEntry
@@ -71,6 +71,23 @@ def to_percentage(value: float | None) -> float | None:
     return value * 100 if value is not None else None
 
 
+def to_milliseconds(value: float | None) -> float | None:
+    """Convert seconds to milliseconds when value is not None."""
+    return value * 1000 if value is not None else None
+
+
+def aggregate_value(
+    name: str, stat: str, scale: float = 1
+) -> Callable[[Any], StateType]:
+    """Return a function reading an aggregate of an ElectricityAggregator."""
+
+    def value_fn(aggregator) -> StateType:
+        value = getattr(aggregator, stat)(name)
+        return value / scale if value is not None else None
+
+    return value_fn
+
+
 @dataclass(frozen=True, kw_only=True)
 class DomintellSensorEntityDescription(SensorEntityDescription):
     """Class describing Domintell sensor entities."""
@@ -661,6 +678,199 @@ ELECTRICITY_SENSORS: tuple[DomintellSensorEntityDescription, ...] = (
     ),
 )
 
+AGGREGATE_STATS = (("min", "minimum"), ("max", "maximum"), ("mean", "mean"))
+
+# Rolling aggregates of electricity meters, only created when aggregation is enabled
+ELECTRICITY_AGGREGATE_SENSORS: tuple[DomintellSensorEntityDescription, ...] = (
+    *(
+        DomintellSensorEntityDescription(
+            key=f"instant_power_l{phase}_{suffix}",
+            translation_key=f"instant_power_phase_{suffix}",
+            translation_placeholders={"phase": str(phase)},
+            native_unit_of_measurement=UnitOfPower.WATT,
+            device_class=SensorDeviceClass.POWER,
+            state_class=SensorStateClass.MEASUREMENT,
+            suggested_display_precision=0,
+            entity_registry_enabled_default=suffix == "mean",
+            value_fn=aggregate_value(f"instant_power_l{phase}", stat),
+            exists_fn=lambda resource, phase=phase: getattr(
+                resource, "nbr_of_phases", 0
+            )
+            >= phase,
+        )
+        for phase in (1, 2, 3)
+        for suffix, stat in AGGREGATE_STATS
+    ),
+    *(
+        DomintellSensorEntityDescription(
+            key=f"intensity_l{phase}_{suffix}",
+            translation_key=f"intensity_phase_{suffix}",
+            translation_placeholders={"phase": str(phase)},
+            native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
+            device_class=SensorDeviceClass.CURRENT,
+            state_class=SensorStateClass.MEASUREMENT,
+            entity_registry_enabled_default=False,
+            value_fn=aggregate_value(
+                f"intensity_l{phase}", stat, 1000
+            ),  # data source is in mA
+            exists_fn=lambda resource, phase=phase: getattr(
+                resource, "nbr_of_phases", 0
+            )
+            >= phase,
+        )
+        for phase in (1, 2, 3)
+        for suffix, stat in AGGREGATE_STATS
+    ),
+    *(
+        DomintellSensorEntityDescription(
+            key=f"voltage_l{phase}_{suffix}",
+            translation_key=f"voltage_phase_{suffix}",
+            translation_placeholders={"phase": str(phase)},
+            native_unit_of_measurement=UnitOfElectricPotential.VOLT,
+            device_class=SensorDeviceClass.VOLTAGE,
+            state_class=SensorStateClass.MEASUREMENT,
+            suggested_display_precision=0,
+            entity_registry_enabled_default=False,
+            value_fn=aggregate_value(f"voltage_l{phase}", stat),
+            exists_fn=lambda resource, phase=phase: getattr(
+                resource, "nbr_of_phases", 0
+            )
+            >= phase,
+        )
+        for phase in (1, 2, 3)
+        for suffix, stat in AGGREGATE_STATS
+    ),
+    *(
+        DomintellSensorEntityDescription(
+            key=f"total_power_{suffix}",
+            translation_key=f"total_power_{suffix}",
+            native_unit_of_measurement=UnitOfPower.WATT,
+            device_class=SensorDeviceClass.POWER,
+            state_class=SensorStateClass.MEASUREMENT,
+            suggested_display_precision=0,
+            value_fn=aggregate_value("total_power", stat),
+            exists_fn=lambda resource: True,
+        )
+        for suffix, stat in AGGREGATE_STATS
+    ),
+    *(
+        DomintellSensorEntityDescription(
+            key=f"total_energy_l{phase}_delta",
+            translation_key="total_energy_phase_delta",
+            translation_placeholders={"phase": str(phase)},
+            native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+            device_class=SensorDeviceClass.ENERGY,
+            entity_registry_enabled_default=False,
+            value_fn=aggregate_value(
+                f"total_energy_l{phase}", "delta", 1000
+            ),  # data source is in Wh
+            exists_fn=lambda resource, phase=phase: getattr(
+                resource, "nbr_of_phases", 0
+            )
+            >= phase,
+        )
+        for phase in (1, 2, 3)
+    ),
+    *(
+        DomintellSensorEntityDescription(
+            key=f"{name}_delta",
+            translation_key=f"{name}_delta",
+            native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+            device_class=SensorDeviceClass.ENERGY,
+            value_fn=aggregate_value(name, "delta", 1000),  # data source is in Wh
+            exists_fn=lambda resource: True,
+        )
+        for name in ("forward_energy", "reverse_energy", "total_energy")
+    ),
+)
+
+# Runtime metrics of the connection, attached to the bridge device
+METRIC_SENSORS: tuple[DomintellSensorEntityDescription, ...] = (
+    DomintellSensorEntityDescription(
+        key="frames_received",
+        translation_key="frames_received",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_registry_enabled_default=False,
+        value_fn=lambda api: api.metrics.frames_received,
+        exists_fn=lambda api: True,
+    ),
+    DomintellSensorEntityDescription(
+        key="status_lines_parsed",
+        translation_key="status_lines_parsed",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_registry_enabled_default=False,
+        value_fn=lambda api: api.metrics.status_lines_parsed,
+        exists_fn=lambda api: True,
+    ),
+    DomintellSensorEntityDescription(
+        key="parse_errors",
+        translation_key="parse_errors",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_registry_enabled_default=False,
+        value_fn=lambda api: api.metrics.parse_errors_total,
+        exists_fn=lambda api: True,
+    ),
+    DomintellSensorEntityDescription(
+        key="event_queue_depth",
+        translation_key="event_queue_depth",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_registry_enabled_default=False,
+        value_fn=lambda api: api.events.queue_depth,
+        exists_fn=lambda api: True,
+    ),
+    DomintellSensorEntityDescription(
+        key="event_queue_high_water",
+        translation_key="event_queue_high_water",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda api: api.metrics.event_queue_depth.max,
+        exists_fn=lambda api: True,
+    ),
+    DomintellSensorEntityDescription(
+        key="events_dropped",
+        translation_key="events_dropped",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_registry_enabled_default=False,
+        value_fn=lambda api: api.metrics.events_dropped,
+        exists_fn=lambda api: True,
+    ),
+    DomintellSensorEntityDescription(
+        key="dispatch_latency",
+        translation_key="dispatch_latency",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=1,
+        entity_registry_enabled_default=False,
+        value_fn=lambda api: to_milliseconds(api.metrics.dispatch_latency.mean),
+        exists_fn=lambda api: True,
+    ),
+    DomintellSensorEntityDescription(
+        key="commands_sent",
+        translation_key="commands_sent",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_registry_enabled_default=False,
+        value_fn=lambda api: api.metrics.commands_sent,
+        exists_fn=lambda api: True,
+    ),
+    DomintellSensorEntityDescription(
+        key="reconnects",
+        translation_key="reconnects",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_registry_enabled_default=False,
+        value_fn=lambda api: api.metrics.reconnects,
+        exists_fn=lambda api: True,
+    ),
+)
+
 VARIABLE_SENSORS: tuple[DomintellSensorEntityDescription, ...] = (
     DomintellSensorEntityDescription(
         key="night_and_day",
@@ -733,6 +943,15 @@ async def async_setup_entry(
                         if description.exists_fn(resource)
                     ]
 
+                    if controller.get_aggregator(resource.id) is not None:
+                        elec_entities += [
+                            DomintellAggregateSensor(
+                                bridge, controller, resource, description
+                            )
+                            for description in ELECTRICITY_AGGREGATE_SENSORS
+                            if description.exists_fn(resource)
+                        ]
+
                     async_add_entities(elec_entities)
 
                 elif resource.target_type == ResourceTypes.VARIABLE.value:
@@ -771,31 +990,10 @@ async def async_setup_entry(
     register_items(controller.electricity)
     register_items(variables_controller)
 
-    # Check for entities that no longer exist and remove them
-    entity_reg = er.async_get(hass)
-    reg_entities = er.async_entries_for_config_entry(entity_reg, config_entry.entry_id)
-
-    for entity in reg_entities:
-        if entity.domain != SENSOR_DOMAIN:
-            continue
-
-        part = entity.unique_id.split("_")
-        if len(part) >= 3:
-            endpoint_id = part[2]
-
-            if (
-                endpoint_id not in controller.temperature.keys()
-                and endpoint_id not in controller.analog.keys()
-                and endpoint_id not in controller.illuminance.keys()
-                and endpoint_id not in controller.humidity.keys()
-                and endpoint_id not in controller.pressure.keys()
-                and endpoint_id not in controller.carbon_dioxide.keys()
-                and endpoint_id not in controller.wind.keys()
-                and endpoint_id not in controller.power_supply.keys()
-                and endpoint_id not in controller.electricity.keys()
-                and endpoint_id not in variables_controller.keys()
-            ):
-                entity_reg.async_remove(entity.entity_id)
+    # Runtime metrics of the bridge connection
+    async_add_entities(
+        DomintellMetricSensor(bridge, description) for description in METRIC_SENSORS
+    )
 
 
 class DomintellSensor(SensorEntity):
@@ -854,7 +1052,7 @@ class DomintellSensor(SensorEntity):
             return
 
         if event_type == EventType.RESOURCE_UPDATED:
-            self.async_write_ha_state()
+            self._bridge.state_writer.async_schedule(self)
 
     async def async_added_to_hass(self) -> None:
         """Call when entity is added."""
@@ -867,3 +1065,70 @@ class DomintellSensor(SensorEntity):
                 (EventType.RESOURCE_UPDATED, EventType.RESOURCE_DELETED),
             )
         )
+
+
+class DomintellAggregateSensor(DomintellSensor):
+    """Representation of a rolling aggregate of a Domintell electricity meter."""
+
+    def __init__(self, *args, **kwargs):
+        """Initialize Domintell aggregate sensor."""
+        super().__init__(*args, **kwargs)
+        # The window moves even when the meter does not report, it is polled
+        self._attr_should_poll = True
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the aggregate over the rolling window."""
+        aggregator = self._controller.get_aggregator(self._resource.id)
+        if aggregator is None:
+            return None
+        return self.entity_description.value_fn(aggregator)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the optional state attributes."""
+        aggregator = self._controller.get_aggregator(self._resource.id)
+        return {
+            "io_name": self._resource.io_name,
+            "window": self._controller.aggregation_window,
+            "span": aggregator.span() if aggregator is not None else 0,
+        }
+
+
+class DomintellMetricSensor(SensorEntity):
+    """Representation of a runtime metric of a Domintell bridge."""
+
+    entity_description: DomintellSensorEntityDescription
+
+    def __init__(
+        self,
+        bridge: DomintellBridge,
+        description: DomintellSensorEntityDescription,
+    ):
+        """Initialize Domintell metric sensor."""
+        self._bridge = bridge
+        self._api = bridge.api
+
+        # Metrics change on every frame, they are polled
+        self._attr_has_entity_name = True
+        self._attr_should_poll = True
+        self.entity_description = description
+
+        device_id = f"{bridge.config_entry.unique_id}_{bridge.bridge_id}"
+        self._attr_unique_id = f"{device_id}_{description.key}"
+
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, device_id)},
+        )
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the value of the metric."""
+        return self.entity_description.value_fn(self._api)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the optional state attributes."""
+        if self.entity_description.key == "parse_errors":
+            return dict(self._api.metrics.parse_errors)
+        return None
@@ -0,0 +1,98 @@
+"""Services of the Domintell integration."""
+
+from __future__ import annotations
+
+import voluptuous as vol
+
+from homeassistant.const import ATTR_CONFIG_ENTRY_ID
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.helpers import config_validation as cv
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    DOMAIN,
+    ATTR_IO_ID,
+    ATTR_MODULE,
+    SERVICE_EXPORT_HISTORY,
+    SERVICE_CLEAR_HISTORY,
+    SERVICE_SET_TRACE_FILTER,
+)
+
+SERVICE_HISTORY_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_IO_ID): vol.All(cv.ensure_list, [cv.string]),
+    }
+)
+
+SERVICE_TRACE_FILTER_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_IO_ID, default=[]): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional(ATTR_MODULE, default=[]): vol.All(cv.ensure_list, [cv.string]),
+    }
+)
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the services of the Domintell integration."""
+
+    def get_bridges(call: ServiceCall) -> dict:
+        bridges = hass.data.get(DOMAIN, {})
+        if (entry_id := call.data.get(ATTR_CONFIG_ENTRY_ID)) is not None:
+            return {entry_id: bridges[entry_id]} if entry_id in bridges else {}
+        return bridges
+
+    async def async_export_history(call: ServiceCall) -> ServiceResponse:
+        """Export the recorded IO states."""
+        result = {}
+        for entry_id, bridge in get_bridges(call).items():
+            history = bridge.api.events.get_history(call.data.get(ATTR_IO_ID))
+            result[entry_id] = {
+                io_id: [
+                    {
+                        "time": dt_util.utc_from_timestamp(timestamp).isoformat(),
+                        "data": data,
+                    }
+                    for timestamp, data in samples
+                ]
+                for io_id, samples in history.items()
+            }
+        return {"history": result}
+
+    async def async_clear_history(call: ServiceCall) -> None:
+        """Clear the recorded IO states."""
+        for bridge in get_bridges(call).values():
+            bridge.api.events.clear_history(call.data.get(ATTR_IO_ID))
+
+    async def async_set_trace_filter(call: ServiceCall) -> None:
+        """Restrict the debug traces to some IOs and modules."""
+        for bridge in get_bridges(call).values():
+            bridge.api.tracer.set_filter(call.data[ATTR_IO_ID], call.data[ATTR_MODULE])
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_EXPORT_HISTORY,
+        async_export_history,
+        schema=SERVICE_HISTORY_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_CLEAR_HISTORY,
+        async_clear_history,
+        schema=SERVICE_HISTORY_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_TRACE_FILTER,
+        async_set_trace_filter,
+        schema=SERVICE_TRACE_FILTER_SCHEMA,
+    )
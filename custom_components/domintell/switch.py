@@ -9,7 +9,6 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.components.switch import (
-    DOMAIN as SWITCH_DOMAIN,
     SwitchDeviceClass,
     SwitchEntity,
 )
@@ -73,24 +72,6 @@ async def async_setup_entry(
     register_items(switches_controller)
     register_items(variables_controller)
 
-    # Check for entities that no longer exist and remove them
-    entity_reg = er.async_get(hass)
-    reg_entities = er.async_entries_for_config_entry(entity_reg, config_entry.entry_id)
-
-    for entity in reg_entities:
-        if entity.domain != SWITCH_DOMAIN:
-            continue
-
-        part = entity.unique_id.split("_")
-        if len(part) >= 3:
-            endpoint_id = part[2]
-
-            if (
-                endpoint_id not in switches_controller.keys()
-                and endpoint_id not in variables_controller.keys()
-            ):
-                entity_reg.async_remove(entity.entity_id)
-
 
 class DomintellSwitch(SwitchEntity):
     """Representation of a Domintell Switch."""
@@ -179,7 +160,7 @@ class DomintellSwitch(SwitchEntity):
             return
 
         if event_type == EventType.RESOURCE_UPDATED:
-            self.async_write_ha_state()
+            self._bridge.state_writer.async_schedule(self)
 
     async def async_added_to_hass(self) -> None:
         """Call when entity is added."""
@@ -0,0 +1,166 @@
+"""Tests of the local hub, against a fake gateway."""
+
+import asyncio
+import sys
+import unittest
+from pathlib import Path
+
+import websockets
+
+sys.path.insert(0, str(Path(__file__).parents[1] / "custom_components" / "domintell"))
+
+from domintell_api.errors import InvalidCredentials  # noqa: E402
+from domintell_api.hub import DomintellHub  # noqa: E402
+from domintell_api.websocket import DomintellClient  # noqa: E402
+
+REPLIES = {
+    "APPINFO": "APPINFO\r\nEND APPINFO",
+    "GETLPVER": "INFO:LPVER=2.0:INFO",
+    "DISCOVER": "INFO:I AM A DGQG04:INFO",
+}
+
+
+class FakeGateway:
+    """Websocket server answering the requests as a gateway would."""
+
+    def __init__(self) -> None:
+        self.connections = []
+        self.received: list[str] = []
+        self.server = None
+
+    async def start(self) -> int:
+        self.server = await websockets.serve(self._serve, "127.0.0.1", 0)
+        return self.server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def _serve(self, connection) -> None:
+        self.connections.append(connection)
+        await connection.send("INFO:Session opened:INFO")
+        async for message in connection:
+            request = message.strip()
+            self.received.append(request)
+            if request in REPLIES:
+                await connection.send(REPLIES[request])
+
+    async def push(self, message: str) -> None:
+        await self.connections[0].send(message)
+
+
+class TestDomintellHub(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.gateway = FakeGateway()
+        port = await self.gateway.start()
+        self.upstream = DomintellClient("127.0.0.1", port, use_ssl=False)
+        await self.upstream.connect(exit_on_error=True)
+        self.hub = DomintellHub(self.upstream, port=0)
+        await self.hub.start()
+        self.clients = []
+        # Requests of the upstream client itself
+        self.gateway.received.clear()
+
+    async def asyncTearDown(self) -> None:
+        for client in self.clients:
+            await client.close()
+        await self.hub.stop()
+        await self.upstream.disconnect()
+        await self.gateway.stop()
+
+    async def connect(self, subscribe: str | None = None):
+        client = await websockets.connect(f"ws://127.0.0.1:{self.hub.port}")
+        self.clients.append(client)
+        self.assertEqual(await self.recv(client), "INFO:Session opened:INFO")
+        # The reply also tells that the session is registered by the hub
+        if subscribe is None:
+            await client.send("HUB:UNSUBSCRIBE")
+        else:
+            await client.send(f"HUB:SUBSCRIBE={subscribe}")
+        self.assertEqual(await self.recv(client), "INFO:HUB:SUBSCRIBED:INFO")
+        return client
+
+    async def recv(self, client) -> str:
+        return await asyncio.wait_for(client.recv(), 2)
+
+    async def assert_nothing(self, client) -> None:
+        with self.assertRaises(TimeoutError):
+            await asyncio.wait_for(client.recv(), 0.2)
+
+    async def test_fan_out(self) -> None:
+        first = await self.connect()
+        second = await self.connect()
+        await self.gateway.push("BIR000001-1O\r\nDIM000002-1D50")
+
+        self.assertEqual(await self.recv(first), "BIR000001-1O\r\nDIM000002-1D50")
+        self.assertEqual(await self.recv(second), "BIR000001-1O\r\nDIM000002-1D50")
+        self.assertEqual(
+            sorted(self.hub.clients),
+            sorted("{}:{}".format(*client.local_address[:2]) for client in self.clients),
+        )
+
+    async def test_subscriptions(self) -> None:
+        everything = await self.connect()
+        relays = await self.connect("BIR")
+        dimmers = await self.connect("DIM,DMX")
+        await self.gateway.push("BIR000001-1O\r\nDIM000002-1D50")
+
+        self.assertEqual(await self.recv(everything), "BIR000001-1O\r\nDIM000002-1D50")
+        self.assertEqual(await self.recv(relays), "BIR000001-1O")
+        self.assertEqual(await self.recv(dimmers), "DIM000002-1D50")
+
+        await self.gateway.push("DIM000002-1D10")
+        self.assertEqual(await self.recv(dimmers), "DIM000002-1D10")
+        await self.assert_nothing(relays)
+
+    async def test_reply_routing(self) -> None:
+        first = await self.connect()
+        second = await self.connect()
+
+        await first.send("APPINFO")
+        self.assertEqual(await self.recv(first), REPLIES["APPINFO"])
+        await second.send("GETLPVER")
+        self.assertEqual(await self.recv(second), REPLIES["GETLPVER"])
+
+        await self.assert_nothing(first)
+        await self.assert_nothing(second)
+        self.assertEqual(self.gateway.received, ["APPINFO", "GETLPVER"])
+
+    async def test_commands(self) -> None:
+        client = await self.connect()
+
+        await client.send("BIR000001-1%I")
+        await client.send("LOGOUT")
+        self.assertEqual(await self.recv(client), "ERROR:Invalid command:ERROR")
+        # Once answered, the gateway received everything sent before
+        await client.send("GETLPVER")
+        self.assertEqual(await self.recv(client), REPLIES["GETLPVER"])
+        self.assertEqual(self.gateway.received, ["BIR000001-1%I", "GETLPVER"])
+
+    async def test_login(self) -> None:
+        await self.hub.stop()
+        self.hub = DomintellHub(
+            self.upstream, port=0, username="user", password="pwd"
+        )
+        await self.hub.start()
+
+        client = DomintellClient(
+            "127.0.0.1", self.hub.port, "user", "pwd", use_ssl=False
+        )
+        await client.connect(exit_on_error=True)
+        await client.disconnect()
+
+        intruder = DomintellClient(
+            "127.0.0.1", self.hub.port, "user", "wrong", use_ssl=False
+        )
+        with self.assertRaises(InvalidCredentials):
+            await intruder.connect(exit_on_error=True)
+
+    async def test_loopback_only(self) -> None:
+        hub = DomintellHub(self.upstream, host="0.0.0.0", port=0)
+        with self.assertRaises(ValueError):
+            await hub.start()
+
+
+if __name__ == "__main__":
+    unittest.main()
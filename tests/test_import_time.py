@@ -0,0 +1,71 @@
+"""Import time budget of domintell_api, measured with python -X importtime."""
+
+import os
+import statistics
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+
+INTEGRATION_DIR = Path(__file__).parents[1] / "custom_components" / "domintell"
+
+# Cumulative import time of domintell_api (about 27 ms when the change was made),
+# with slack for slow CI machines
+IMPORT_BUDGET_MS = 60
+RUNS = 5
+
+# Standard library modules Home Assistant has already imported
+PRELOADED = (
+    "asyncio, copy, dataclasses, email.message, enum, hashlib, importlib.metadata, "
+    "inspect, json, logging, re, secrets, ssl, traceback, typing"
+)
+
+CODE = f"""
+import {PRELOADED}
+import sys
+import domintell_api
+print(",".join(name for name in ("domintell_api.hub",) if name in sys.modules))
+"""
+
+
+def import_domintell_api() -> tuple[float, str]:
+    """Return the cumulative import time (ms) and the lazy modules imported."""
+    env = dict(os.environ)
+    # Measure with compiled bytecode, as Home Assistant runs
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", CODE],
+        capture_output=True,
+        text=True,
+        cwd=INTEGRATION_DIR,
+        env=env,
+        check=True,
+    )
+
+    # import time: self [us] | cumulative | imported package
+    for line in result.stderr.splitlines():
+        fields = line.split("|")
+        if len(fields) == 3 and fields[2].strip() == "domintell_api":
+            return int(fields[1]) / 1000, result.stdout.strip()
+    raise AssertionError(f"domintell_api not found in:\n{result.stderr}")
+
+
+class TestImportTime(unittest.TestCase):
+    def test_import_time(self) -> None:
+        # Writes the bytecode
+        import_domintell_api()
+        timings = [import_domintell_api()[0] for _ in range(RUNS)]
+
+        self.assertLessEqual(
+            statistics.median(timings),
+            IMPORT_BUDGET_MS,
+            f"import domintell_api took {timings} ms",
+        )
+
+    def test_hub_loaded_lazily(self) -> None:
+        _, lazy_modules = import_domintell_api()
+        self.assertEqual(lazy_modules, "")
+
+
+if __name__ == "__main__":
+    unittest.main()